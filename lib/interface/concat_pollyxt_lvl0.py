@@ -19,6 +19,8 @@ import xarray
 from zipfile import ZipFile, ZIP_DEFLATED, is_zipfile
 import argparse
 import platform
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 ### start arg parsing
 
@@ -48,6 +50,18 @@ pollyxt_parser.add_argument('-f', '--force', dest='force', metavar='force_mergin
                        default = False,
                        help='force merging, independent of differences found in attributes')
 
+pollyxt_parser.add_argument('-m', '--in_memory', dest='in_memory', metavar='in_memory',
+                       type=str,
+                       default='false',
+                       help='read the nc-files directly from the zip-files, only the merged nc-file is written to output_path. '
+                            'Every zip-file is decompressed once, and all unzipped nc-files of the day are held in memory '
+                            'from the checks until merging, i.e. RAM of about their total unzipped size is needed. default is false')
+
+pollyxt_parser.add_argument('-j', '--jobs', dest='jobs', metavar='jobs',
+                       type=int,
+                       default=1,
+                       help='number of threads for checking and unzipping the zip-files. default is 1')
+
 ## Execute the parse_args() method
 args = pollyxt_parser.parse_args()
 ### end of arg parsing
@@ -58,12 +72,21 @@ device=args.device
 output_path = args.output_path
 force = args.force
 raw_folder = args.raw_folder
+in_memory = args.in_memory.lower() == "true"
+jobs = args.jobs
 
 if force.lower() == "true":
     force = True
 elif force.lower() == "false":
     force = False
 
+## in_memory mode: maps the nc-files to the zip-files they are read from
+zipped_nc_files = {}
+## in_memory mode: the decompressed nc-files, used by the checks and the merging
+zipped_nc_payloads = {}
+## in_memory mode: corrected measurement_time of the nc-files, applied while merging
+corrected_measurement_time = {}
+
 # Get the operating system name
 os_name = platform.system()
 print(f'Operating System: {os_name}')
@@ -89,13 +112,90 @@ def get_input_path(timestamp,device,raw_folder):
     print(input_path)
     return input_path
 
+def zipped_nc_info(zip_ref, zip_file):
+    ## ZipInfo of the nc-file of a level0 zip-file
+    nc_names = [name for name in zip_ref.namelist() if name.endswith('.nc')]
+    nc_name = Path(zip_file).stem if Path(zip_file).stem in nc_names else nc_names[0]
+    return zip_ref.getinfo(nc_name)
+
+def read_zipped_nc(zip_file):
+    ## read the nc-file of a level0 zip-file into memory
+    with ZipFile(zip_file, 'r') as zip_ref:
+        return zip_ref.read(zipped_nc_info(zip_ref, zip_file))
+
+def zipped_nc_size(zip_file):
+    ## unzipped size of the nc-file of a level0 zip-file in bytes
+    with ZipFile(zip_file, 'r') as zip_ref:
+        return zipped_nc_info(zip_ref, zip_file).file_size
+
+def load_polly_payload(polly_file):
+    ## decompress the nc-file of a level0 zip-file once, the checks and the merging read it from memory
+    if polly_file not in zipped_nc_payloads:
+        zipped_nc_payloads[polly_file] = read_zipped_nc(zipped_nc_files[polly_file])
+    return zipped_nc_payloads[polly_file]
+
+def open_polly_file(polly_file):
+    '''
+        This function opens a level0 nc-file,
+        in in_memory mode directly from its zip-file without extracting it to disk
+    '''
+    if polly_file in zipped_nc_files:
+        return Dataset(str(polly_file), "r", memory=load_polly_payload(polly_file))
+    return Dataset(polly_file, "r")
+
+def remove_polly_file(polly_file):
+    ## nc-files read from memory have not been written to disk
+    if polly_file not in zipped_nc_files:
+        os.remove(polly_file)
+    zipped_nc_payloads.pop(polly_file, None)
+
+def write_polly_file(polly_file, destination_file):
+    ## write a nc-file read from memory to disk, with its corrected timestamps
+    with open(destination_file, 'wb') as destination:
+        destination.write(load_polly_payload(polly_file))
+    if polly_file in corrected_measurement_time:
+        with Dataset(destination_file, "r+") as ds:
+            ds.variables['measurement_time'][:] = corrected_measurement_time[polly_file]
+
+def map_jobs(function, items):
+    ## apply function to all items on jobs threads (zlib and file-io release the GIL), keeping the order of items
+    if jobs > 1 and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            return list(pool.map(function, items))
+    return [function(item) for item in items]
+
+def check_zip_file(zip_file):
+    '''
+        This function checks a level0 zip-file: size of the file and valid zip-file.
+        Returns if the file passes and the messages to print
+    '''
+    ## check for size of zip-files to ensure to exclude bad measurement files with wrong timestamp e.g. 19700101
+    f_size = os.path.getsize(zip_file)
+    messages = [zip_file, f_size]
+    if f_size > 150000:
+        messages.append("filesize passes")
+    else:
+        messages.append("filesize too small, file will be skipped!")
+        return False, messages
+
+    ## check if zipfile is a valid zip-file
+    if not is_zipfile(zip_file):
+        messages.append(f"invalid zip-file: {zip_file}\nskipping file.")
+        return False, messages
+    return True, messages
+
+def unzip_file(zip_file):
+    with ZipFile(zip_file, 'r') as zip_ref:
+        zip_ref.extractall(output_path)
+
 ### start of function concat_pollyxt_files
 def get_pollyxt_files():
     '''
         This function locates multiple pollyxt level0 nc-zip files from one day measurements,
         unzipps the files to output_path
         and returns a list of files to be merged
-        and the title of the new merged nc-file
+        and the title of the new merged nc-file.
+        In in_memory mode the files are not unzipped, but read from the zip-files (see open_polly_file)
     '''
     input_path = get_input_path(timestamp,device,raw_folder) 
     path_exist = Path(input_path)
@@ -127,32 +227,23 @@ def get_pollyxt_files():
 
         polly_files_list = []
         to_unzip_list = []
-        for zip_file in polly_zip_files_list:
-            ## check for size of zip-files to ensure to exclude bad measurement files with wrong timestamp e.g. 19700101
-            f_size = os.path.getsize(zip_file)
-            print(zip_file)
-            if f_size > 150000:
-                print(f_size)
-                print("filesize passes")
-            else:
-                print(f_size)
-                print("filesize too small, file will be skipped!")
+        zip_file_checks = map_jobs(check_zip_file, polly_zip_files_list)
+        for zip_file, (passes, messages) in zip(polly_zip_files_list, zip_file_checks):
+            for message in messages:
+                print(message)
+            if not passes:
                 continue ## go to next file
 
-            ## check if zipfile is a valid zip-file
-            if not is_zipfile(zip_file):
-                print(f"invalid zip-file: {zip_file}\nskipping file.")
-                #polly_zip_files_list.remove(zip_file)
-                continue
-            else:
-                pass
-
             unzipped_nc = Path(zip_file).name
             unzipped_nc = Path(unzipped_nc).stem
             unzipped_nc = Path(output_path,unzipped_nc)
             polly_files_list.append(unzipped_nc)
             path = Path(unzipped_nc)
 
+            if in_memory:
+                zipped_nc_files[unzipped_nc] = zip_file
+                continue
+
             ## check if unzipped files already exists in outputfolder
             if path.is_file() == False:
                 to_unzip_list.append(zip_file)
@@ -168,24 +259,32 @@ def get_pollyxt_files():
                 print("\nCopy zipped files to local drive...")
                 for zip_file in to_unzip_list:
                     print(zip_file)
-                    shutil.copy2(Path(zip_file), Path(output_path) / Path(zip_file).name)
+                map_jobs(lambda zip_file: shutil.copy2(Path(zip_file), Path(output_path) / Path(zip_file).name), to_unzip_list)
                 print("\nUnzipping...")
+                local_zip_files = []
                 for zip_file in Path(output_path).iterdir():
                     if zip_file.is_file() and date_pattern in zip_file.stem and zip_file.suffix == '.zip': 
-                        with ZipFile(zip_file, 'r') as zip_ref:
-                            print("unzipping "+str(zip_file))
-                            zip_ref.extractall(output_path)
-                        print("Removing .zip file...")
-                        os.remove(zip_file)
+                        print("unzipping "+str(zip_file))
+                        local_zip_files.append(zip_file)
+                map_jobs(unzip_file, local_zip_files)
+                print("Removing .zip files...")
+                for zip_file in local_zip_files:
+                    os.remove(zip_file)
 
             else:
                 print("\nUnzipping...")
                 for zip_file in to_unzip_list:
-                    with ZipFile(zip_file, 'r') as zip_ref:
-                        print("unzipping "+zip_file)
-                        zip_ref.extractall(output_path)
+                    print("unzipping "+zip_file)
+                map_jobs(unzip_file, to_unzip_list)
        
 
+        elif in_memory:
+            print("\nReading nc-files from zip-files, nothing is unzipped.")
+            in_memory_size = sum(zipped_nc_size(zipped_nc_files[el]) for el in polly_files_list)
+            print(f"up to {in_memory_size / 1024**2:.0f} MB of nc-files will be held in memory until merging.")
+            ## decompress every zip-file once, on jobs threads
+            map_jobs(load_polly_payload, polly_files_list)
+
         ## sort lists
         polly_files_list.sort()
 
@@ -283,86 +382,112 @@ def get_pollyxt_logbook_files():
     return ()
 
 
-def add_to_list(element, from_list, to_list):
-    if from_list[element] in to_list:
-        pass
-    else:
-        to_list.append(from_list[element])
+## the values of these variables must not change between the nc-files of a day
+vars_of_interest = [
+                    'measurement_height_resolution',
+                    'laser_rep_rate',
+                    'laser_power',
+#                    'laser_flashlamp',
+                    'location_height',
+                    'neutral_density_filter',
+#                    'location_coordinates',
+                    'pm_voltage',
+                    'pinhole',
+                    'polstate',
+                    'telescope',
+                    'deadtime_polynomial',
+                    'discr_level',
+                    'if_center',
+                    'if_fwhm',
+                    'zenithangle'
+                    ]
+
+## summary records of the nc-files, see scan_polly_file
+polly_file_records = {}
+
+def fingerprint_vars(ds, var_ls):
+    '''
+        This function computes a digest of dtype, shape and values (incl. mask) of every variable of var_ls in ds.
+        The digest of a variable missing in ds is None
+    '''
+    digests = {}
+    for var in var_ls:
+        if var not in ds.variables.keys():
+            digests[var] = None
+            continue
+        values = ds.variables[var][:]
+        digest = hashlib.sha1()
+        digest.update(f'{values.dtype}{values.shape}'.encode())
+        if values.dtype == object:
+            ## variable-length strings
+            digest.update(repr(np.ma.getdata(values).tolist()).encode())
+        else:
+            digest.update(np.ascontiguousarray(np.ma.getdata(values)).tobytes())
+        digest.update(np.ascontiguousarray(np.ma.getmaskarray(values)).tobytes())
+        digests[var] = digest.hexdigest()
+    return digests
+
+def scan_polly_file(polly_file):
+    '''
+        This function opens a level0 nc-file once and reads everything the consistency checks need:
+        global attributes, variable attributes, digests of vars_of_interest,
+        measurement_time, the average of the measurement_shots > 0 and laser_rep_rate.
+        Returns the summary record of the file
+    '''
+    ds = open_polly_file(polly_file)
+    record = {}
+    record['global_attrs'] = {nc_attr: ds.getncattr(nc_attr) for nc_attr in ds.ncattrs()}
+    record['var_attrs'] = {var: {var_att: ds.variables[var].getncattr(var_att) for var_att in ds.variables[var].ncattrs()} for var in ds.variables.keys()}
+    record['var_digests'] = fingerprint_vars(ds, vars_of_interest)
+    record['measurement_time'] = ds.variables['measurement_time'][:]
+    record['measurement_shots_average'] = None
+    if 'measurement_shots' in ds.variables.keys():
+        measurement_shots = np.ma.compressed(ds.variables['measurement_shots'][:])
+        measurement_shots_nonzero = measurement_shots[measurement_shots > 0]
+        if len(measurement_shots_nonzero) > 0:
+            record['measurement_shots_average'] = float(np.mean(measurement_shots_nonzero))
+    record['laser_rep_rate'] = float(ds.variables['laser_rep_rate'][0]) if 'laser_rep_rate' in ds.variables.keys() else None
+    ds.close()
+    return record
 
 def checking_vars():
     ## select only those nc-files where the values of some specific variables haven't changed
-    vars_of_interest = [
-                        'measurement_height_resolution',
-                        'laser_rep_rate',
-                        'laser_power',
-#                        'laser_flashlamp',
-                        'location_height',
-                        'neutral_density_filter',
-#                        'location_coordinates',
-                        'pm_voltage',
-                        'pinhole',
-                        'polstate',
-                        'telescope',
-                        'deadtime_polynomial',
-                        'discr_level',
-                        'if_center',
-                        'if_fwhm',
-                        'zenithangle'
-                        ]
-
     polly_files_list = get_pollyxt_files()
-    if len(polly_files_list) == 1:
-        return polly_files_list
 
-    polly_file_ds_ls = []
+    ## every nc-file is opened once, all checks use the summary records
+    print('scanning nc-files ...')
+    ## (not on the jobs threads, the netCDF/HDF5 library is not thread-safe)
     for files in polly_files_list:
-        polly_file_ds = Dataset(files,"r")
-        polly_file_ds_ls.append(polly_file_ds)
+        polly_file_records[files] = scan_polly_file(files)
+
+    if len(polly_files_list) == 1:
+        return polly_files_list
 
-    selected_var_nc_ls=[]
-    diff_var=0
     print('\n')
     print('checking differences in selected variables ...')
-    for ds in range(0,len(polly_file_ds_ls)-1):
-#        print('\n')
-#        print(polly_files_list[ds] + '   vs.   ' + polly_files_list[ds+1])
+    ## all differences between consecutive nc-files, as (index of the nc-file, var)
+    diff_ls = []
+    for ds in range(0,len(polly_files_list)-1):
         for var in vars_of_interest:
-            if var in polly_file_ds_ls[ds].variables.keys(): ## check if var is available within the polly-datastructure (depending on polly-system)
-                var_value_1=str(polly_file_ds_ls[ds].variables[var][:])
-                var_value_2=str(polly_file_ds_ls[ds+1].variables[var][:])
-    #            print(var + ": " + var_value_1)
-    #            print(var + ": " + var_value_2)
-                if var_value_1 == var_value_2 and diff_var==0:
-                    # print('no difference found ...')
-                    add_to_list(ds,polly_files_list,selected_var_nc_ls)
-                elif var_value_1 != var_value_2 and diff_var==0:
-                    print('difference found in var:')
-                    print(var)
-                    #print(var + ": " + var_value_1)
-                    #print(var + ": " + var_value_2)
-                    diff_var=1
-                    add_to_list(ds,polly_files_list,selected_var_nc_ls) if force == True else None
-                elif var_value_1 == var_value_2 and diff_var!=0:
-                    add_to_list(ds,polly_files_list,selected_var_nc_ls) if force == True else None 
-                elif var_value_1 != var_value_2 and diff_var!=0:
-                    diff_var=diff_var+1
-                    print('difference found!')
-                    add_to_list(ds,polly_files_list,selected_var_nc_ls) if force == True else None
-        polly_file_ds_ls[ds].close()
-                
-    if diff_var==0:
-        add_to_list(-1,polly_files_list,selected_var_nc_ls)
+            if polly_file_records[polly_files_list[ds]]['var_digests'][var] != polly_file_records[polly_files_list[ds+1]]['var_digests'][var]:
+                diff_ls.append((ds, var))
+    for ds, var in diff_ls:
+        print(f'difference found in var: {var}')
+        print(f'   {polly_files_list[ds]}   vs.   {polly_files_list[ds+1]}')
+
+    selected_var_nc_ls = []
+    if len(diff_ls) == 0:
+        selected_var_nc_ls = list(polly_files_list)
         print('\nno differences found in selected variables!\n')
-    elif diff_var!=0:
-#        add_to_list(-1,polly_files_list,selected_var_nc_ls) if force == True else None
+    else:
         ## if force==true, merge, but if force==false: the whole day will not be in list anymore
         if force == True:
-            add_to_list(-1,polly_files_list,selected_var_nc_ls)
+            selected_var_nc_ls = list(polly_files_list)
             print('\ndifferences found in selected variables! But will be force-merged.\n')
         else:
             print('\ndifferences found in selected variables! Selected Date will be skipped.\n')
             for el in polly_files_list:
-                os.remove(el)
+                remove_polly_file(el)
             sys.exit()
 
     return selected_var_nc_ls
@@ -374,83 +499,51 @@ def checking_attr():
     if len(selected_var_nc_ls) == 1:
         return selected_var_nc_ls
 
-    polly_file_ds_ls = []
-    for files in selected_var_nc_ls:
-        print(files)
-        polly_file_ds = Dataset(files,"r")
-        polly_file_ds_ls.append(polly_file_ds)
-    
-    selected_att_nc_ls = []
+    record_ls = [polly_file_records[files] for files in selected_var_nc_ls]
+
     diff_att=0
     diff_var_att=0
     print('\n')
     print('checking differences in attributes ...')
-    for ds in range(0,len(polly_file_ds_ls)-1):
-        ## get global attributes as a list of strings
-#        print(selected_var_nc_ls[ds] + '   vs.   ' + selected_var_nc_ls[ds+1])
-#        print('\nglobal attributes:')
-        for nc_attr in polly_file_ds_ls[0].ncattrs():
-            # att_value=repr(input_nc_file.getncattr(nc_attr))
-            att_value_1=polly_file_ds_ls[ds].getncattr(nc_attr)
-            att_value_2=polly_file_ds_ls[ds+1].getncattr(nc_attr)
-#            print(nc_attr)
-#            print("   " + att_value_1)
-#            print("   " + att_value_2)
-            if att_value_1 == att_value_2 and diff_att==0:
-                add_to_list(ds,selected_var_nc_ls,selected_att_nc_ls)
-            elif att_value_1 != att_value_2 and diff_att==0:
-                print('difference found!')
-                print(nc_attr)
-                print("   " + att_value_1)
-                print("   " + att_value_2)
-                diff_att=1
-                add_to_list(ds,selected_var_nc_ls,selected_att_nc_ls) if force == True else None
-            elif att_value_1 == att_value_2 and diff_att!=0:
-                add_to_list(ds,selected_var_nc_ls,selected_att_nc_ls) if force == True else None
-            elif att_value_1 != att_value_2 and diff_att!=0:
+    for ds in range(0,len(record_ls)-1):
+        ## global attributes of the first nc-file
+        for nc_attr in record_ls[0]['global_attrs']:
+            att_value_1=record_ls[ds]['global_attrs'].get(nc_attr)
+            att_value_2=record_ls[ds+1]['global_attrs'].get(nc_attr)
+            if att_value_1 != att_value_2:
                 print('difference found!')
-                add_to_list(ds,selected_var_nc_ls,selected_att_nc_ls) if force == True else None
-        
-#        print("\nvariable attributes:")
-        for var in polly_file_ds_ls[0].variables.keys():
-#            print(var)
-            for var_att in polly_file_ds_ls[0].variables[var].ncattrs():
-                var_att_value_1 = polly_file_ds_ls[ds].variables[var].getncattr(var_att)
-                var_att_value_2 = polly_file_ds_ls[ds+1].variables[var].getncattr(var_att)
-#                print("   " + var_att)
-#                print("      " + var_att_value_1)
-#                print("      " + var_att_value_2)
-                if var_att_value_1 == var_att_value_2 and diff_var_att==0:
-                    pass
-                elif var_att_value_1 != var_att_value_2 and diff_var_att==0:
-                    print('difference found!')
-                    print("   " + var_att)
-                    print("      " + var_att_value_1)
-                    print("      " + var_att_value_2)
-                    diff_var_att=1
-                elif var_att_value_1 == var_att_value_2 and diff_var_att!=0:
-                    pass
-                elif var_att_value_1 != var_att_value_2 and diff_var_att!=0:
+                if diff_att==0:
+                    print(nc_attr)
+                    print("   " + str(att_value_1))
+                    print("   " + str(att_value_2))
+                diff_att=diff_att+1
+
+        ## variable attributes of the first nc-file
+        for var in record_ls[0]['var_attrs']:
+            for var_att in record_ls[0]['var_attrs'][var]:
+                var_att_value_1 = record_ls[ds]['var_attrs'].get(var, {}).get(var_att)
+                var_att_value_2 = record_ls[ds+1]['var_attrs'].get(var, {}).get(var_att)
+                if var_att_value_1 != var_att_value_2:
                     print('difference found!')
+                    if diff_var_att==0:
+                        print("   " + var_att)
+                        print("      " + str(var_att_value_1))
+                        print("      " + str(var_att_value_2))
+                    diff_var_att=diff_var_att+1
 
-    for ds in range(0,len(polly_file_ds_ls)-1):
-        polly_file_ds_ls[ds].close()
-
-                
+    selected_att_nc_ls = []
     if diff_att==0:
-        add_to_list(-1,selected_var_nc_ls,selected_att_nc_ls)
+        selected_att_nc_ls = list(selected_var_nc_ls)
         print('\nno differences found in global attributes!\n')
     elif diff_att!=0:
-#        add_to_list(-1,selected_var_nc_ls,selected_att_nc_ls) if force == True else None
-
         ## if force==true, merge, but if force==false: the whole day will not be in list anymore
         if force == True:
-            add_to_list(-1,selected_var_nc_ls,selected_att_nc_ls)
+            selected_att_nc_ls = list(selected_var_nc_ls)
             print('\ndifferences found in global attributes! But will be force-merged.\n')
         else:
             print('\ndifferences found in global attributes! Selected Date will be skipped.\n')
-            for el in polly_files_list:
-                os.remove(el)
+            for el in selected_var_nc_ls:
+                remove_polly_file(el)
             sys.exit()
 
     if diff_var_att==0:
@@ -473,15 +566,11 @@ def checking_timestamp():
 #    if len(selected_timestamp_nc_ls) == 1:
 #        return selected_timestamp_nc_ls
     selected_cor_timestamp_nc_ls = []
-    polly_file_ds_ls = []
     print('checking for correct timestamps...')
-    for files in selected_timestamp_nc_ls:
-        polly_file_ds = Dataset(files,"r")
-        polly_file_ds_ls.append(polly_file_ds)
-
-    for elementNR,ds in enumerate(polly_file_ds_ls):
+    for elementNR,files in enumerate(selected_timestamp_nc_ls):
     #    print(selected_timestamp_nc_ls[elementNR])
-        timestamp_ds = ds.variables['measurement_time'][:]
+        record = polly_file_records[files]
+        timestamp_ds = record['measurement_time']
         if 19700101 in timestamp_ds.T[0]:
             print(f'The file: {selected_timestamp_nc_ls[elementNR]} contains incorrect timestamps!')
             print('Trying to correct timestamps...')
@@ -492,16 +581,12 @@ def checking_timestamp():
             ## del. nc-file
             #os.remove(selected_timestamp_nc_ls[elementNR]) ### remove unzipped nc-file with incorrect timestamps
             ## calc. the deltaT between measurementdatapoints
-            laser_rep_rate = float(ds.variables['laser_rep_rate'][0])
-            measurement_shots = ds.variables['measurement_shots'][:]
-            measurement_shots_nonzero = [elem for row in measurement_shots for elem in row if elem > 0]
-            exit
-            if len(measurement_shots_nonzero) == 0:
+            laser_rep_rate = record['laser_rep_rate']
+            measurement_shots_average = record['measurement_shots_average']
+            if measurement_shots_average is None:
                 print('length of measurement_shots_nonzero equals 0. file will be removed from merging list.')
-                ds.close()
                 continue
             else:
-                measurement_shots_average = sum(measurement_shots_nonzero) / len(measurement_shots_nonzero)
                 deltaT = measurement_shots_average / laser_rep_rate
                 deltaT = int(round(deltaT,0)) ## unit in seconds
                 ## calc. the correct seconds of day for this dataset
@@ -509,53 +594,33 @@ def checking_timestamp():
                 ## length of measurement_list
                 len_measurement_list = len(timestamp_ds)
                 ## create new measurement_time list
-                seconds_ls = []
-                t = start_seconds
-                for i in range(1, len_measurement_list+1):
-                    seconds_ls.append(t)
-                    t = t + deltaT
+                seconds_ls = start_seconds + deltaT * np.arange(len_measurement_list)
                 ## check if seconds_ls does not contain seonds of day larger than 86400 ## TODO
                 ## if so, remove file from list and del. file ## TODO
-                t_check = any(value > 86400 for value in seconds_ls)
+                t_check = bool(np.any(seconds_ls > 86400))
                 #t_check = False ## do not skip files which are longer than 24h, seconds_ls > 86400
                 if t_check == True:
                     print('seconds of day exceeds 86400. file will be removed from merging list.')
-                    ds.close()
                     continue
                 else:
-                    seconds_iter = iter(seconds_ls)
-                    new_measurement_time_list = [[int(timestamp), next(seconds_iter)] for i in range(1, len_measurement_list+1)]
-        
-                    ## create a new netCDF4 file to write the dataset
-                    new_dataset = Dataset(f'{selected_timestamp_nc_ls[elementNR]}_dummy', mode='w')
-                    print(f'{selected_timestamp_nc_ls[elementNR]}_dummy')
-        
-                    ## copy the entire dataset to the new file
-                    new_dataset.setncatts(ds.__dict__)
-                    for name, dim in ds.dimensions.items():
-                        new_dataset.createDimension(name, len(dim) if not dim.isunlimited() else None)
-                    
-                    for name, var in ds.variables.items():
-                        new_var = new_dataset.createVariable(name, var.dtype, var.dimensions)
-                        if name == 'measurement_time':
-                            new_var[:] = new_measurement_time_list
-                        else:
-                            new_var[:] = var[:]
-                    
-        
-                    ds.close()
-                    new_dataset.close()
-                    os.remove(selected_timestamp_nc_ls[elementNR]) ### remove unzipped nc-file with incorrect timestamps
-                    os.rename(f'{selected_timestamp_nc_ls[elementNR]}_dummy',selected_timestamp_nc_ls[elementNR])
+                    new_measurement_time_list = np.column_stack((np.full(len_measurement_list, int(timestamp)), seconds_ls))
+
+                    if selected_timestamp_nc_ls[elementNR] in zipped_nc_files:
+                        ## nc-file is read from memory, the timestamps are corrected while merging
+                        corrected_measurement_time[selected_timestamp_nc_ls[elementNR]] = new_measurement_time_list
+                        print('timestamps will be corrected while merging.')
+                        selected_cor_timestamp_nc_ls.append(selected_timestamp_nc_ls[elementNR])
+                        continue
+
+                    ## overwrite only measurement_time in the unzipped nc-file
+                    with Dataset(selected_timestamp_nc_ls[elementNR], "r+") as ds:
+                        ds.variables['measurement_time'][:] = new_measurement_time_list
                     print('timestamps corrected.')
                     selected_cor_timestamp_nc_ls.append(selected_timestamp_nc_ls[elementNR])
         else:
             print(f'The file: {selected_timestamp_nc_ls[elementNR]} passes timestamp check.')
             selected_cor_timestamp_nc_ls.append(selected_timestamp_nc_ls[elementNR])
 
-        if ds.isopen():
-            ds.close()
-
 
     print('\nthe following '+str(len(selected_cor_timestamp_nc_ls))+' files can be merged:')
     print(selected_cor_timestamp_nc_ls)
@@ -579,7 +644,10 @@ def concat_files():
 
     if len(sel_polly_files_list) == 1:
         print("\nOnly one file found. Nothing to merge!\n")
-        os.rename(sel_polly_files_list[0],Path(output_path,filestring))
+        if sel_polly_files_list[0] in zipped_nc_files:
+            write_polly_file(sel_polly_files_list[0],Path(output_path,filestring))
+        else:
+            os.rename(sel_polly_files_list[0],Path(output_path,filestring))
         return ()
     else:
 #        sel_polly_files_list = [ str(el) for el in sel_polly_files_list]
@@ -587,7 +655,19 @@ def concat_files():
         compat='override' ## Values of variable "laser_flashlamp" often changes, but those files will be merged anyway. This option picks the value from first dataset.
         coords='minimal'
         
-        ds = xarray.open_mfdataset(sel_polly_files_list,combine = 'nested', data_vars="minimal", concat_dim="time", compat=compat, coords=coords)
+        if in_memory:
+            ## combine the datasets read from memory like open_mfdataset does with the files;
+            ## the decompressed nc-files of all datasets stay in memory until the merged file is written
+            polly_ds_ls = []
+            for polly_file in sel_polly_files_list:
+                polly_ds = xarray.open_dataset(xarray.backends.NetCDF4DataStore(open_polly_file(polly_file)))
+                if polly_file in corrected_measurement_time:
+                    measurement_time = polly_ds['measurement_time']
+                    polly_ds['measurement_time'] = measurement_time.copy(data=np.asarray(corrected_measurement_time[polly_file], dtype=measurement_time.dtype))
+                polly_ds_ls.append(polly_ds)
+            ds = xarray.combine_nested(polly_ds_ls, data_vars="minimal", concat_dim="time", compat=compat, coords=coords, combine_attrs="override")
+        else:
+            ds = xarray.open_mfdataset(sel_polly_files_list,combine = 'nested', data_vars="minimal", concat_dim="time", compat=compat, coords=coords)
         ## save to a single nc-file
         print(f"\nmerged nc-file '{filestring}' will be stored to '{output_path}'")
         print("\nwriting merged file ...")
@@ -612,11 +692,14 @@ def concat_files():
         write_netcdf(ds=ds,out_file=Path(output_path,filestring_dummy))
 
         ds.close()
+        if in_memory:
+            for polly_ds in polly_ds_ls:
+                polly_ds.close()
 
     print("\ndeleting individual .nc files ...")
     for el in sel_polly_files_list:
         print(el)
-        os.remove(el)
+        remove_polly_file(el)
     destination_file = Path(output_path,filestring)
     if os.path.exists(destination_file):
         os.remove(destination_file)  # Remove the existing destination file
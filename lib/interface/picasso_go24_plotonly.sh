@@ -107,48 +107,12 @@ echo $PY_FOLDER
 echo $RETRIEVAL
 
 
-create_date_ls() {
-## create DATE_LS
-    dates=()
-    for (( date=STARTDATE; date <= ENDDATE; )); do
-        dates+=( "$date" )
-        date="$(date --date="$date +1 days" +'%Y%m%d')"
-    done
-    
-    for i in ${dates[@]}; do
-    	YYYY=${i:0:4}
-    	MM=${i:4:2}
-    	DD=${i:6:2}
-    	YYYYMMDD=$YYYY$MM$DD
-    	DATE_LS+=( "$YYYYMMDD" )
-    done
-}
-
 main() {
 
-	create_date_ls
-	
-	for DEVICE in ${DEVICE_LS[@]}; do
-	    echo $DEVICE
-	    for DATE in ${DATE_LS[@]}; do
-	        echo $DATE
-#            exit 1
-            "$PY_FOLDER"python "$PICASSO_DIR"/lib/visualization/pypolly_display_all.py --date $DATE --device $DEVICE --picasso_config $PICASSO_CONFIG_FILE  --retrieval $RETRIEVAL --donefilelist $flagDONEFILELIST
-#            if [[ "$flagWriteIntoTodoList" == "true" ]];then
-#            	check_todo_list_consistency
-#	            write_job_into_todo_list $DEVICE $DATE ## writing job to todo_list
-#            fi
-#		    ## OPTION 1: process every single task???
-#            if [[ "$flagProc" == "true" ]];then
-#		        process_merged ## process actual merged file with picasso - written in todo_list
-#            fi
-#            if [[ "$flagDeleteMergedFiles" == "true" ]];then
-#		        delete_level0_merged_file $DEVICE $DATE ## delete level0 24h-file
-#                delete_laserlogbookfile $DEVICE $DATE ## delete laserlogbook-file
-#		        delete_entry_from_todo_list $DEVICE $DATE ## delete entry from todo_list file
-#            fi
-	    done
-	done
+	## all devices and dates are plotted by one python process
+	echo ${DEVICE_LS[@]}
+	echo $STARTDATE $ENDDATE
+	"$PY_FOLDER"python "$PICASSO_DIR"/lib/visualization/pypolly_display_all.py --start-date $STARTDATE --end-date $ENDDATE --device ${DEVICE_LS[@]} --picasso_config $PICASSO_CONFIG_FILE  --retrieval $RETRIEVAL --donefilelist $flagDONEFILELIST
 }
 
 ## execute main function
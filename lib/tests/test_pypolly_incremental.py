@@ -0,0 +1,84 @@
+import os
+import sys
+import numpy as np
+import PIL.Image
+import pytest
+from netCDF4 import Dataset
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'visualization'))
+import pypolly_readout as readout
+import pypolly_display_3d_plots as display_3d
+import pypolly_scheduler as scheduler
+import pypolly_benchmark as benchmark
+
+date = '20240503'
+
+
+@pytest.fixture(scope='module')
+def level1_file(tmp_path_factory):
+    ## 6 h of profiles with a gap from 03:00 to 04:00 UTC (profiles 0-359 in front of it)
+    folder = tmp_path_factory.mktemp('level1')
+    nc_files = benchmark.make_level1_files(str(folder), date=date, hours=6, gaps='few', height_resolution=30, max_height=15000)
+    return nc_files['att_bsc']
+
+
+def truncate(src, dst, n_time):
+    ## copy of src with the first n_time profiles, a growing nc-file of the near-real-time processing
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    with Dataset(src) as src_ds, Dataset(dst, 'w') as dst_ds:
+        dst_ds.setncatts({ name: src_ds.getncattr(name) for name in src_ds.ncattrs() })
+        for name, dim in src_ds.dimensions.items():
+            dst_ds.createDimension(name, len(dim) if name != 'time' else n_time)
+        for name, var in src_ds.variables.items():
+            fill_value = var.getncattr('_FillValue') if '_FillValue' in var.ncattrs() else None
+            dst_var = dst_ds.createVariable(name, var.datatype, var.dimensions, fill_value=fill_value)
+            dst_var.setncatts({ attr: var.getncattr(attr) for attr in var.ncattrs() if attr != '_FillValue' })
+            dst_var[:] = var[:n_time] if var.dimensions[:1] == ('time',) else var[:]
+
+
+def render(nc_file, saveFolder):
+    config_dict, polly_conf_dict = benchmark.get_configs()
+    config_dict.update(flagIncremental=True, flagPlotLastProfilesOnly=False)
+    task = scheduler.make_task('attbsc', display_3d.pollyDisplayAttnBsc, {'nc_dict': nc_file}, incremental=True,
+                               config_dict=config_dict, polly_conf_dict=polly_conf_dict, saveFolder=saveFolder, wavelength=532, param='FR')
+    os.makedirs(saveFolder, exist_ok=True)
+    donefilelist_dict, ok = scheduler.run_task(task, date, 'benchmark', 'benchmark')
+    ## close the nc-file, like at the end of scheduler.run_task_groups
+    readout.clear_nc_cache()
+    assert ok
+
+
+def assert_same_png(png_file, reference_file):
+    ## the updated columns are colormapped with numpy instead of Agg, a few pixels
+    ## per column may differ by rounding; a stale column differs in most of its rows
+    png = np.asarray(PIL.Image.open(png_file).convert('RGB'))
+    reference = np.asarray(PIL.Image.open(reference_file).convert('RGB'))
+    assert png.shape == reference.shape
+    diff_rows = np.any(png != reference, axis=2).sum(axis=0)
+    assert diff_rows.max() <= 3, f'columns {np.flatnonzero(diff_rows > 3)} differ'
+
+
+@pytest.mark.parametrize('n_first, n_second, updated', [
+    (200, 300, True),   ## new profiles only, the png is updated
+    (360, 480, False),  ## the gap behind the last rendered profile closes, the time grid changes
+    ])
+def test_incremental_png_equals_full_render(level1_file, tmp_path, capsys, n_first, n_second, updated):
+    nc_file = str(tmp_path / 'level1' / os.path.basename(level1_file))
+    folder_incremental = str(tmp_path / 'incremental')
+    folder_full = str(tmp_path / 'full')
+    plotfile = os.path.basename(level1_file).replace('_att_bsc.nc', '_ATT_BETA_532.png')
+
+    truncate(level1_file, nc_file, n_first)
+    render(nc_file, folder_incremental)
+    truncate(level1_file, nc_file, n_second)
+    os.utime(nc_file, ns=(os.stat(nc_file).st_atime_ns, os.stat(nc_file).st_mtime_ns + 10**9))
+    capsys.readouterr()
+    render(nc_file, folder_incremental)
+    out = capsys.readouterr().out
+    assert (f'{plotfile}: updated' in out) == updated
+    assert (f"{plotfile.replace('.png', '_SNR.png')}: updated" in out) == updated
+
+    render(nc_file, folder_full)
+    assert_same_png(os.path.join(folder_incremental, plotfile), os.path.join(folder_full, plotfile))
+    assert_same_png(os.path.join(folder_incremental, plotfile.replace('.png', '_SNR.png')),
+                    os.path.join(folder_full, plotfile.replace('.png', '_SNR.png')))
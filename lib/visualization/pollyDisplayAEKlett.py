@@ -1,6 +1,6 @@
 import os
 import sys
-import scipy.io as spio
+import pypolly_matfile as matfile
 import numpy as np
 from datetime import datetime, timedelta
 import matplotlib
@@ -101,7 +101,7 @@ def pollyDisplayAEKlett(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
+        mat = matfile.loadmat(tmpFile, struct_as_record=True)
         figDPI = mat['figDPI'][0][0]
         flagWatermarkOn = mat['flagWatermarkOn'][0][0]
         if mat['partnerLabel'].size:
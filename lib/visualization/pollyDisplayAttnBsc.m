@@ -46,8 +46,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'ATT_BETA_355', 'quality_mask_355', 'height', 'time', 'LCUsed355', 'flagLC355', 'att_beta_cRange_355', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAttnBsc355FR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'ATT_BETA_355', 'quality_mask_355', 'height', 'time', 'LCUsed355', 'flagLC355', 'att_beta_cRange_355', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAttnBsc355FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAttnBsc355FR.py');
         end
@@ -73,8 +73,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'ATT_BETA_532', 'quality_mask_532', 'height', 'time', 'LCUsed532', 'flagLC532', 'att_beta_cRange_532', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAttnBsc532FR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'ATT_BETA_532', 'quality_mask_532', 'height', 'time', 'LCUsed532', 'flagLC532', 'att_beta_cRange_532', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAttnBsc532FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAttnBsc532FR.py');
         end
@@ -100,8 +100,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'ATT_BETA_1064', 'quality_mask_1064', 'height', 'time', 'LCUsed1064', 'flagLC1064', 'att_beta_cRange_1064', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAttnBsc1064FR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'ATT_BETA_1064', 'quality_mask_1064', 'height', 'time', 'LCUsed1064', 'flagLC1064', 'att_beta_cRange_1064', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAttnBsc1064FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAttnBsc1064FR.py');
         end
@@ -127,8 +127,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'ATT_BETA_355', 'quality_mask_355', 'height', 'time', 'LCUsed355', 'flagLC355', 'att_beta_cRange_355', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAttnBsc355FROC.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'ATT_BETA_355', 'quality_mask_355', 'height', 'time', 'LCUsed355', 'flagLC355', 'att_beta_cRange_355', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAttnBsc355FROC.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAttnBsc355FROC.py');
         end
@@ -154,8 +154,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'ATT_BETA_532', 'quality_mask_532', 'height', 'time', 'LCUsed532', 'flagLC532', 'att_beta_cRange_532', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAttnBsc532FROC.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'ATT_BETA_532', 'quality_mask_532', 'height', 'time', 'LCUsed532', 'flagLC532', 'att_beta_cRange_532', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAttnBsc532FROC.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAttnBsc532FROC.py');
         end
@@ -181,8 +181,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'ATT_BETA_1064', 'quality_mask_1064', 'height', 'time', 'LCUsed1064', 'flagLC1064', 'att_beta_cRange_1064', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAttnBsc1064FROC.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'ATT_BETA_1064', 'quality_mask_1064', 'height', 'time', 'LCUsed1064', 'flagLC1064', 'att_beta_cRange_1064', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAttnBsc1064FROC.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAttnBsc1064FROC.py');
         end
@@ -208,8 +208,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'ATT_BETA_355', 'quality_mask_355', 'height', 'time', 'LCUsed355', 'flagLC355', 'att_beta_cRange_355', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAttnBsc355NR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'ATT_BETA_355', 'quality_mask_355', 'height', 'time', 'LCUsed355', 'flagLC355', 'att_beta_cRange_355', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAttnBsc355NR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAttnBsc355NR.py');
         end
@@ -235,8 +235,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'ATT_BETA_532', 'quality_mask_532', 'height', 'time', 'LCUsed532', 'flagLC532', 'att_beta_cRange_532', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAttnBsc532NR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'ATT_BETA_532', 'quality_mask_532', 'height', 'time', 'LCUsed532', 'flagLC532', 'att_beta_cRange_532', 'yLim_att_beta', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAttnBsc532NR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAttnBsc532NR.py');
         end
@@ -5,7 +5,7 @@ from matplotlib.dates import DateFormatter, \
                              DayLocator, HourLocator, MinuteLocator, date2num
 import os
 import sys
-import scipy.io as spio
+import pypolly_matfile as matfile
 import numpy as np
 from datetime import datetime, timedelta
 import matplotlib
@@ -111,15 +111,13 @@ def pollyDisplayAttnBsc355FR(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
+        mat = matfile.loadmat(tmpFile, struct_as_record=True)
         figDPI = mat['figDPI'][0][0]
         flagWatermarkOn = mat['flagWatermarkOn'][0][0]
         if mat['partnerLabel'].size:
             partnerLabel = mat['partnerLabel'][0]
         else:
             partnerLabel = ''
-        ATT_BETA_355 = mat['ATT_BETA_355'][:]
-        quality_mask_355 = mat['quality_mask_355'][:]
         if mat['height'].size:
             height = mat['height'][0][:]
         else:
@@ -131,6 +129,11 @@ def pollyDisplayAttnBsc355FR(tmpFile, saveFolder):
         LCUsed355 = mat['LCUsed355'][:][0]
         att_beta_cRange_355 = mat['att_beta_cRange_355'][0][:]
         yLim_att_beta = mat['yLim_att_beta'][:][0]
+        # read only the height bins up to the upper limit of the plot
+        rows = matfile.height_rows(height, yLim_att_beta)
+        height = height[rows]
+        ATT_BETA_355 = matfile.read_rows(mat, 'ATT_BETA_355', rows)
+        quality_mask_355 = matfile.read_rows(mat, 'quality_mask_355', rows)
         flagLC355 = mat['flagLC355'][:][0]
         pollyVersion = mat['CampaignConfig']['name'][0][0][0]
         location = mat['CampaignConfig']['location'][0][0][0]
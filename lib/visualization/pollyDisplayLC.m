@@ -56,7 +56,7 @@ try
         %% display LC 355 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC355_klett', 'LC355_raman', 'LC355_aeronet', 'yLim355', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLC355FR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLC355FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLC355FR.py');
         end
@@ -83,7 +83,7 @@ try
         %% display LC 532
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC532_klett', 'LC532_raman', 'LC532_aeronet', 'yLim532', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLC532FR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLC532FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLC532FR.py');
         end
@@ -110,7 +110,7 @@ try
         %% display LC 1064
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC1064_klett', 'LC1064_raman', 'LC1064_aeronet', 'yLim1064', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLC1064FR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLC1064FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLC1064FR.py');
         end
@@ -136,7 +136,7 @@ try
         %% display LC 387
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC387_raman', 'yLim387', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLC387FR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLC387FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLC387FR.py');
         end
@@ -162,7 +162,7 @@ try
         %% display LC 607 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC607_raman', 'yLim607', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLC607FR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLC607FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLC607FR.py');
         end
@@ -188,7 +188,7 @@ try
         %% display LC 355_NR
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC355_klett_NR', 'LC355_raman_NR', 'LC355_aeronet_NR', 'yLim355_NR', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLC355NR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLC355NR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLC355FR.py');
         end
@@ -215,7 +215,7 @@ try
         %% display LC 532_NR
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC532_klett_NR', 'LC532_raman_NR', 'LC532_aeronet_NR', 'yLim532_NR', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLC532NR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLC532NR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLC532FR.py');
         end
@@ -245,7 +245,7 @@ if (sum(flag355_NR) == 1)
     %% display LC 355_NR
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC355_klett_NR', 'LC355_raman_NR', 'LC355_aeronet_NR', 'yLim355_NR', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLC355NR.py'), tmpFile, saveFolder));
+    flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLC355NR.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyDisplayLC355FR.py');
     end
@@ -272,7 +272,7 @@ if (sum(flag532_NR) == 1)
     %% display LC 532_NR
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'time', 'thisTime', 'LC532_klett_NR', 'LC532_raman_NR', 'LC532_aeronet_NR', 'yLim532_NR', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLC532NR.py'), tmpFile, saveFolder));
+    flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLC532NR.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyDisplayLC532FR.py');
     end
@@ -188,7 +188,7 @@ for iGrp  = Grp_length_start:Grp_length
     end
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'startInd', 'endInd', 'rcs355', 'rcs532', 'rcs1064', 'height', 'time', 'molRCS355', 'molRCS532', 'molRCS1064', 'refHInd355', 'refHInd532', 'refHInd1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_FR_RCS', 'xLim_Profi_RCS', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCRCS.py'), tmpFile, saveFolder));
+    flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCRCS.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyDisplayOCRCS.py');
     end
@@ -211,7 +211,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerBsc_355_klett', 'aerBsc_532_klett', 'aerBsc_1064_klett', 'refHInd355', 'refHInd532', 'refHInd1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Bsc', 'xLim_Profi_Bsc', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCBscKlett.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCBscKlett.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayOCBscKlett.py');
         end
@@ -235,7 +235,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerBsc_355_raman', 'aerBsc_532_raman', 'aerBsc_1064_raman', 'refHInd355', 'refHInd532', 'refHInd1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Bsc', 'xLim_Profi_Bsc', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCBscRaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCBscRaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayOCBscRaman.py');
         end
@@ -259,7 +259,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerExt_355_klett', 'aerExt_532_klett', 'aerExt_1064_klett', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'xLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCExtKlett.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCExtKlett.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayOCExtKlett.py');
         end
@@ -283,7 +283,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerExt_355_raman', 'aerExt_532_raman', 'aerExt_1064_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'xLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCExtRaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCExtRaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayOCExtRaman.py');
         end
@@ -306,7 +306,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'LR355_raman', 'LR532_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_LR', 'xLim_Profi_LR', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCLRRaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCLRRaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayOCLRRaman.py');
         end
@@ -329,7 +329,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'AE_Bsc_355_532_klett', 'AE_Bsc_532_1064_klett', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCAEKlett.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCAEKlett.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayOCAEKlett.py');
         end
@@ -353,7 +353,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'AE_Bsc_355_532_raman', 'AE_Bsc_532_1064_raman', 'AE_Ext_355_532_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCAERaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCAERaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayOCAERaman.py');
         end
@@ -392,7 +392,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'vdr355_klett', 'vdr532_klett', 'pdr355_klett', 'pdr532_klett', 'polCaliEta355', 'polCaliEta532', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_DR', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCDRKlett.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCDRKlett.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayOCDRKlett.py');
         end
@@ -431,7 +431,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'vdr355_raman', 'vdr532_raman', 'pdr355_raman', 'pdr532_raman', 'polCaliEta355', 'polCaliEta532', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_DR', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOCDRRaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOCDRRaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayOCDRRaman.py');
         end
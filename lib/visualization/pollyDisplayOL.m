@@ -106,7 +106,7 @@ end
 
 tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
 save(tmpFile, 'figDPI', 'overlap355', 'overlap532','overlap355Raman', 'overlap532Raman', 'overlap355Defaults', 'overlap532Defaults', 'sig355FR', 'sig355NR', 'sig532FR', 'sig532NR', 'sig355Gl', 'sig532Gl', 'sigRatio355', 'sigRatio532', 'normRange355', 'normRange532', 'height', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayOL.py'), tmpFile, saveFolder));
+flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayOL.py'), tmpFile, saveFolder);
 if flag ~= 0
     warning('Error in executing %s', 'pollyDisplayOL.py');
 end
@@ -6,7 +6,7 @@ from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
 from matplotlib.ticker import MultipleLocator, FormatStrFormatter
 import os
 import sys
-import scipy.io as spio
+import pypolly_matfile as matfile
 import numpy as np
 from datetime import datetime, timedelta
 import re
@@ -122,7 +122,7 @@ def pollyDisplayOL(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
+        mat = matfile.loadmat(tmpFile, struct_as_record=True)
         figDPI = mat['figDPI'][0][0]
         flagWatermarkOn = mat['flagWatermarkOn'][0][0]
         if mat['partnerLabel'].size:
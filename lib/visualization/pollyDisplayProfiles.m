@@ -191,7 +191,7 @@ for iGrp  = Grp_length_start:Grp_length
     end
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'startInd', 'endInd', 'rcs355', 'rcs532', 'rcs1064', 'height', 'time', 'molRCS355', 'molRCS532', 'molRCS1064', 'refHInd355', 'refHInd532', 'refHInd1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_FR_RCS', 'xLim_Profi_RCS', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayRCS.py'), tmpFile, saveFolder));
+    flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayRCS.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyDisplayRCS.py');
     end
@@ -214,7 +214,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerBsc_355_klett', 'aerBsc_532_klett', 'aerBsc_1064_klett', 'refHInd355', 'refHInd532', 'refHInd1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Bsc', 'xLim_Profi_Bsc', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayBscKlett.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayBscKlett.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayBscKlett.py');
         end
@@ -240,7 +240,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerBsc_355_klett', 'aerBsc_532_klett', 'aerBsc_1064_klett', 'aerBsc355_NR_klett', 'aerBsc532_NR_klett', 'refHBaseNR355', 'refHTopNR355', 'refHBaseNR532', 'refHTopNR532', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_NR_RCS', 'xLim_Profi_NR_Bsc', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayBscKlettNR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayBscKlettNR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayBscKlettNR.py');
         end
@@ -264,7 +264,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerBsc_355_raman', 'aerBsc_532_raman', 'aerBsc_1064_raman', 'refHInd355', 'refHInd532', 'refHInd1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Bsc', 'xLim_Profi_Bsc', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayBscRaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayBscRaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayBscRaman.py');
         end
@@ -291,7 +291,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerBsc_355_RR', 'aerBsc_532_RR', 'aerBsc_1064_RR', 'refHInd355', 'refHInd532', 'refHInd1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Bsc', 'xLim_Profi_Bsc', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayBscRR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayBscRR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayBscRR.py');
         end
@@ -317,7 +317,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerBsc_355_raman', 'aerBsc_532_raman', 'aerBsc_1064_raman', 'aerBsc355_NR_raman', 'refHBaseNR355', 'refHTopNR355', 'refHBaseNR532', 'refHTopNR532', 'aerBsc532_NR_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_NR_RCS', 'xLim_Profi_NR_Bsc', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayBscRamanNR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayBscRamanNR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayBscRamanNR.py');
         end
@@ -341,7 +341,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerBsc_355_aeronet', 'aerBsc_532_aeronet', 'aerBsc_1064_aeronet', 'refHInd355', 'refHInd532', 'refHInd1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Bsc', 'xLim_Profi_Bsc', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayBscAERONET.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayBscAERONET.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayBscAERONET.py');
         end
@@ -365,7 +365,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerExt_355_klett', 'aerExt_532_klett', 'aerExt_1064_klett', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'xLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayExtKlett.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayExtKlett.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayExtKlett.py');
         end
@@ -389,7 +389,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerExt_355_raman', 'aerExt_532_raman', 'aerExt_1064_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'xLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayExtRaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayExtRaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayExtRaman.py');
         end
@@ -416,7 +416,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerExt_355_RR', 'aerExt_532_RR', 'aerExt_1064_RR', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'xLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayExtRR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayExtRR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayExtRR.py');
         end
@@ -440,7 +440,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerExt_355_aeronet', 'aerExt_532_aeronet', 'aerExt_1064_aeronet', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'xLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayExtAERONET.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayExtAERONET.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayExtAERONET.py');
         end
@@ -466,7 +466,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerExt_355_klett', 'aerExt_532_klett', 'aerExt_1064_klett', 'aerExt355_NR_klett', 'aerExt532_NR_klett', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_NR_RCS', 'xLim_Profi_NR_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayExtKlettNR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayExtKlettNR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayExtKlettNR.py');
         end
@@ -492,7 +492,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'aerExt_355_raman', 'aerExt_532_raman', 'aerExt_1064_raman', 'aerExt355_NR_raman', 'aerExt532_NR_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_NR_RCS', 'xLim_Profi_NR_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayExtRamanNR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayExtRamanNR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayExtRamanNR.py');
         end
@@ -515,7 +515,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'LR355_raman', 'LR532_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_LR', 'xLim_Profi_LR', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLRRaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLRRaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLRRaman.py');
         end
@@ -542,7 +542,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'LR355_RR', 'LR532_RR', 'LR1064_RR', 'refHInd355', 'refHInd532', 'refHInd1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_LR', 'xLim_Profi_LR', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLRRR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLRRR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLRRR.py');
         end
@@ -567,7 +567,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'LR355_raman', 'LR532_raman', 'LR355_NR_raman', 'LR532_NR_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_NR_RCS', 'xLim_Profi_LR', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayLRRamanNR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayLRRamanNR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayLRRamanNR.py');
         end
@@ -590,7 +590,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'AE_Bsc_355_532_klett', 'AE_Bsc_532_1064_klett', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAEKlett.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAEKlett.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAEKlett.py');
         end
@@ -614,7 +614,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'AE_Bsc_355_532_raman', 'AE_Bsc_532_1064_raman', 'AE_Ext_355_532_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_Ext', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAERaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAERaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAERaman.py');
         end
@@ -637,7 +637,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'AE_Bsc_355_532_NR_raman', 'AE_Ext_355_532_NR_raman', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_NR_RCS', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayAERamanNR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayAERamanNR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayAERamanNR.py');
         end
@@ -685,7 +685,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'vdr355_klett', 'vdr532_klett', 'vdr1064_klett', 'pdr355_klett', 'pdr532_klett', 'pdr1064_klett', 'polCaliEta355', 'polCaliEta532', 'polCaliEta1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_DR', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayDRKlett.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayDRKlett.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayDRKlett.py');
         end
@@ -733,7 +733,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'vdr355_raman', 'vdr532_raman', 'vdr1064_raman', 'pdr355_raman', 'pdr532_raman', 'pdr1064_raman', 'polCaliEta355', 'polCaliEta532', 'polCaliEta1064', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_DR', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayDRRaman.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayDRRaman.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayDRRaman.py');
         end
@@ -758,7 +758,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'wvmr', 'wvconstUsed', 'meteorSource', 'flagWVCalibration', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_WV_RH', 'xLim_Profi_WV_RH', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayWVMR.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayWVMR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayWVMR.py');
         end
@@ -784,7 +784,7 @@ for iGrp  = Grp_length_start:Grp_length
         end
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'rh', 'rh_meteor', 'wvconstUsed', 'meteorSource', 'flagWVCalibration', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_Profi_WV_RH', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayRH.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayRH.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayRH.py');
         end
@@ -804,7 +804,7 @@ for iGrp  = Grp_length_start:Grp_length
     end
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_FR_RCS', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayTemperature.py'), tmpFile, saveFolder));
+    flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayTemperature.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyDisplayTemperature.py');
     end
@@ -823,7 +823,7 @@ for iGrp  = Grp_length_start:Grp_length
     end
     tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
     save(tmpFile, 'figDPI', 'startInd', 'endInd', 'height', 'time', 'meteorSource', 'temperature', 'pressure', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'yLim_FR_RCS', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-    flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayPressure.py'), tmpFile, saveFolder));
+    flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayPressure.py'), tmpFile, saveFolder);
     if flag ~= 0
         warning('Error in executing %s', 'pollyDisplayPressure.py');
     end
@@ -853,7 +853,7 @@ for iGrp  = Grp_length_start:Grp_length
 %        loaded_data=load(tmpFile)
 %        disp(loaded_data.poliphon)
 %        error('Execution halted!');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayPoliphon.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayPoliphon.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayPoliphon.py');
         end
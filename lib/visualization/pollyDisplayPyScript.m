@@ -0,0 +1,96 @@
+function [flag] = pollyDisplayPyScript(pyScript, tmpFile, saveFolder)
+% POLLYDISPLAYPYSCRIPT run a python display script.
+%
+% USAGE:
+%    [flag] = pollyDisplayPyScript(pyScript, tmpFile, saveFolder)
+%
+% INPUTS:
+%    pyScript: char
+%        full path of the python display script.
+%    tmpFile: char
+%        .mat file with the data to display.
+%    saveFolder: char
+%        folder to save the figures.
+%
+% OUTPUTS:
+%    flag: numeric
+%        0 on success.
+%
+% DESCRIPTION:
+%    If PicassoConfig.flagPyDisplayServer is true, the job is handed to the
+%    plotting server (pypolly_display_server.py), which keeps python and
+%    matplotlib loaded for all figures of the processing run. The server is
+%    started in background at the first call. If the server is not reachable
+%    or the job cannot be sent, the script is executed in a new python process,
+%    as before. A job sent to the server is not run again: if the server does
+%    not answer within PicassoConfig.pyDisplayServerTimeout seconds, a warning
+%    is issued and 1 is returned.
+%
+% HISTORY:
+%    - 2026-10-18: first edition
+
+global PicassoConfig
+
+persistent flagServerStarted
+
+python = fullfile(PicassoConfig.pyBinDir, 'python');
+
+if isfield(PicassoConfig, 'flagPyDisplayServer') && PicassoConfig.flagPyDisplayServer
+    port = PicassoConfig.pyDisplayServerPort;
+    timeout = 300;   % seconds
+    if isfield(PicassoConfig, 'pyDisplayServerTimeout')
+        timeout = PicassoConfig.pyDisplayServerTimeout;
+    end
+
+    socket = [];
+    flagJobSent = false;
+    try
+        socket = java.net.Socket('127.0.0.1', port);
+        % readLine throws a SocketTimeoutException, if the server hangs
+        socket.setSoTimeout(round(timeout * 1000));
+        out = java.io.PrintWriter(socket.getOutputStream(), true);
+        in = java.io.BufferedReader(java.io.InputStreamReader(socket.getInputStream()));
+        out.println(sprintf('%s\t%s\t%s', pyScript, tmpFile, saveFolder));
+        % PrintWriter does not throw on write errors
+        if out.checkError()
+            error('PICASSO:PyDisplayServer', 'job could not be sent to the plotting server.');
+        end
+        flagJobSent = true;
+        reply = char(in.readLine());
+        socket.close();
+
+        if isempty(reply)
+            flag = 1;
+        else
+            flag = str2double(strtok(reply));
+        end
+
+        return;
+    catch errStruct
+        if ~ isempty(socket)
+            socket.close();
+        end
+
+        if flagJobSent
+            % the server may still be drawing the figures, do not run the job twice
+            warning('PICASSO:PyDisplayServer', 'no answer of the plotting server for %s: %s', pyScript, errStruct.message);
+            flag = 1;
+            return;
+        end
+
+        if isempty(flagServerStarted)
+            % start the plotting server for the following jobs
+            serverScript = fullfile(fileparts(mfilename('fullpath')), 'pypolly_display_server.py');
+            if ispc
+                system(sprintf('start /B %s %s --port %d', python, serverScript, port));
+            else
+                system(sprintf('nohup %s %s --port %d > /dev/null 2>&1 &', python, serverScript, port));
+            end
+            flagServerStarted = true;
+        end
+    end
+end
+
+flag = system(sprintf('%s %s %s %s', python, pyScript, tmpFile, saveFolder));
+
+end
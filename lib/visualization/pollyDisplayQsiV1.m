@@ -49,7 +49,7 @@ try
         %% display quasi results
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'quasi_bsc_355', 'quality_mask_355', 'quasi_beta_cRange_355', 'yLim_Quasi_Params', 'height', 'time', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayQsiBsc355V1.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayQsiBsc355V1.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayQsiBsc355V1.py');
         end
@@ -75,7 +75,7 @@ try
         %% display quasi results
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'quasi_bsc_532', 'quality_mask_532', 'quasi_beta_cRange_532', 'yLim_Quasi_Params', 'height', 'time', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayQsiBsc532V1.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayQsiBsc532V1.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayQsiBsc532V1.py');
         end
@@ -101,7 +101,7 @@ try
         %% display quasi results
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'quasi_bsc_1064', 'quality_mask_1064', 'quasi_beta_cRange_1064', 'yLim_Quasi_Params', 'height', 'time', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayQsiBsc1064V1.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayQsiBsc1064V1.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayQsiBsc1064V1.py');
         end
@@ -128,7 +128,7 @@ try
         %% display quasi results
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'quasi_pdr_532', 'quality_mask_532', 'yLim_Quasi_Params', 'quasi_Par_DR_cRange_532', 'height', 'time', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayQsiPDR532V1.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayQsiPDR532V1.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayQsiPDR532V1.py');
         end
@@ -156,7 +156,7 @@ try
         %% display quasi results
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
         save(tmpFile, 'figDPI', 'quasi_ang_532_1064', 'quality_mask_532', 'quality_mask_1064', 'yLim_Quasi_Params', 'height', 'time', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayQsiAE_532_1064V1.py'), tmpFile, saveFolder));
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayQsiAE_532_1064V1.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayQsiAE_532_1064V1.py');
         end
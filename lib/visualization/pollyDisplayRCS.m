@@ -54,8 +54,8 @@ try
 
         %% display rcs 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_RCS', 'RCS_FR_355', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS355FRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayRCS355FR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_RCS', 'RCS_FR_355', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS355FRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayRCS355FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayRCS355FR.py');
         end
@@ -86,8 +86,8 @@ try
 
         %% display rcs 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_RCS', 'RCS_FR_532', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS532FRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayRCS532FR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_RCS', 'RCS_FR_532', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS532FRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayRCS532FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayRCS532FR.py');
         end
@@ -118,8 +118,8 @@ try
 
         %% display rcs 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_RCS', 'RCS_FR_1064', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS1064FRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayRCS1064FR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_RCS', 'RCS_FR_1064', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS1064FRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayRCS1064FR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayRCS1064FR.py');
         end
@@ -150,8 +150,8 @@ try
 
         %% display rcs 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_NR_RCS', 'RCS_NR_355', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS355NRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayRCS355NR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_NR_RCS', 'RCS_NR_355', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS355NRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayRCS355NR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayRCS355NR.py');
         end
@@ -182,8 +182,8 @@ try
 
         %% display rcs 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_NR_RCS', 'RCS_NR_532', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS532NRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayRCS532NR.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_NR_RCS', 'RCS_NR_532', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'RCS532NRColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayRCS532NR.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayRCS532NR.py');
         end
@@ -1,6 +1,6 @@
 import os
 import sys
-import scipy.io as spio
+import pypolly_matfile as matfile
 import numpy as np
 from datetime import datetime, timedelta
 import matplotlib
@@ -111,7 +111,7 @@ def pollyDisplayRCS355FR(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
+        mat = matfile.loadmat(tmpFile, struct_as_record=True)
         figDPI = mat['figDPI'][0][0]
         flagWatermarkOn = mat['flagWatermarkOn'][0][0]
         if mat['partnerLabel'].size:
@@ -122,7 +122,6 @@ def pollyDisplayRCS355FR(tmpFile, saveFolder):
         height = mat['height'][0][:]
         depCalMask = mat['depCalMask'][0][:]
         fogMask = mat['fogMask'][0][:]
-        RCS_FR_355 = mat['RCS_FR_355'][:]
         pollyVersion = mat['CampaignConfig']['name'][0][0][0]
         location = mat['CampaignConfig']['location'][0][0][0]
         version = mat['PicassoConfig']['PicassoVersion'][0][0][0]
@@ -130,6 +129,10 @@ def pollyDisplayRCS355FR(tmpFile, saveFolder):
         dataFilename = mat['PollyDataInfo']['pollyDataFile'][0][0][0]
         RCS355FRColorRange = mat['RCS355FRColorRange'][:][0]
         yLim_FR_RCS = mat['yLim_FR_RCS'][:][0]
+        # read only the height bins up to the upper limit of the plot
+        rows = matfile.height_rows(height, yLim_FR_RCS)
+        height = height[rows]
+        RCS_FR_355 = matfile.read_rows(mat, 'RCS_FR_355', rows)
         xtick = mat['xtick'][0][:]
         xticklabel = mat['xtickstr']
         imgFormat = mat['imgFormat'][:][0]
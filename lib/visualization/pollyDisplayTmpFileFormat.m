@@ -0,0 +1,29 @@
+function [matFormat] = pollyDisplayTmpFileFormat()
+% POLLYDISPLAYTMPFILEFORMAT .mat format of the tmpFiles with large matrices for the python display scripts.
+%
+% USAGE:
+%    [matFormat] = pollyDisplayTmpFileFormat()
+%
+% OUTPUTS:
+%    matFormat: char
+%        '-v7.3' if PicassoConfig.flagPyDisplayMatV73 is true, otherwise '-v6'.
+%
+% DESCRIPTION:
+%    v7.3 files are HDF5 files. The python display scripts read them with
+%    pypolly_matfile and load only the height bins up to the upper limit of
+%    the plot, instead of the complete matrices.
+%
+% EXAMPLE:
+%    save(tmpFile, 'ATT_BETA_532', 'height', pollyDisplayTmpFileFormat());
+%
+% HISTORY:
+%    - 2026-10-18: first edition
+
+global PicassoConfig
+
+matFormat = '-v6';
+if isfield(PicassoConfig, 'flagPyDisplayMatV73') && PicassoConfig.flagPyDisplayMatV73
+    matFormat = '-v7.3';
+end
+
+end
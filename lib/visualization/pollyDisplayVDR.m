@@ -51,8 +51,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_DR', 'vdr355', 'polCaliEta355', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'Voldepol355ColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayVDR355.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_DR', 'vdr355', 'polCaliEta355', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'Voldepol355ColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayVDR355.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayVDR355.py');
         end
@@ -80,8 +80,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_DR', 'vdr532', 'polCaliEta532', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'Voldepol532ColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayVDR532.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_DR', 'vdr532', 'polCaliEta532', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'Voldepol532ColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayVDR532.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayVDR532.py');
         end
@@ -109,8 +109,8 @@ try
         end
 
         tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
-        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_DR', 'vdr1064', 'polCaliEta1064', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'Voldepol1064ColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', '-v6');
-        flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyDisplayVDR1064.py'), tmpFile, saveFolder));
+        save(tmpFile, 'figDPI', 'mTime', 'height', 'depCalMask', 'fogMask', 'yLim_FR_DR', 'vdr1064', 'polCaliEta1064', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'xtick', 'xtickstr', 'Voldepol1064ColorRange', 'imgFormat', 'colormap_basic', 'flagWatermarkOn', 'partnerLabel', pollyDisplayTmpFileFormat());
+        flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyDisplayVDR1064.py'), tmpFile, saveFolder);
         if flag ~= 0
             warning('Error in executing %s', 'pollyDisplayVDR1064.py');
         end
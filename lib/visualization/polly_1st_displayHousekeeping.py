@@ -2,7 +2,7 @@ import sys
 import os
 from datetime import datetime, timedelta
 import numpy as np
-import scipy.io as spio
+import pypolly_matfile as matfile
 from matplotlib.dates import DateFormatter, DayLocator, HourLocator, \
     MinuteLocator, date2num
 from matplotlib.colors import ListedColormap
@@ -100,7 +100,7 @@ def polly_1st_displayHousekeeping(tmpFile, saveFolder):
 
     # read matlab .mat data
     try:
-        mat = spio.loadmat(tmpFile, struct_as_record=True)
+        mat = matfile.loadmat(tmpFile, struct_as_record=True)
         figDPI = mat['figDPI'][0][0]
         flagWatermarkOn = mat['flagWatermarkOn'][0][0]
         if mat['partnerLabel'].size:
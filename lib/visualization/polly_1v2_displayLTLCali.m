@@ -105,7 +105,7 @@ end
 %% display longterm cali results
 tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
 save(tmpFile, 'figDPI', 'LCTime532', 'LCTime607', 'LC532Status', 'LC532History', 'LCStd532History', 'LC607Status', 'LC607History', 'LCStd607History', 'logbookTime', 'flagOverlap', 'flagWindowwipe', 'flagFlashlamps', 'flagPulsepower', 'flagRestart', 'flag_CH_NDChange', 'flagCH532FR', 'flagCH607FR', 'flagCH532FR_X', 'depolCaliTime532', 'depolCaliConst532', 'depolConstLim532', 'else_time', 'else_label', 'yLim532', 'yLim_LC_ratio_532_607', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'polly_1v2_displayLTLCali.py'), tmpFile, saveFolder));
+flag = pollyDisplayPyScript(fullfile(pyFolder, 'polly_1v2_displayLTLCali.py'), tmpFile, saveFolder);
 if flag ~= 0
     warning('Error in executing %s', 'polly_1v2_displayLTLCali.py');
 end
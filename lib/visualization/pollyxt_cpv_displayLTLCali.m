@@ -204,10 +204,10 @@ end
 %% display longterm cali results
 tmpFile = fullfile(tmpFolder, [basename(tempname), '.mat']);
 save(tmpFile, 'figDPI', 'LCTime355','LCTime355_NF', 'LCTime532','LCTime532_NF', 'LCTime1064', 'LCTime387', 'LCTime607', 'LC355Status','LC355Status_NF', 'LC532Status','LC532Status_NF', 'LC1064Status', 'LC387Status', 'LC607Status', 'LC355History', 'LCStd355History','LC355History_NF', 'LCStd355History_NF', 'LC532History', 'LCStd532History','LC532History_NF', 'LCStd532History_NF', 'LC1064History', 'LCStd1064History', 'LC387History', 'LCStd387History', 'LC607History', 'LCStd607History', 'logbookTime', 'flagOverlap', 'flagWindowwipe', 'flagFlashlamps', 'flagPulsepower', 'flagRestart', 'flag_CH_NDChange', 'flagCH355FR', 'flagCH532FR', 'flagCH1064FR', 'flagCH387FR', 'flagCH607FR', 'flagCH407FR', 'flagCH355FR_X', 'flagCH532FR_X', 'flagCH1064FR_X', 'flagCH355NR', 'flagCH532NR', 'else_time', 'else_label', 'WVCaliTime', 'WVConst', 'depolCaliTime355', 'depolCaliConst355', 'depolCaliTime532', 'depolCaliConst532', 'depolCaliTime1064', 'depolCaliConst1064', 'yLim355', 'yLim532', 'yLim1064', 'yLim_LC_ratio_355_387', 'yLim_LC_ratio_532_607', 'wvLim', 'depolConstLim355', 'depolConstLim532', 'depolConstLim1064', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_cpv_displayLTLCali.py'), tmpFile, saveFolder));
+flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyxt_cpv_displayLTLCali.py'), tmpFile, saveFolder);
 %% here easy way to make long term cali for nf needed
 %save(tmpFile, 'figDPI', 'LCTime355_NF', 'LCTime532_NF', 'LCTime1064', 'LCTime387', 'LCTime607', 'LC355Status', 'LC532Status', 'LC1064Status', 'LC387Status', 'LC607Status', 'LC355History', 'LCStd355History', 'LC532History', 'LCStd532History', 'LC1064History', 'LCStd1064History', 'LC387History', 'LCStd387History', 'LC607History', 'LCStd607History', 'logbookTime', 'flagOverlap', 'flagWindowwipe', 'flagFlashlamps', 'flagPulsepower', 'flagRestart', 'flag_CH_NDChange', 'flagCH355FR', 'flagCH532FR', 'flagCH1064FR', 'flagCH387FR', 'flagCH607FR', 'flagCH407FR', 'flagCH355FR_X', 'flagCH532FR_X', 'flagCH1064FR_X', 'else_time', 'else_label', 'WVCaliTime', 'WVConst', 'depolCaliTime355', 'depolCaliConst355', 'depolCaliTime532', 'depolCaliConst532', 'depolCaliTime1064', 'depolCaliConst1064', 'yLim355', 'yLim532', 'yLim1064', 'yLim_LC_ratio_355_387', 'yLim_LC_ratio_532_607', 'wvLim', 'depolConstLim355', 'depolConstLim532', 'depolConstLim1064', 'PicassoConfig', 'CampaignConfig', 'PollyDataInfo', 'imgFormat', 'flagWatermarkOn', 'partnerLabel', '-v6');
-%flag = system(sprintf('%s %s %s %s', fullfile(PicassoConfig.pyBinDir, 'python'), fullfile(pyFolder, 'pollyxt_cpv_displayLTLCali.py'), tmpFile, saveFolder));
+%flag = pollyDisplayPyScript(fullfile(pyFolder, 'pollyxt_cpv_displayLTLCali.py'), tmpFile, saveFolder);
 if flag ~= 0
     warning('Error in executing %s', 'pollyxt_cpv_displayLTLCali.py');
 end
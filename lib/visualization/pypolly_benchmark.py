@@ -0,0 +1,341 @@
+import os
+import sys
+import time
+import json
+import argparse
+import platform
+import subprocess
+import statistics
+import tempfile
+from pathlib import Path
+from datetime import datetime, timezone
+import numpy as np
+from netCDF4 import Dataset
+import matplotlib.pyplot as plt
+import pypolly_readout as readout
+import pypolly_display_3d_plots as display_3d
+import pypolly_display_profiles as display_profiles
+import pypolly_profile_translator as p_translator
+import pypolly_scheduler as scheduler
+import pypolly_instrumentation as instrumentation
+import logging
+logging.basicConfig(level=logging.WARNING)
+
+# generating figure without X server
+plt.switch_backend('Agg')
+
+rootDir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+## gap patterns of the synthetic files: list of (start [h], duration [h]) without profiles
+gap_patterns = {
+    'none': [],
+    'few': [(3.0, 1.0), (15.5, 0.5)],
+    'many': [ (h + 0.25, 0.1) for h in range(0, 24, 2) ],
+}
+
+
+def _write_var(nc_file_ds, name, dims, data, dtype='f4', fill_value=None, **attrs):
+    var = nc_file_ds.createVariable(name, dtype, dims, fill_value=fill_value, zlib=True, complevel=1)
+    var[:] = data
+    for key, value in attrs.items():
+        var.setncattr(key, value)
+    return var
+
+
+def make_level1_files(folder, date='20240503', device_label='BEN', hours=24, profile_length=30, gaps='few', height_resolution=7.5, max_height=30000, seed=0):
+    """
+    Description
+    -----------
+    Write synthetic level1 nc-files (att_bsc, vol_depol, WVMR_RH, overlap and profiles)
+    with the variables read by the visualization, for benchmarking.
+
+    Parameters
+    ----------
+    folder: str
+        output folder; existing files with the same name are reused.
+    date: str
+        the date of measurement: YYYYMMDD.
+    hours: float
+        length of the measurement from 00:00 UTC.
+    profile_length: float
+        temporal resolution [s].
+    gaps: str
+        gap pattern, a key of gap_patterns.
+    height_resolution: float
+        vertical resolution [m].
+    max_height: float
+        height of the last range bin [m].
+
+    Returns
+    -------
+    nc_files: dict
+        maps 'att_bsc', 'vol_depol', 'WVMR_RH', 'overlap' and 'profiles' to the nc-file.
+
+    Usage
+    -----
+    nc_files = make_level1_files('/tmp/bench', hours=24, gaps='many')
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    Path(folder).mkdir(parents=True, exist_ok=True)
+    day = datetime.strptime(date, '%Y%m%d').replace(tzinfo=timezone.utc)
+    prefix = f"{day.strftime('%Y_%m_%d_%a')}_{device_label}_00_00_01"
+    nc_files = {
+        'att_bsc': os.path.join(folder, f'{prefix}_att_bsc.nc'),
+        'vol_depol': os.path.join(folder, f'{prefix}_vol_depol.nc'),
+        'WVMR_RH': os.path.join(folder, f'{prefix}_WVMR_RH.nc'),
+        'overlap': os.path.join(folder, f'{prefix}_overlap.nc'),
+        'profiles': os.path.join(folder, f'{prefix}_0000_0100_profiles.nc'),
+    }
+    if all(os.path.exists(nc_file) for nc_file in nc_files.values()):
+        return nc_files
+
+    rng = np.random.default_rng(seed)
+    time = day.timestamp() + 1 + profile_length * np.arange(int(hours * 3600 / profile_length))
+    for gap_start, gap_duration in gap_patterns[gaps]:
+        in_gap = (time >= day.timestamp() + gap_start * 3600) & (time < day.timestamp() + (gap_start + gap_duration) * 3600)
+        time = time[~in_gap]
+    height = height_resolution * np.arange(1, int(max_height / height_resolution) + 1)
+    n_time = len(time)
+    n_height = len(height)
+
+    ## aerosol layer below 2 km, a cloud layer and noise increasing with height
+    profile = 3e-6 * np.exp(-height / 2000) + 2e-6 * np.exp(-((height - 8000) / 300)**2)
+    def field(scale=1.0, low=None):
+        data = profile * scale * (1 + 0.3 * rng.standard_normal((n_time, n_height), dtype='f4') * (height / max_height))
+        if low is not None:
+            data[data < low] = -999.
+        return data.astype('f4')
+    def snr():
+        return (50 * np.exp(-height / 5000) * (1 + 0.1 * rng.standard_normal((n_time, n_height)))).astype('f4')
+    def quality_mask():
+        return rng.choice(np.array([0, 0, 0, 1, 2], dtype='i1'), size=(n_time, n_height))
+
+    def create(nc_filename):
+        nc_file_ds = Dataset(nc_filename, 'w')
+        nc_file_ds.version = 'benchmark'
+        nc_file_ds.createDimension('time', n_time)
+        nc_file_ds.createDimension('height', n_height)
+        _write_var(nc_file_ds, 'time', ('time',), time, dtype='f8')
+        _write_var(nc_file_ds, 'height', ('height',), height)
+        return nc_file_ds
+
+    nc_file_ds = create(nc_files['att_bsc'])
+    for wavelength in [355, 532, 1064]:
+        _write_var(nc_file_ds, f'attenuated_backscatter_{wavelength}nm', ('time', 'height'), field(low=1e-8), fill_value=-999., Lidar_calibration_constant_used=1e14)
+        _write_var(nc_file_ds, f'SNR_{wavelength}nm', ('time', 'height'), snr(), fill_value=-999.)
+        _write_var(nc_file_ds, f'quality_mask_{wavelength}nm', ('time', 'height'), quality_mask(), dtype='i1')
+    nc_file_ds.close()
+
+    nc_file_ds = create(nc_files['vol_depol'])
+    for wavelength in [355, 532]:
+        _write_var(nc_file_ds, f'volume_depolarization_ratio_{wavelength}nm', ('time', 'height'), field(scale=1e5), fill_value=-999., comment='depolarization calibration (eta: 0.5)')
+    nc_file_ds.close()
+
+    nc_file_ds = create(nc_files['WVMR_RH'])
+    _write_var(nc_file_ds, 'WVMR', ('time', 'height'), field(scale=3e6), fill_value=-999., wv_calibration_constant_used=15.0)
+    _write_var(nc_file_ds, 'RH', ('time', 'height'), field(scale=2e7), fill_value=-999.)
+    _write_var(nc_file_ds, 'SNR_387nm', ('time', 'height'), snr(), fill_value=-999.)
+    _write_var(nc_file_ds, 'SNR_407nm', ('time', 'height'), snr(), fill_value=-999.)
+    _write_var(nc_file_ds, 'QM_WVMR', ('time', 'height'), quality_mask(), dtype='i1')
+    _write_var(nc_file_ds, 'QM_RH', ('time', 'height'), quality_mask(), dtype='i1')
+    nc_file_ds.close()
+
+    nc_file_ds = create(nc_files['overlap'])
+    overlap = np.clip(height / 1500, 0, 1)
+    for name in ['overlap355', 'overlap532', 'overlap355Defaults', 'overlap532Defaults', 'overlap355Raman', 'overlap532Raman']:
+        _write_var(nc_file_ds, name, ('height',), overlap * (1 + 0.02 * rng.standard_normal(n_height)))
+    nc_file_ds.close()
+
+    nc_file_ds = Dataset(nc_files['profiles'], 'w')
+    nc_file_ds.version = 'benchmark'
+    nc_file_ds.createDimension('height', n_height)
+    _write_var(nc_file_ds, 'height', ('height',), height)
+    _write_var(nc_file_ds, 'start_time', (), time[0], dtype='f8')
+    _write_var(nc_file_ds, 'end_time', (), time[min(n_time, int(3600 / profile_length)) - 1], dtype='f8')
+    for wavelength in [355, 532, 1064]:
+        _write_var(nc_file_ds, f'aerBsc_raman_{wavelength}', ('height',), profile * 1e6, fill_value=-999.)
+    _write_var(nc_file_ds, 'WVMR', ('height',), 10 * np.exp(-height / 2500), fill_value=-999.)
+    nc_file_ds.close()
+
+    return nc_files
+
+
+def get_configs():
+    ## Picasso config and polly global config of the repository
+    config_dict = readout.read_config(os.path.join(rootDir, 'lib', 'config', 'pollynet_processing_chain_config.json'))
+    polly_conf_dict = readout.read_global_conf(os.path.join(rootDir, 'lib', 'config', 'polly_global_config.json'))
+    return config_dict, polly_conf_dict
+
+
+def make_render_tasks(nc_files, saveFolder):
+    """
+    Description
+    -----------
+    Plotting tasks of the benchmark, one per product of the synthetic files.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    config_dict, polly_conf_dict = get_configs()
+    conf = dict(config_dict=config_dict, polly_conf_dict=polly_conf_dict)
+    profile_translator = p_translator.profile_translator_function()
+    tasks = []
+    tasks.append(scheduler.make_task('attbsc', display_3d.pollyDisplayAttnBsc, {'nc_dict': nc_files['att_bsc']}, **conf, saveFolder=saveFolder, wavelength=532, param='FR'))
+    tasks.append(scheduler.make_task('voldepol', display_3d.pollyDisplayVDR, {'nc_dict': nc_files['vol_depol']}, **conf, saveFolder=saveFolder, wavelength=532))
+    tasks.append(scheduler.make_task('wvmr', display_3d.pollyDisplayWVMR, {'nc_dict': nc_files['WVMR_RH']}, **conf, saveFolder=saveFolder))
+    tasks.append(scheduler.make_task('rh', display_3d.pollyDisplayRH, {'nc_dict': nc_files['WVMR_RH']}, **conf, saveFolder=saveFolder))
+    tasks.append(scheduler.make_task('overlap', display_3d.pollyDisplay_Overlap, {'nc_dict': nc_files['overlap']}, **conf, outdir=saveFolder))
+    tasks.append(scheduler.make_task('profiles', display_profiles.pollyDisplay_profile, {'nc_dict_profile': nc_files['profiles']}, **conf, profile_translator=profile_translator, profilename='WVMR', outdir=saveFolder))
+    return tasks
+
+
+def run_scenarios(nc_files, saveFolder, date, repeat=3):
+    """
+    Description
+    -----------
+    Time the scenarios read, gap_fill, render and save on the synthetic files.
+    Every scenario is repeated and the median wall time [s] is returned.
+    render and save are taken from the 'figure' (self time) and 'savefig' stages.
+
+    Returns
+    -------
+    results: dict
+        maps '{scenario}/{product}' to the median wall time [s].
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    timings = {}
+    def add(name, value):
+        timings.setdefault(name, []).append(value)
+
+    for i_repeat in range(repeat):
+        for product, nc_file in nc_files.items():
+            readout.clear_nc_cache()
+            t0 = time.perf_counter()
+            readout.read_nc_file(nc_file, date, 'benchmark', 'benchmark')
+            add(f'read/{product}', time.perf_counter() - t0)
+
+        nc_dict = readout.read_nc_file(nc_files['att_bsc'], date, 'benchmark', 'benchmark')
+        t0 = time.perf_counter()
+        time_grid = readout.TimeGrid(nc_dict['time'])
+        time_grid.fill_matrix(nc_dict['attenuated_backscatter_532nm'], nc_dict['quality_mask_532nm'])
+        add('gap_fill/att_bsc', time.perf_counter() - t0)
+
+        readout.clear_nc_cache()
+        instrumentation.pop_records()
+        for task in make_render_tasks(nc_files, saveFolder):
+            render = {'figure': 0.0, 'savefig': 0.0}
+            scheduler.run_task(task, date, 'benchmark', 'benchmark')
+            for record in instrumentation.pop_records():
+                if record['stage'] == 'figure':
+                    render['figure'] += record['self_wall_s']
+                elif record['stage'] == 'savefig':
+                    render['savefig'] += record['wall_s']
+            add(f"render/{task['product']}", render['figure'])
+            add(f"save/{task['product']}", render['savefig'])
+
+    return { name: round(statistics.median(values), 6) for name, values in timings.items() }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=rootDir, capture_output=True, text=True).stdout.strip()
+    except Exception as e:
+        return ''
+
+
+def compare_to_history(history_file, entry, threshold):
+    """
+    Description
+    -----------
+    Compare the results with the last entry of the history with the same parameters
+    and host. Returns the scenarios which are slower by more than threshold (relative).
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    previous = None
+    if os.path.exists(history_file):
+        with open(history_file, 'r') as file:
+            for line in file:
+                old_entry = json.loads(line)
+                if old_entry['params'] == entry['params'] and old_entry['host'] == entry['host']:
+                    previous = old_entry
+    if previous is None:
+        return {}
+
+    slower = {}
+    for name, seconds in entry['results'].items():
+        old_seconds = previous['results'].get(name)
+        ## ignore differences below 10 ms, which are mostly noise
+        if old_seconds and seconds - old_seconds > max(threshold * old_seconds, 0.01):
+            slower[name] = (old_seconds, seconds)
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark of the python visualization (read, gap fill, render, save) on synthetic level1 nc-files.')
+    parser.add_argument('--workdir', dest='workdir', type=str, default=os.path.join(tempfile.gettempdir(), 'pypolly_benchmark'),
+                        help='folder for the synthetic nc-files, the figures and the history, outside of the repository. Default: pypolly_benchmark in the temp folder of the system.')
+    parser.add_argument('--hours', dest='hours', type=float, default=24,
+                        help='length of the synthetic measurement [h]. Default is 24.')
+    parser.add_argument('--profile_length', dest='profile_length', type=float, default=30,
+                        help='temporal resolution [s]. Default is 30.')
+    parser.add_argument('--gaps', dest='gaps', type=str, default='few', choices=list(gap_patterns),
+                        help='gap pattern of the measurement. Default is "few".')
+    parser.add_argument('--height_resolution', dest='height_resolution', type=float, default=7.5,
+                        help='vertical resolution [m]. Default is 7.5.')
+    parser.add_argument('--max_height', dest='max_height', type=float, default=30000,
+                        help='height of the last range bin [m]. Default is 30000.')
+    parser.add_argument('--repeat', dest='repeat', type=int, default=3,
+                        help='repetitions of every scenario, the median is stored. Default is 3.')
+    parser.add_argument('--history', dest='history', type=str, default=None,
+                        help='JSON lines file with the results of all runs. Default: benchmark_history.jsonl in workdir.')
+    parser.add_argument('--threshold', dest='threshold', type=float, default=0.2,
+                        help='relative slowdown compared to the last run with the same parameters, which is reported as regression. Default is 0.2.')
+    args = parser.parse_args()
+
+    date = '20240503'
+    params = dict(hours=args.hours, profile_length=args.profile_length, gaps=args.gaps, height_resolution=args.height_resolution, max_height=args.max_height)
+    data_folder = os.path.join(args.workdir, 'data_{hours}h_{profile_length}s_{gaps}_{height_resolution}m_{max_height}m'.format(**params))
+    saveFolder = os.path.join(args.workdir, 'figures')
+    Path(saveFolder).mkdir(parents=True, exist_ok=True)
+    history_file = args.history if args.history else os.path.join(args.workdir, 'benchmark_history.jsonl')
+
+    print('writing synthetic nc-files...')
+    nc_files = make_level1_files(data_folder, date=date, **params)
+
+    print('running scenarios...')
+    results = run_scenarios(nc_files, saveFolder, date, repeat=args.repeat)
+    for name, seconds in results.items():
+        print(f'{name:<24s} {seconds:10.4f} s')
+
+    entry = {
+        'timestamp': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'commit': git_commit(),
+        'host': platform.node(),
+        'python': platform.python_version(),
+        'params': params,
+        'repeat': args.repeat,
+        'results': results,
+    }
+    slower = compare_to_history(history_file, entry, args.threshold)
+    with open(history_file, 'a') as file:
+        file.write(json.dumps(entry) + '\n')
+    print(f'results appended to {history_file}')
+
+    if slower:
+        for name, (old_seconds, seconds) in slower.items():
+            print(f'slowdown {name}: {old_seconds:.4f} s -> {seconds:.4f} s')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
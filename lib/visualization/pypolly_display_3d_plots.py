@@ -8,12 +8,17 @@ import os
 import re
 import sys
 import time
-import scipy.io as spio
 import numpy as np
 from datetime import datetime, timedelta, timezone
 import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 import argparse
+import hashlib
+import PIL.Image
 import pypolly_readout as readout
+import pypolly_instrumentation as instrumentation
+import pypolly_incremental as incremental
 #import statistics
 #from statistics import mode
 
@@ -29,6 +34,331 @@ except Exception as e:
 plt.switch_backend('Agg')
 
 
+class TimeHeightFigure:
+    """
+    Description
+    -----------
+    Reusable scaffold of the time-height plots (12x6 figure with axes, colorbar,
+    locators, tick params, watermark and footer texts). It is built once and
+    for every plot only the image data, extent, colormap, clim, title and
+    texts are swapped. The figure is not managed by pyplot, so plt.close()
+    in other plotting functions does not close it.
+    With fast_render, png files are written by _save_raster instead of savefig.
+    With incremental, png files of a growing nc-file are only updated, see _save_incremental.
+
+    Usage
+    -----
+    template = get_time_height_figure(config_dict, partnerLabel)
+    template.plot(ATT_BETA * 1e6, cmap, zLim, extent, title, cbar_title, footer, saveFilename, figDPI)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    def __init__(self, flagPlotLastProfilesOnly, flagWatermarkOn, partnerLabel):
+        fig = Figure(figsize=[12, 6])
+        FigureCanvasAgg(fig)
+        ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
+        self.image = ax.imshow(
+                np.zeros((2, 2)),
+                interpolation='none',
+                aspect='auto',
+                extent=[0, 1, 0, 1],
+                )
+        # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
+        ax.xaxis_date()
+
+        ax.set_xlabel('Time [UTC]', fontsize=15)
+        ax.set_ylabel('Height [km]', fontsize=15)
+
+        ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
+        if flagPlotLastProfilesOnly == True:
+            ax.xaxis.set_major_locator(HourLocator(interval=2))
+        else:
+            ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
+
+        ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
+
+        ax.tick_params(
+            axis='both', which='major', labelsize=15, right=True,
+            top=True, width=2, length=5)
+        ax.tick_params(
+            axis='both', which='minor', width=1.5, length=3.5,
+            right=True, top=True)
+
+        self.title = ax.set_title('', fontsize=15)
+
+        cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
+        self.cbar = fig.colorbar(
+            self.image,
+            cax=cb_ax,
+            orientation='vertical')
+        self.cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
+        self.cbar_title = self.cbar.ax.set_title('', fontsize=10)
+
+        # add watermark
+        if flagWatermarkOn:
+            newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
+            newax_license.imshow(readout.get_license_image(), alpha=0.8, aspect='equal')
+            newax_license.axis('off')
+
+            fig.text(0.72, 0.003, 'Preliminary\nResults.',
+                     fontweight='bold', fontsize=12, color='red',
+                     ha='left', va='bottom', alpha=0.8, zorder=10)
+
+            fig.text(
+                0.84, 0.003,
+                u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
+                    datetime.now().strftime('%Y'), partnerLabel),
+                fontweight='bold', fontsize=7, color='black', ha='left',
+                va='bottom', alpha=1, zorder=10)
+
+        self.footer = [
+            fig.text(0.05, 0.02, '', fontsize=12),
+            fig.text(0.2, 0.02, '', fontsize=12),
+            ]
+        self.fig = fig
+        self.ax = ax
+        self.fast_render = False
+        self.incremental = False
+        self.scaffold_key = []
+        self._frames = {}
+
+    def plot(self, matrix, cmap, zLim, extent, title, cbar_title, footer, saveFilename, figDPI, increment=None):
+        """
+        Description
+        -----------
+        Draw matrix (already transposed and flipped) into the scaffold and save the figure.
+
+        Parameters
+        ----------
+        zLim: list
+            [vmin, vmax] of the colorbar, with 5 ticks.
+        extent: list
+            [x_min, x_max, y_min, y_max] of the image.
+        footer: list
+            the texts left and right of the footer.
+        increment: dict
+            the profiles of the nc-file in matrix, see readout.get_time_increment.
+            Needed for the incremental mode only.
+        """
+        self.image.set_data(matrix)
+        self.image.set_cmap(cmap)
+        self.image.set_clim(zLim[0], zLim[1])
+        self.image.set_extent(extent)
+        self.ax.set_xlim(extent[0], extent[1])
+        self.ax.set_ylim(extent[2], extent[3])
+        self.cbar.update_normal(self.image)
+        self.cbar.set_ticks(np.linspace(zLim[0], zLim[1], 5))
+        self.title.set_text(title)
+        self.cbar_title.set_text(cbar_title)
+        for text, footer_text in zip(self.footer, footer):
+            text.set_text(footer_text)
+
+        with instrumentation.stage('savefig', file=saveFilename):
+            if self.incremental and increment is not None and saveFilename.lower().endswith('.png'):
+                self._save_incremental(matrix, zLim, extent, saveFilename, figDPI, increment)
+            elif self.fast_render and saveFilename.lower().endswith('.png'):
+                self._save_raster(matrix, zLim, extent, saveFilename, figDPI)
+            else:
+                self.fig.savefig(saveFilename,dpi=figDPI)
+
+    def _get_frame(self, zLim, extent, figDPI):
+        """
+        Description
+        -----------
+        Draw the frame (axes, ticks, colorbar, watermark) without image and texts
+        once per layout and cache it for _save_raster.
+
+        Returns
+        -------
+        frame: dict
+            'base': uint8 RGB of the frame on a white background,
+            'box': (y0, y1, x0, x1) pixels of the axes, origin top left,
+            'edge': indices (rows, cols) inside the box where the frame is not transparent,
+            'edge_rgb', 'edge_alpha': float color and alpha of the frame at these pixels.
+        """
+        cmap = self.image.get_cmap()
+        ## the time axis shows hours only, the frame of the same hours of another day is the same
+        day = np.floor(extent[0])
+        key = (tuple(zLim), round(extent[0] - day, 9), round(extent[1] - day, 9), extent[2], extent[3], figDPI, cmap.name)
+        frame = self._frames.get(key)
+        if frame is not None and frame['cmap'] == cmap:
+            return frame
+
+        texts = [self.title, self.cbar_title] + self.footer
+        text_values = [ text.get_text() for text in texts ]
+        for text in texts:
+            text.set_text('')
+        self.image.set_visible(False)
+        self.fig.patch.set_alpha(0)
+        self.ax.patch.set_alpha(0)
+        dpi = self.fig.get_dpi()
+        self.fig.set_dpi(figDPI)
+        try:
+            self.fig.canvas.draw()
+            rgba = np.asarray(self.fig.canvas.buffer_rgba()).astype(np.float32) / 255
+            bbox = self.ax.get_window_extent().frozen()
+        finally:
+            for text, value in zip(texts, text_values):
+                text.set_text(value)
+            self.image.set_visible(True)
+            self.fig.patch.set_alpha(1)
+            self.ax.patch.set_alpha(1)
+            self.fig.set_dpi(dpi)
+
+        n_rows = rgba.shape[0]
+        x0, x1 = int(round(bbox.x0)), int(round(bbox.x1))
+        y0, y1 = n_rows - int(round(bbox.y1)), n_rows - int(round(bbox.y0))
+
+        ## Agg buffer is not premultiplied
+        alpha = rgba[..., 3:4]
+        base = np.round((rgba[..., :3] * alpha + (1 - alpha)) * 255).astype(np.uint8)
+        edge = np.nonzero(rgba[y0:y1, x0:x1, 3] > 0)
+        box_rgba = rgba[y0:y1, x0:x1][edge]
+
+        if len(self._frames) >= 32:
+            self._frames.clear()
+        frame = {
+            'cmap': cmap.copy(),
+            'lut': colormap_to_lut(cmap),
+            'base': base,
+            'box': (y0, y1, x0, x1),
+            'edge': edge,
+            'edge_rgb': box_rgba[:, :3],
+            'edge_alpha': box_rgba[:, 3:4],
+            }
+        self._frames[key] = frame
+        return frame
+
+    def _save_raster(self, matrix, zLim, extent, saveFilename, figDPI):
+        """
+        Description
+        -----------
+        Fast replacement of savefig for batch reprocessing: matrix is mapped through
+        the colormap LUT with numpy (nearest neighbour, like interpolation='none')
+        into the axes of a cached frame (see _get_frame), only the texts are drawn
+        by Agg and the png is written with PIL.
+        The result is visually equivalent to savefig, but not pixel-identical
+        at the anti-aliased edges of the axes.
+
+        History
+        -------
+        2026-10-18. First edition.
+        """
+        frame = self._get_frame(zLim, extent, figDPI)
+        y0, y1, x0, x1 = frame['box']
+        png = frame['base'].copy()
+        png[y0:y1, x0:x1] = self._render_image(frame, matrix, zLim)
+
+        ## the texts change with every plot, they are drawn alone on a transparent canvas
+        dpi = self.fig.get_dpi()
+        self.fig.set_dpi(figDPI)
+        try:
+            renderer = self.fig.canvas.get_renderer()
+            renderer.clear()
+            for text in [self.title, self.cbar_title] + self.footer:
+                text.draw(renderer)
+            texts = np.asarray(renderer.buffer_rgba())
+        finally:
+            self.fig.set_dpi(dpi)
+        text_pixels = np.nonzero(texts[..., 3])
+        text_rgba = texts[text_pixels].astype(np.float32) / 255
+        text_alpha = text_rgba[:, 3:4]
+        png[text_pixels] = np.round(
+            (text_rgba[:, :3] * text_alpha + png[text_pixels] / 255 * (1 - text_alpha)) * 255)
+
+        ## fast zlib level, the files are somewhat larger than with savefig
+        PIL.Image.fromarray(png, 'RGB').save(saveFilename, dpi=(figDPI, figDPI), compress_level=1)
+
+    def _render_image(self, frame, matrix, zLim, first_pixel=0):
+        ## nearest neighbour resampling of the matrix to the pixel columns first_pixel: of the axes,
+        ## colormapped on the white axes background with the frame of the axes on top
+        y0, y1, x0, x1 = frame['box']
+        rows = ((np.arange(y1 - y0) + 0.5) * matrix.shape[0] / (y1 - y0)).astype(int)
+        cols = ((np.arange(first_pixel, x1 - x0) + 0.5) * matrix.shape[1] / (x1 - x0)).astype(int)
+        image_rgba = apply_colormap(matrix[rows][:, cols], frame['lut'], zLim[0], zLim[1])
+
+        image_rgb = image_rgba[..., :3]
+        translucent = np.nonzero(image_rgba[..., 3] < 255)
+        if len(translucent[0]) > 0:
+            image_alpha = image_rgba[..., 3:4][translucent] / 255
+            image_rgb[translucent] = np.round(image_rgb[translucent] * image_alpha + 255 * (1 - image_alpha))
+        in_image = frame['edge'][1] >= first_pixel
+        edge = (frame['edge'][0][in_image], frame['edge'][1][in_image] - first_pixel)
+        edge_alpha = frame['edge_alpha'][in_image]
+        image_rgb[edge] = np.round(
+            (frame['edge_rgb'][in_image] * edge_alpha + image_rgb[edge] / 255 * (1 - edge_alpha)) * 255)
+        return image_rgb
+
+    def _save_incremental(self, matrix, zLim, extent, saveFilename, figDPI, increment):
+        """
+        Description
+        -----------
+        Near-real-time mode: if saveFilename was rendered from the first profiles of the
+        same nc-file with the same layout, only the image columns of the new profiles
+        are colormapped and written into the existing png. If there are no new profiles,
+        the file is not written at all. Otherwise the figure is rendered completely,
+        or IncrementalMismatch is raised if the matrix holds only the new profiles.
+        The rendered profiles and the layout are remembered in a state file,
+        see pypolly_incremental.
+
+        History
+        -------
+        2026-10-18. First edition.
+        """
+        cmap = self.image.get_cmap()
+        layout = {
+            'scaffold': self.scaffold_key,
+            'zLim': [ float(z) for z in zLim ],
+            'extent': [ float(e) for e in extent ],
+            'dpi': figDPI,
+            'shape': list(matrix.shape),
+            'cmap': cmap.name,
+            'lut': hashlib.sha1(colormap_to_lut(cmap).tobytes()).hexdigest(),
+            'texts': [ text.get_text() for text in [self.title, self.cbar_title] + self.footer ],
+            }
+        state = incremental.read_state(saveFilename)
+        if incremental.can_update(state, saveFilename, layout, increment):
+            if state['n_time'] == increment['n_time']:
+                print(f'{saveFilename} is up to date')
+                return
+            frame = self._get_frame(zLim, extent, figDPI)
+            y0, y1, x0, x1 = frame['box']
+            png = np.array(PIL.Image.open(saveFilename).convert('RGB'))
+            if png.shape != frame['base'].shape:
+                raise incremental.IncrementalMismatch(saveFilename)
+            ## first pixel column showing column first_column of the matrix or a later one
+            cols = ((np.arange(x1 - x0) + 0.5) * matrix.shape[1] / (x1 - x0)).astype(int)
+            first_pixel = int(np.searchsorted(cols, increment['first_column']))
+            png[y0:y1, x0 + first_pixel:x1] = self._render_image(frame, matrix, zLim, first_pixel)
+            PIL.Image.fromarray(png, 'RGB').save(saveFilename, dpi=(figDPI, figDPI), compress_level=1)
+            print(f'{saveFilename}: updated {x1 - x0 - first_pixel} image columns')
+        elif increment['time_start'] > 0:
+            raise incremental.IncrementalMismatch(saveFilename)
+        elif self.fast_render:
+            self._save_raster(matrix, zLim, extent, saveFilename, figDPI)
+        else:
+            self.fig.savefig(saveFilename,dpi=figDPI)
+        incremental.write_state(saveFilename, layout, increment)
+
+
+_time_height_figures = {}
+
+def get_time_height_figure(config_dict, partnerLabel):
+    ## one scaffold per layout and font; the year of the copyright is part of the key for long running processes
+    fontname = config_dict['fontname']
+    key = (config_dict['flagPlotLastProfilesOnly'] == True, bool(config_dict['flagWatermarkOn']), partnerLabel, fontname, datetime.now().strftime('%Y'))
+    if key not in _time_height_figures:
+        # the font has to be set before the texts are created
+        with matplotlib.rc_context({'font.sans-serif': fontname, 'font.family': 'sans-serif'}):
+            _time_height_figures[key] = TimeHeightFigure(config_dict['flagPlotLastProfilesOnly'], config_dict['flagWatermarkOn'], partnerLabel)
+    _time_height_figures[key].fast_render = bool(config_dict.get('flagFastRender', False))
+    _time_height_figures[key].incremental = bool(config_dict.get('flagIncremental', False))
+    _time_height_figures[key].scaffold_key = [ str(k) for k in key ]
+    return _time_height_figures[key]
+
+
 
 def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelength, param,donefilelist_dict):
     """
@@ -73,11 +403,14 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
     imgFormat = polly_conf_dict['imgFormat']
 
     ## read from nc file
-    ATT_BETA = nc_dict[f'attenuated_backscatter_{wavelength}nm']
-    if param == 'FR' or param == 'NR':
-        SNR = nc_dict[f'SNR_{wavelength}nm']
-        quality_mask = nc_dict[f'quality_mask_{wavelength}nm']
-    elif param == 'OC':
+    ATT_BETA = readout.read_height_truncated(nc_dict, f'attenuated_backscatter_{wavelength}nm', y_max=yLim[1])
+    ## SNR and quality mask are optional, without SNR no SNR plot is made
+    SNR = None
+    if (param == 'FR' or param == 'NR') and f'SNR_{wavelength}nm' in nc_dict:
+        SNR = readout.read_height_truncated(nc_dict, f'SNR_{wavelength}nm', y_max=yLim[1])
+    if (param == 'FR' or param == 'NR') and f'quality_mask_{wavelength}nm' in nc_dict:
+        quality_mask = readout.read_height_truncated(nc_dict, f'quality_mask_{wavelength}nm', y_max=yLim[1])
+    else:
         quality_mask = np.where(ATT_BETA > 0, 0, 0)
 
     height = nc_dict['height']
@@ -116,7 +449,7 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
     saveFilename_SNR = os.path.join(saveFolder,plotfile_SNR)
 
     ## fill time gaps in att_bsc matrix
-    ATT_BETA, quality_mask_ATT = readout.fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask)
+    ATT_BETA, quality_mask_ATT = readout.get_time_grid(nc_dict).fill_matrix(ATT_BETA, quality_mask)
     
 
     ## get date and convert to datetime object
@@ -124,7 +457,7 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
     date_00 = date_00.timestamp()
     
     ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
     x_lims = date2num(x_lims)
@@ -143,7 +476,7 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
     ATT_BETA = ATT_BETA[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    ATT_BETA = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=ATT_BETA,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    ATT_BETA = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=ATT_BETA,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## transpose and flip for correct plotting
     ATT_BETA= np.ma.transpose(ATT_BETA)  ## matrix has to be transposed for usage with pcolormesh!
@@ -160,100 +493,34 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
 
     print(f"plotting {plotfile} ... ")
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            ATT_BETA * 1e6,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-#    
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Attenuated Backscatter at {wave} nm'.format(wave = wavelength) +
-        ' {param} of {instrument} at {location}'.format(
-            param=param,
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-#    cbar.ax.set_title('      $Mm^{-1}*sr^{-1}$\n', fontsize=10)
-    cbar.ax.set_title('      $\mathrm{Mm^{-1}\,sr^{-1}}$\n', fontsize=10)
-
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
     if isinstance(LCUsed,float):
         pass
     else:
         LCUsed = np.nan
-    fig.text(
-        0.05, 0.02,
-        '{0}\nLC: {1:.2e}'.format(
-            nc_dict['m_date'],
-            LCUsed), fontsize=12)
-
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}\nCalibration: {method}'.format(
-            version=version,
-            method=flagLC),
-        fontsize=12)
 
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+    template = get_time_height_figure(config_dict, partnerLabel)
+    template.plot(
+        ATT_BETA * 1e6,
+        cmap=cmap,
+        zLim=zLim,
+        extent=extent,
+        title='Attenuated Backscatter at {wave} nm'.format(wave = wavelength) +
+            ' {param} of {instrument} at {location}'.format(
+                param=param,
+                instrument=pollyVersion,
+                location=location),
+        cbar_title='      $\mathrm{Mm^{-1}\,sr^{-1}}$\n',
+        footer=[
+            '{0}\nLC: {1:.2e}'.format(
+                nc_dict['m_date'],
+                LCUsed),
+            'Version: {version}\nCalibration: {method}'.format(
+                version=version,
+                method=flagLC),
+            ],
+        saveFilename=saveFilename,
+        figDPI=figDPI,
+        increment=readout.get_time_increment(nc_dict))
 
     
 
@@ -282,9 +549,9 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
     
 
     ## plotting SNR
-    if param == 'FR' or param == 'NR':
+    if SNR is not None:
         ## fill time gaps in snr matrix
-        SNR, quality_mask_SNR = readout.fill_time_gaps_of_matrix(time, SNR, quality_mask)
+        SNR, quality_mask_SNR = readout.get_time_grid(nc_dict).fill_matrix(SNR, quality_mask)
 
         ## mask matrix
         SNR = np.ma.masked_where(quality_mask_SNR < 0, SNR)
@@ -294,105 +561,39 @@ def pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, saveFolder, wavel
         SNR = SNR[:,0:len(max_height)]
 
         ## trimm matrix to last available timestamp if neccessary
-        SNR = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=SNR,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+        SNR = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=SNR,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 	
-        zLim = [np.nanmin(SNR), np.nanmax(SNR)]
+        ## fixed colour range, so that the plot can be updated incrementally
+        zLim = polly_conf_dict.get('zLim_SNR', [0, 100])
     
         ## transpose and flip for correct plotting
         SNR = np.ma.transpose(SNR)  ## matrix has to be transposed for usage with pcolormesh!
         SNR = np.flip(SNR,0)
         print(f"plotting {plotfile_SNR} ... ")
         # display attenuate backscatter
-        fig = plt.figure(figsize=[12, 6])
-        ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-        pcmesh = ax.imshow(
-                SNR,
-                cmap=cmap,
-                vmin=zLim[0],
-                vmax=zLim[1],
-                interpolation='none',
-                aspect='auto',
-                extent=extent,
-                )
-        # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-        ax.xaxis_date()
-    
-        ax.set_xlabel('Time [UTC]', fontsize=15)
-        ax.set_ylabel('Height [km]', fontsize=15)
-    
-        ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-        if config_dict['flagPlotLastProfilesOnly'] == True:
-            ax.xaxis.set_major_locator(HourLocator(interval=2))
-        else:
-            ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-        ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-
-    #    
-        ax.tick_params(
-            axis='both', which='major', labelsize=15, right=True,
-            top=True, width=2, length=5)
-        ax.tick_params(
-            axis='both', which='minor', width=1.5, length=3.5,
-            right=True, top=True)
-    
-        ax.set_title(
-            'SNR at {wave} nm'.format(wave = wavelength) +
-            ' {param} of {instrument} at {location}'.format(
-                param=param,
-                instrument=pollyVersion,
-                location=location),
-            fontsize=15)
-    
-        cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-        cbar = fig.colorbar(
-            pcmesh,
-            cax=cb_ax,
-            ticks=np.linspace(zLim[0], zLim[1], 5),
-            orientation='vertical')
-        cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-        cbar.ax.set_title('      SNR\n', fontsize=10)
-    
-        # add watermark
-        if flagWatermarkOn:
-        #    rootDir = os.getcwd()
-            rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            im_license = matplotlib.image.imread(
-                os.path.join(rootDir, 'img', 'by-sa.png'))
-    
-            newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-            newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-            newax_license.axis('off')
-    
-            fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                     fontweight='bold', fontsize=12, color='red',
-                     ha='left', va='bottom', alpha=0.8, zorder=10)
-    
-            fig.text(
-                0.84, 0.003,
-                u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                    datetime.now().strftime('%Y'), partnerLabel),
-                fontweight='bold', fontsize=7, color='black', ha='left',
-                va='bottom', alpha=1, zorder=10)
-
-        fig.text(
-           0.05, 0.02,
-           '{0}\nLC: {1:.2e}'.format(
-   #            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-               nc_dict['m_date'],
-               LCUsed), fontsize=12)
-        fig.text(
-            0.2, 0.02,
-            'Version: {version}\nCalibration: {method}'.format(
-                version=version,
-                method=flagLC),
-            fontsize=12)
-    
-        fig.savefig(saveFilename_SNR,dpi=figDPI)
-    
-        plt.close()
+        template = get_time_height_figure(config_dict, partnerLabel)
+        template.plot(
+            SNR,
+            cmap=cmap,
+            zLim=zLim,
+            extent=extent,
+            title='SNR at {wave} nm'.format(wave = wavelength) +
+                ' {param} of {instrument} at {location}'.format(
+                    param=param,
+                    instrument=pollyVersion,
+                    location=location),
+            cbar_title='      SNR\n',
+            footer=[
+                '{0}\nLC: {1:.2e}'.format(
+                    nc_dict['m_date'],
+                    LCUsed),
+                'Version: {version}\nCalibration: {method}'.format(
+                    version=version,
+                    method=flagLC),
+                ],
+            saveFilename=saveFilename_SNR,
+            figDPI=figDPI,
+            increment=readout.get_time_increment(nc_dict))
 
         ## write2donefilelist
         readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -456,8 +657,8 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
     imgFormat = polly_conf_dict['imgFormat']
 
     ## read from nc file
-    ATT_BETA = nc_dict[f'attenuated_backscatter_{wavelength}nm']
-    quality_mask = nc_dict[f'quality_mask_{wavelength}nm']
+    ATT_BETA = readout.read_height_truncated(nc_dict, f'attenuated_backscatter_{wavelength}nm', y_max=yLim[1])
+    quality_mask = readout.read_height_truncated(nc_dict, f'quality_mask_{wavelength}nm', y_max=yLim[1])
 
     height = nc_dict['height']
     time = nc_dict['time']
@@ -494,7 +695,7 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
         pass
 
     ## fill time gaps in att_bsc matrix
-    ATT_BETA, quality_mask = readout.fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask)
+    ATT_BETA, quality_mask = readout.get_time_grid(nc_dict).fill_matrix(ATT_BETA, quality_mask)
     
 
     ## get date and convert to datetime object
@@ -502,7 +703,7 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
     date_00 = date_00.timestamp()
 
     ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
     x_lims = date2num(x_lims)
@@ -521,7 +722,7 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
     ATT_BETA = ATT_BETA[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    ATT_BETA = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=ATT_BETA,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    ATT_BETA = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=ATT_BETA,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## transpose and flip for correct plotting
     ATT_BETA= np.ma.transpose(ATT_BETA)  ## matrix has to be transposed for usage with pcolormesh!
@@ -611,11 +812,7 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
 
     # add watermark
     if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = readout.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -649,7 +846,8 @@ def pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly
             method=flagLC),
         fontsize=12)
 
-    fig.savefig(saveFilename,dpi=figDPI)
+    with instrumentation.stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename,dpi=figDPI)
 
     plt.close()
 
@@ -712,7 +910,7 @@ def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,d
     imgFormat = polly_conf_dict['imgFormat']
 
 
-    VDR = nc_dict[f'volume_depolarization_ratio_{wavelength}nm'] 
+    VDR = readout.read_height_truncated(nc_dict, f'volume_depolarization_ratio_{wavelength}nm', y_max=yLim[1])
     quality_mask = np.where(VDR > 0, 0, 0)
     eta = re.split(r'eta:',nc_dict[f'volume_depolarization_ratio_{wavelength}nm___comment'])[1]
     try:
@@ -735,14 +933,14 @@ def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,d
     saveFilename = os.path.join(saveFolder,plotfile)
 
     ## fill time gaps in att_bsc matrix
-    VDR, quality_mask = readout.fill_time_gaps_of_matrix(time, VDR, quality_mask)
+    VDR, quality_mask = readout.get_time_grid(nc_dict).fill_matrix(VDR, quality_mask)
 
     ## get date and convert to datetime object
     date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
     date_00 = date_00.timestamp()
 
     ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
     x_lims = date2num(x_lims)
@@ -762,7 +960,7 @@ def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,d
     VDR = VDR[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    VDR = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=VDR,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    VDR = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=VDR,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## transpose and flip for correct plotting
     VDR= np.ma.transpose(VDR)  ## matrix has to be transposed for usage with pcolormesh!
@@ -778,123 +976,50 @@ def pollyDisplayVDR(nc_dict,config_dict,polly_conf_dict,saveFolder, wavelength,d
 
     print(f"plotting {plotfile} ... ")
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            VDR,# * 1e6,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
+    template = get_time_height_figure(config_dict, partnerLabel)
+    template.plot(
+        VDR,
+        cmap=cmap,
+        zLim=zLim,
+        extent=extent,
+        title='Volume Depolarization Ratio at {wave} nm'.format(wave = wavelength) +
+            ' of {instrument} at {location}'.format(
+                instrument=pollyVersion,
+                location=location),
+        cbar_title='      \n',
+        footer=[
+            '{0}\n$\eta$: {1}'.format(
+                nc_dict['m_date'],eta),
+            'Version: {version}\nCalibration: {method}'.format(
+                version=version,
+                method=flagLC),
+            ],
+        saveFilename=saveFilename,
+        figDPI=figDPI,
+        increment=readout.get_time_increment(nc_dict))
 
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-  
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Volume Depolarization Ratio at {wave} nm'.format(wave = wavelength) +
-        ' of {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      \n', fontsize=10)
-
-
-    # add watermark
-    if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        #rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}\n$\eta$: {1}'.format(
-            nc_dict['m_date'],eta),
-            fontsize=12)
-#    fig.text(
-#        0.05, 0.02,
-#        '{0}\nLC: {1:.2e}'.format(
-##            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-#            nc_dict['m_date'],
-#            LCUsed[0]), fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}\nCalibration: {method}'.format(
-            version=version,
-            method=flagLC),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
-
-    ## write2donefilelist
-    readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
-                                    lidar = pollyVersion,
-                                    location = nc_dict['location'],
-                                    starttime = datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d %H:%M:%S'),
-                                    stoptime = datetime.utcfromtimestamp(int(nc_dict['time'][-1])).strftime('%Y%m%d %H:%M:%S'),
-                                    last_update = datetime.now(timezone.utc).strftime("%Y%m%d %H:%M:%S"),
-                                    wavelength = wavelength,
-                                    filename = saveFilename,
-                                    level = 0,
-                                    info = f"VolDepol plots for {wavelength}",
-                                    nc_zip_file = nc_dict['PollyDataFile'],
-                                    nc_zip_file_size = 9000000,
-                                    active = 1,
-                                    GDAS = 0,
-                                    GDAS_timestamp = f"{datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d')} 12:00:00",
-                                    lidar_ratio = 50,
-                                    software_version = version,
-                                    product_type = f'VDR_{wavelength}',
-                                    product_starttime = datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d %H:%M:%S'),
-                                    product_stoptime = datetime.utcfromtimestamp(int(nc_dict['time'][-1])).strftime('%Y%m%d %H:%M:%S')
-                                    )
+    ## write2donefilelist
+    readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
+                                    lidar = pollyVersion,
+                                    location = nc_dict['location'],
+                                    starttime = datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d %H:%M:%S'),
+                                    stoptime = datetime.utcfromtimestamp(int(nc_dict['time'][-1])).strftime('%Y%m%d %H:%M:%S'),
+                                    last_update = datetime.now(timezone.utc).strftime("%Y%m%d %H:%M:%S"),
+                                    wavelength = wavelength,
+                                    filename = saveFilename,
+                                    level = 0,
+                                    info = f"VolDepol plots for {wavelength}",
+                                    nc_zip_file = nc_dict['PollyDataFile'],
+                                    nc_zip_file_size = 9000000,
+                                    active = 1,
+                                    GDAS = 0,
+                                    GDAS_timestamp = f"{datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d')} 12:00:00",
+                                    lidar_ratio = 50,
+                                    software_version = version,
+                                    product_type = f'VDR_{wavelength}',
+                                    product_starttime = datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d %H:%M:%S'),
+                                    product_stoptime = datetime.utcfromtimestamp(int(nc_dict['time'][-1])).strftime('%Y%m%d %H:%M:%S')
+                                    )
 
 
 def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_dict):
@@ -930,10 +1055,16 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     imgFormat = polly_conf_dict['imgFormat']
 
     ## read from nc-file
-    WVMR = nc_dict['WVMR']
-    SNR387 = nc_dict[f'SNR_387nm']
-    SNR407 = nc_dict[f'SNR_407nm']
-    quality_mask = nc_dict['QM_WVMR']
+    WVMR = readout.read_height_truncated(nc_dict, 'WVMR', y_max=yLim[1])
+    ## SNR and quality mask are optional, without SNR no SNR plots are made
+    flagSNR = 'SNR_387nm' in nc_dict and 'SNR_407nm' in nc_dict
+    if flagSNR:
+        SNR387 = readout.read_height_truncated(nc_dict, f'SNR_387nm', y_max=yLim[1])
+        SNR407 = readout.read_height_truncated(nc_dict, f'SNR_407nm', y_max=yLim[1])
+    if 'QM_WVMR' in nc_dict:
+        quality_mask = readout.read_height_truncated(nc_dict, 'QM_WVMR', y_max=yLim[1])
+    else:
+        quality_mask = np.where(WVMR > 0, 0, 0)
     height = nc_dict['height']
     time = nc_dict['time']
 
@@ -953,14 +1084,14 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     saveFilename_SNR407 = os.path.join(saveFolder,plotfile_SNR407)
 
     ## fill time gaps in att_bsc matrix
-    WVMR, quality_mask = readout.fill_time_gaps_of_matrix(time, WVMR, quality_mask)
+    WVMR, quality_mask = readout.get_time_grid(nc_dict).fill_matrix(WVMR, quality_mask)
 
     ## get date and convert to datetime object
     date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
     date_00 = date_00.timestamp()
 
     ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
     x_lims = date2num(x_lims)
@@ -979,7 +1110,7 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     WVMR = WVMR[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    WVMR = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=WVMR,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    WVMR = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=WVMR,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## transpose and flip for correct plotting
     WVMR= np.ma.transpose(WVMR)  ## matrix has to be transposed for usage with pcolormesh!
@@ -995,91 +1126,25 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
 
     print(f"plotting {plotfile} ... ")
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            WVMR,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Water vapour mixing ratio of {instrument} at {location}'.format(
+    template = get_time_height_figure(config_dict, partnerLabel)
+    template.plot(
+        WVMR,
+        cmap=cmap,
+        zLim=zLim,
+        extent=extent,
+        title='Water vapour mixing ratio of {instrument} at {location}'.format(
             instrument=pollyVersion,
             location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      [$\mathrm{g\, kg^{-1}}$]\n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+        cbar_title='      [$\mathrm{g\, kg^{-1}}$]\n',
+        footer=[
+            '{0}'.format(
+                nc_dict['m_date']),
+            'Version: {version}'.format(
+                version=version),
+            ],
+        saveFilename=saveFilename,
+        figDPI=figDPI,
+        increment=readout.get_time_increment(nc_dict))
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -1105,9 +1170,13 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
                                     )
 
     ## plotting SNR
+    if not flagSNR:
+        return
+
     ## fill time gaps in snr matrix
-    SNR387, quality_mask_SNR387 = readout.fill_time_gaps_of_matrix(time, SNR387, quality_mask)
-    SNR407, quality_mask_SNR407 = readout.fill_time_gaps_of_matrix(time, SNR407, quality_mask)
+    ## quality_mask is already filled here, the SNR plots are masked by SNR < 0 instead
+    SNR387 = readout.get_time_grid(nc_dict).fill_single_matrix(SNR387)
+    SNR407 = readout.get_time_grid(nc_dict).fill_single_matrix(SNR407)
     
 
 #    ## mask matrix
@@ -1120,10 +1189,11 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     SNR407 = SNR407[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    SNR387 = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=SNR387,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
-    SNR407 = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=SNR407,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    SNR387 = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=SNR387,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
+    SNR407 = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=SNR407,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
     
-    zLim = [np.nanmin(SNR387), np.nanmax(SNR387)]
+    ## fixed colour range, so that the plots can be updated incrementally
+    zLim = polly_conf_dict.get('zLim_SNR', [0, 100])
 
     ## transpose and flip for correct plotting
     SNR387 = np.ma.transpose(SNR387)  ## matrix has to be transposed for usage with pcolormesh!
@@ -1132,209 +1202,72 @@ def pollyDisplayWVMR(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist
     SNR407 = np.flip(SNR407,0)
     print(f"plotting {plotfile_SNR387} ... ")
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            SNR387,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-
-#    
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'SNR at {wave} nm'.format(wave = 387) +
-        ' of {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      SNR387\n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-    #    rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename_SNR387,dpi=figDPI)
-
-    plt.close()
-
-    ## write2donefilelist
-    readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
-                                    lidar = pollyVersion,
-                                    location = nc_dict['location'],
-                                    starttime = datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d %H:%M:%S'),
-                                    stoptime = datetime.utcfromtimestamp(int(nc_dict['time'][-1])).strftime('%Y%m%d %H:%M:%S'),
-                                    last_update = datetime.now(timezone.utc).strftime("%Y%m%d %H:%M:%S"),
-                                    wavelength = '387',
-                                    filename = saveFilename_SNR387,
-                                    level = 0,
-                                    info = f"SNR plots for WVMR",
-                                    nc_zip_file = nc_dict['PollyDataFile'],
-                                    nc_zip_file_size = 9000000,
-                                    active = 1,
-                                    GDAS = 0,
-                                    GDAS_timestamp = f"{datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d')} 12:00:00",
-                                    lidar_ratio = 50,
-                                    software_version = version,
-                                    product_type = 'SNR_FR_387',
-                                    product_starttime = datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d %H:%M:%S'),
-                                    product_stoptime = datetime.utcfromtimestamp(int(nc_dict['time'][-1])).strftime('%Y%m%d %H:%M:%S')
-                                    )
-
-    print(f"plotting {plotfile_SNR407} ... ")
-    zLim = [np.nanmin(SNR407), np.nanmax(SNR407)]
-    # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            SNR407,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-
-#    
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'SNR at {wave} nm'.format(wave = 407) +
-        ' of {instrument} at {location}'.format(
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      SNR407\n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-    #    rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
+    template = get_time_height_figure(config_dict, partnerLabel)
+    template.plot(
+        SNR387,
+        cmap=cmap,
+        zLim=zLim,
+        extent=extent,
+        title='SNR at {wave} nm'.format(wave = 387) +
+            ' of {instrument} at {location}'.format(
+                instrument=pollyVersion,
+                location=location),
+        cbar_title='      SNR387\n',
+        footer=[
+            '{0}'.format(
+                nc_dict['m_date']),
+            'Version: {version}'.format(
+                version=version),
+            ],
+        saveFilename=saveFilename_SNR387,
+        figDPI=figDPI,
+        increment=readout.get_time_increment(nc_dict))
 
-    fig.savefig(saveFilename_SNR407,dpi=figDPI)
+    ## write2donefilelist
+    readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
+                                    lidar = pollyVersion,
+                                    location = nc_dict['location'],
+                                    starttime = datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d %H:%M:%S'),
+                                    stoptime = datetime.utcfromtimestamp(int(nc_dict['time'][-1])).strftime('%Y%m%d %H:%M:%S'),
+                                    last_update = datetime.now(timezone.utc).strftime("%Y%m%d %H:%M:%S"),
+                                    wavelength = '387',
+                                    filename = saveFilename_SNR387,
+                                    level = 0,
+                                    info = f"SNR plots for WVMR",
+                                    nc_zip_file = nc_dict['PollyDataFile'],
+                                    nc_zip_file_size = 9000000,
+                                    active = 1,
+                                    GDAS = 0,
+                                    GDAS_timestamp = f"{datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d')} 12:00:00",
+                                    lidar_ratio = 50,
+                                    software_version = version,
+                                    product_type = 'SNR_FR_387',
+                                    product_starttime = datetime.utcfromtimestamp(int(nc_dict['time'][0])).strftime('%Y%m%d %H:%M:%S'),
+                                    product_stoptime = datetime.utcfromtimestamp(int(nc_dict['time'][-1])).strftime('%Y%m%d %H:%M:%S')
+                                    )
 
-    plt.close()
+    print(f"plotting {plotfile_SNR407} ... ")
+    # display attenuate backscatter
+    template = get_time_height_figure(config_dict, partnerLabel)
+    template.plot(
+        SNR407,
+        cmap=cmap,
+        zLim=zLim,
+        extent=extent,
+        title='SNR at {wave} nm'.format(wave = 407) +
+            ' of {instrument} at {location}'.format(
+                instrument=pollyVersion,
+                location=location),
+        cbar_title='      SNR407\n',
+        footer=[
+            '{0}'.format(
+                nc_dict['m_date']),
+            'Version: {version}'.format(
+                version=version),
+            ],
+        saveFilename=saveFilename_SNR407,
+        figDPI=figDPI,
+        increment=readout.get_time_increment(nc_dict))
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -1391,8 +1324,12 @@ def pollyDisplayRH(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_d
     colormap_basic = polly_conf_dict['colormap_basic']
     imgFormat = polly_conf_dict['imgFormat']
 
-    RH = nc_dict['RH']
-    quality_mask = nc_dict['QM_RH']
+    RH = readout.read_height_truncated(nc_dict, 'RH', y_max=yLim[1])
+    ## quality mask is optional
+    if 'QM_RH' in nc_dict:
+        quality_mask = readout.read_height_truncated(nc_dict, 'QM_RH', y_max=yLim[1])
+    else:
+        quality_mask = np.where(RH > 0, 0, 0)
     height = nc_dict['height']
     time = nc_dict['time']
 
@@ -1408,14 +1345,14 @@ def pollyDisplayRH(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_d
     saveFilename = os.path.join(saveFolder,plotfile)
 
     ## fill time gaps in att_bsc matrix
-    RH, quality_mask = readout.fill_time_gaps_of_matrix(time, RH, quality_mask)
+    RH, quality_mask = readout.get_time_grid(nc_dict).fill_matrix(RH, quality_mask)
 
     ## get date and convert to datetime object
     date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
     date_00 = date_00.timestamp()
 
     ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
     x_lims = date2num(x_lims)
@@ -1434,7 +1371,7 @@ def pollyDisplayRH(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_d
     RH = RH[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    RH = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=RH,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    RH = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=RH,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## transpose and flip for correct plotting
     RH = np.ma.transpose(RH)  ## matrix has to be transposed for usage with pcolormesh!
@@ -1450,92 +1387,25 @@ def pollyDisplayRH(nc_dict,config_dict,polly_conf_dict,saveFolder,donefilelist_d
 
     print(f"plotting {plotfile} ... ")
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            RH,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Relative humidity of {instrument} at {location}'.format(
+    template = get_time_height_figure(config_dict, partnerLabel)
+    template.plot(
+        RH,
+        cmap=cmap,
+        zLim=zLim,
+        extent=extent,
+        title='Relative humidity of {instrument} at {location}'.format(
             instrument=pollyVersion,
             location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      [$\mathrm{\%}$]\n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+        cbar_title='      [$\mathrm{\%}$]\n',
+        footer=[
+            '{0}'.format(
+                nc_dict['m_date']),
+            'Version: {version}'.format(
+                version=version),
+            ],
+        saveFilename=saveFilename,
+        figDPI=figDPI,
+        increment=readout.get_time_increment(nc_dict))
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -1592,7 +1462,7 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
     colormap_basic = polly_conf_dict['colormap_basic']
     imgFormat = polly_conf_dict['imgFormat']
 
-    matrix = nc_dict['target_classification']
+    matrix = readout.read_height_truncated(nc_dict, 'target_classification', y_max=yLim[1])
     quality_mask = np.where(matrix > 0, 0, 0)
     height = nc_dict['height']
     time = nc_dict['time']
@@ -1635,14 +1505,14 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
     saveFilename = os.path.join(saveFolder,plotfile)
 
     ## fill time gaps in att_bsc matrix
-    matrix, quality_mask = readout.fill_time_gaps_of_matrix(time, matrix, quality_mask)
+    matrix, quality_mask = readout.get_time_grid(nc_dict).fill_matrix(matrix, quality_mask)
 
     ## get date and convert to datetime object
     date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
     date_00 = date_00.timestamp()
 
     ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
     x_lims = date2num(x_lims)
@@ -1661,7 +1531,7 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
     matrix = matrix[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    matrix = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=matrix,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    matrix = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=matrix,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
     ## transpose and flip for correct plotting
     matrix = np.ma.transpose(matrix)  ## matrix has to be transposed for usage with pcolormesh!
     matrix = np.flip(matrix,0)
@@ -1730,11 +1600,7 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
 
     # add watermark
     if flagWatermarkOn:
-        #rootDir = os.getcwd()  
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = readout.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -1763,7 +1629,8 @@ def pollyDisplayTargetClass(nc_dict,config_dict, polly_conf_dict, saveFolder, c_
             version=version),
         fontsize=12)
 
-    fig.savefig(saveFilename,dpi=figDPI)
+    with instrumentation.stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename,dpi=figDPI)
 
     plt.close()
 
@@ -1832,18 +1699,18 @@ def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_
     imgFormat = polly_conf_dict['imgFormat']
 
     if q_param == "angexp":
-        matrix = nc_dict['quasi_ang_532_1064']
+        matrix = readout.read_height_truncated(nc_dict, 'quasi_ang_532_1064', y_max=yLim[1])
         quality_mask = np.where(matrix > 0, 0, 0)
     elif q_param == "bsc_532":
-        matrix = nc_dict['quasi_bsc_532']
-        quality_mask = nc_dict['quality_mask_532']
+        matrix = readout.read_height_truncated(nc_dict, 'quasi_bsc_532', y_max=yLim[1])
+        quality_mask = readout.read_height_truncated(nc_dict, 'quality_mask_532', y_max=yLim[1])
     elif q_param == "bsc_1064":
-        matrix = nc_dict['quasi_bsc_1064']
-        quality_mask = nc_dict['quality_mask_1064']
+        matrix = readout.read_height_truncated(nc_dict, 'quasi_bsc_1064', y_max=yLim[1])
+        quality_mask = readout.read_height_truncated(nc_dict, 'quality_mask_1064', y_max=yLim[1])
     elif q_param == "par_depol_532":
-        matrix = nc_dict['quasi_pardepol_532']
+        matrix = readout.read_height_truncated(nc_dict, 'quasi_pardepol_532', y_max=yLim[1])
         #quality_mask = nc_dict['quality_mask_voldepol']
-        quality_mask = nc_dict['quality_mask_voldepol_532']
+        quality_mask = readout.read_height_truncated(nc_dict, 'quality_mask_voldepol_532', y_max=yLim[1])
     
     height = nc_dict['height']
     time = nc_dict['time']
@@ -1892,14 +1759,14 @@ def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_
     saveFilename = os.path.join(saveFolder,plotfile)
 
     ## fill time gaps in att_bsc matrix
-    matrix, quality_mask = readout.fill_time_gaps_of_matrix(time, matrix, quality_mask)
+    matrix, quality_mask = readout.get_time_grid(nc_dict).fill_matrix(matrix, quality_mask)
 
     ## get date and convert to datetime object
     date_00 = datetime.strptime(nc_dict['m_date'], '%Y-%m-%d')
     date_00 = date_00.timestamp()
 
     ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
     x_lims = date2num(x_lims)
@@ -1918,7 +1785,7 @@ def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_
     matrix = matrix[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    matrix = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=matrix,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    matrix = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=matrix,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## transpose and flip for correct plotting
     matrix = np.ma.transpose(matrix)  ## matrix has to be transposed for usage with pcolormesh!
@@ -1934,87 +1801,23 @@ def pollyDisplayQR(nc_dict,config_dict, polly_conf_dict, saveFolder, q_param, q_
 
     print(f"plotting {plotfile} ... ")
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            matrix,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(quasi_title, fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-    cbar.ax.set_title('      \n', fontsize=10)
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd() 
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(
-#            datenum_to_datetime(time[0]).strftime("%Y-%m-%d"),
-            nc_dict['m_date']),
-            fontsize=12)
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+    template = get_time_height_figure(config_dict, partnerLabel)
+    template.plot(
+        matrix,
+        cmap=cmap,
+        zLim=zLim,
+        extent=extent,
+        title=quasi_title,
+        cbar_title='      \n',
+        footer=[
+            '{0}'.format(
+                nc_dict['m_date']),
+            'Version: {version}'.format(
+                version=version),
+            ],
+        saveFilename=saveFilename,
+        figDPI=figDPI,
+        increment=readout.get_time_increment(nc_dict))
 
     ## write2donefilelist
     readout.write2donefilelist_dict(donefilelist_dict = donefilelist_dict,
@@ -2147,11 +1950,7 @@ def pollyDisplay_Overlap(nc_dict,config_dict,polly_conf_dict,outdir,donefilelist
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-#        rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = readout.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -2186,7 +1985,8 @@ def pollyDisplay_Overlap(nc_dict,config_dict,polly_conf_dict,outdir,donefilelist
             version=version),
         fontsize=12)
     print(f"plotting {plotfile} ... ")
-    fig.savefig(saveFilename,dpi=figDPI)
+    with instrumentation.stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename,dpi=figDPI)
 
     plt.close()
 
@@ -2255,7 +2055,7 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
     imgFormat = polly_conf_dict['imgFormat']
 
     ## read from nc file
-    RCS_matrix = nc_dict[f'RCS_{param}_{wavelength}nm']
+    RCS_matrix = readout.read_height_truncated(nc_dict, f'RCS_{param}_{wavelength}nm', y_max=yLim[1])
     quality_mask = np.where(RCS_matrix > 0, 0, -999.0)
 
     height = nc_dict['height']
@@ -2277,7 +2077,7 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
 
     ## fill time gaps in att_bsc matrix
 #    RCS_matrix, quality_mask_ATT = readout.fill_time_gaps_of_matrix(time, RCS_matrix, quality_mask)
-    RCS_matrix = readout.fill_time_gaps_of_single_matrix(time, RCS_matrix)
+    RCS_matrix = readout.get_time_grid(nc_dict).fill_single_matrix(RCS_matrix)
     
 
     ## get date and convert to datetime object
@@ -2285,7 +2085,7 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
     date_00 = date_00.timestamp()
     
     ## set x-lim to 24h or only to last available timestamp
-    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1])
+    x_lims = readout.set_x_lims(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],mdate=date_00,last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## convert these datetime.datetime objects to the correct format for matplotlib to work with.
     x_lims = date2num(x_lims)
@@ -2304,7 +2104,7 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
     RCS_matrix = RCS_matrix[:,0:len(max_height)]
 
     ## trimm matrix to last available timestamp if neccessary
-    RCS_matrix = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=RCS_matrix,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1])
+    RCS_matrix = readout.trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly=config_dict['flagPlotLastProfilesOnly'],matrix=RCS_matrix,mdate=date_00,profile_length=int(np.nanmean(np.diff(time))),last_timestamp=nc_dict['time'][-1],round_to_hour=config_dict.get('flagIncremental', False))
 
     ## transpose and flip for correct plotting
     RCS_matrix= np.ma.transpose(RCS_matrix)  ## matrix has to be transposed for usage with pcolormesh!
@@ -2321,93 +2121,26 @@ def pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelengt
 
     print(f"plotting {plotfile} ... ")
     # display attenuate backscatter
-    fig = plt.figure(figsize=[12, 6])
-    ax = fig.add_axes([0.11, 0.15, 0.79, 0.75])
-    pcmesh = ax.imshow(
-            RCS_matrix / 1e6,
-            cmap=cmap,
-            vmin=zLim[0],
-            vmax=zLim[1],
-            interpolation='none',
-            aspect='auto',
-            extent=extent,
-            )
-    # convert the datetime data from a float (which is the output of date2num into a nice datetime string.
-    ax.xaxis_date()
-
-    ax.set_xlabel('Time [UTC]', fontsize=15)
-    ax.set_ylabel('Height [km]', fontsize=15)
-
-    ax.xaxis.set_minor_locator(HourLocator(interval=1))    # every hour
-    if config_dict['flagPlotLastProfilesOnly'] == True:
-        ax.xaxis.set_major_locator(HourLocator(interval=2))
-    else:
-        ax.xaxis.set_major_locator(HourLocator(byhour = [4,8,12,16,20,24]))
-
-    ax.xaxis.set_major_formatter(DateFormatter('%H:%M'))
-#    
-    ax.tick_params(
-        axis='both', which='major', labelsize=15, right=True,
-        top=True, width=2, length=5)
-    ax.tick_params(
-        axis='both', which='minor', width=1.5, length=3.5,
-        right=True, top=True)
-
-    ax.set_title(
-        'Range Corrected Signal at {wave} nm'.format(wave = wavelength) +
-        ' {param} of {instrument} at {location}'.format(
-            param=param,
-            instrument=pollyVersion,
-            location=location),
-        fontsize=15)
-
-    cb_ax = fig.add_axes([0.92, 0.25, 0.02, 0.55])
-    cbar = fig.colorbar(
-        pcmesh,
-        cax=cb_ax,
-        ticks=np.linspace(zLim[0], zLim[1], 5),
-        orientation='vertical')
-    cbar.ax.tick_params(direction='in', labelsize=15, pad=5)
-#    cbar.ax.set_title('      $Mm^{-1}*sr^{-1}$\n', fontsize=10)
-    cbar.ax.set_title('a.u.', fontsize=10)
-
-
-    # add watermark
-    if flagWatermarkOn:
-        #rootDir = os.getcwd()
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
-
-        newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
-        newax_license.imshow(im_license, alpha=0.8, aspect='equal')
-        newax_license.axis('off')
-
-        fig.text(0.72, 0.003, 'Preliminary\nResults.',
-                 fontweight='bold', fontsize=12, color='red',
-                 ha='left', va='bottom', alpha=0.8, zorder=10)
-
-        fig.text(
-            0.84, 0.003,
-            u"\u00A9 {1} {0}.\nCC BY SA 4.0 License.".format(
-                datetime.now().strftime('%Y'), partnerLabel),
-            fontweight='bold', fontsize=7, color='black', ha='left',
-            va='bottom', alpha=1, zorder=10)
-
-    fig.text(
-        0.05, 0.02,
-        '{0}'.format(nc_dict['m_date']), fontsize=12)
-
-    fig.text(
-        0.2, 0.02,
-        'Version: {version}'.format(
-            version=version),
-        fontsize=12)
-
-    fig.savefig(saveFilename,dpi=figDPI)
-
-    plt.close()
+    template = get_time_height_figure(config_dict, partnerLabel)
+    template.plot(
+        RCS_matrix / 1e6,
+        cmap=cmap,
+        zLim=zLim,
+        extent=extent,
+        title='Range Corrected Signal at {wave} nm'.format(wave = wavelength) +
+            ' {param} of {instrument} at {location}'.format(
+                param=param,
+                instrument=pollyVersion,
+                location=location),
+        cbar_title='a.u.',
+        footer=[
+            '{0}'.format(nc_dict['m_date']),
+            'Version: {version}'.format(
+                version=version),
+            ],
+        saveFilename=saveFilename,
+        figDPI=figDPI,
+        increment=readout.get_time_increment(nc_dict))
 
     
 
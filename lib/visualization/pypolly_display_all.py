@@ -1,42 +1,40 @@
-import matplotlib.pyplot as plt
-from matplotlib.colors import ListedColormap, LogNorm
-from matplotlib.ticker import MultipleLocator, FormatStrFormatter
-from matplotlib.dates import DateFormatter, \
-                             DayLocator, HourLocator, MinuteLocator, date2num
-#import matplotlib.dates as dates
 import os
 import re
 import sys
 import time
-import scipy.io as spio
-import numpy as np
-import json
-from datetime import datetime, timedelta
-import matplotlib
-import pandas as pd
 import argparse
-import statistics
+import importlib
+from datetime import datetime, timedelta
 from pathlib import Path
-from statistics import mode
-import pypolly_readout as readout
-import pypolly_display_3d_plots as display_3d
-import pypolly_profile_translator as p_translator
-import pypolly_display_profiles as display_profiles
+import pypolly_instrumentation as instrumentation
 
-# load colormap
 dirname = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-print(dirname)
 sys.path.append(dirname)
-try:
-    from python_colormap import *
-except Exception as e:
-    raise ImportError('python_colormap module is necessary.')
 
 import logging
 logging.basicConfig(level=logging.WARNING)
 
-# generating figure without X server
-plt.switch_backend('Agg')
+## numpy, netCDF4, matplotlib, pandas and the pypolly modules are imported in main(),
+## only for the retrievals given with --retrieval (see retrieval_modules)
+base_modules = ['numpy', 'netCDF4', 'pypolly_readout', 'pypolly_scheduler']
+display_3d_modules = ['matplotlib.pyplot', 'PIL.Image', 'pypolly_display_3d_plots']
+display_profiles_modules = ['matplotlib.pyplot', 'pandas', 'pypolly_profile_translator', 'pypolly_display_profiles']
+retrieval_modules = {
+    'RCS': display_3d_modules,
+    'cloudinfo': display_3d_modules,
+    'attbsc': display_3d_modules,
+    'voldepol': display_3d_modules,
+    'wvmr_rh': display_3d_modules,
+    'target_class': display_3d_modules,
+    'quasi_results': display_3d_modules,
+    'overlap': display_3d_modules,
+    'profiles': display_profiles_modules,
+    'poliphon': display_profiles_modules,
+    'LC': display_profiles_modules,
+    'longterm_cali': display_profiles_modules,
+    'HKD': display_profiles_modules,
+    'profile_summary': display_profiles_modules,
+}
 
 my_parser = argparse.ArgumentParser(description='Plotting all diagrams from level1-nc-file.')
 
@@ -44,9 +42,18 @@ my_parser = argparse.ArgumentParser(description='Plotting all diagrams from leve
 my_parser.add_argument('--date', dest='timestamp', metavar='timestamp',
                        type=str,
                        help='the date of measurement (level1 nc-file): YYYYMMDD.')
+my_parser.add_argument('--start-date', dest='start_date', metavar='YYYYMMDD',
+                       type=str,
+                       default=None,
+                       help='plot every day from start-date to end-date, instead of --date.')
+my_parser.add_argument('--end-date', dest='end_date', metavar='YYYYMMDD',
+                       type=str,
+                       default=None,
+                       help='last day to plot with --start-date. Default is start-date.')
 my_parser.add_argument('--device', dest='device', metavar='device',
                        type=str,
-                       help='the polly device (level1 nc-file).')
+                       nargs='+',
+                       help='the polly device(s) (level1 nc-file).')
 my_parser.add_argument('--base_dir', dest='base_dir',
                        type=str,
                        default='/data/level0/polly',
@@ -71,11 +78,52 @@ my_parser.add_argument('--donefilelist', dest='donefilelist',
                        type=str,
                        default = 'false',
                        help='write list of plotted filenames into donefilelist, specified in the picasso-config. Default is False.')
+my_parser.add_argument('--jobs', dest='jobs', metavar='N',
+                       type=int,
+                       default=1,
+                       help='number of processes to render the plots with. Default is 1 (sequential).')
+my_parser.add_argument('--retries', dest='retries', metavar='N',
+                       type=int,
+                       default=0,
+                       help='number of times a failed plotting task is run again. Default is 0.')
+my_parser.add_argument('--timing_log', dest='timing_log', metavar='folder',
+                       type=str,
+                       default=None,
+                       help='write wall time, CPU time and peak RSS of every stage (nc_read, gap_fill, figure, savefig, donefile) as JSON lines to pypolly_timing_YYYYMMDD.jsonl in this folder; "outdir" writes it next to the png files. Default: no timing log.')
+my_parser.add_argument('--fast_render', dest='fast_render',
+                       action='store_true',
+                       help='write the png files of the time-height plots with the direct raster renderer instead of savefig (faster for batch reprocessing, visually equivalent, larger files).')
+my_parser.add_argument('--incremental', dest='incremental',
+                       action='store_true',
+                       help='near-real-time mode: update the time-height plots of a growing nc-file with its new profiles only (the time axis of flagPlotLastProfilesOnly ends at the next full hour); plots without new profiles are not rewritten.')
+my_parser.add_argument('--force', dest='force',
+                       action='store_true',
+                       help='render all plots. By default, plots whose inputs (nc-file, configs, plotting code) have not changed since the last run are skipped, see the .pypolly_manifest.json of the output folders.')
+my_parser.add_argument('--profile-imports', dest='profile_imports',
+                       action='store_true',
+                       help='print the import time of every module loaded for the requested retrievals.')
 
 # init parser
 args = my_parser.parse_args()
 
 
+def import_modules(module_names):
+    ## import the modules not imported yet, the import time of each one is recorded as stage 'import'
+    for module_name in module_names:
+        if module_name in sys.modules:
+            continue
+        with instrumentation.stage('import', module=module_name):
+            importlib.import_module(module_name)
+
+
+def print_import_times():
+    import_records = [ record for record in instrumentation.records if record['stage'] == 'import' ]
+    print('import times:')
+    for record in import_records:
+        print(f"  {record['module']:<32s} {record['wall_s']:8.3f} s")
+    print(f"  {'total':<32s} {sum(record['wall_s'] for record in import_records):8.3f} s")
+
+
 #def read_excel_config_file(excel_file, timestamp, device):
 #    pd.set_option('display.width', 1500)
 #    pd.set_option('display.max_columns', None)
@@ -115,10 +163,84 @@ args = my_parser.parse_args()
 #    return config_json
 
 
+def get_dates():
+    ## --date, or every day from --start-date to --end-date
+    if args.start_date:
+        start_date = datetime.strptime(args.start_date, '%Y%m%d')
+        end_date = datetime.strptime(args.end_date if args.end_date else args.start_date, '%Y%m%d')
+        return [ (start_date + timedelta(days=n)).strftime('%Y%m%d') for n in range((end_date - start_date).days + 1) ]
+    return [args.timestamp]
+
+
+def get_polly_conf(config_dict, globalconf_dict, device, date, polly_conf_cache):
+    """
+    Description
+    -----------
+    Find the polly config of device at date and merge it with the global polly config.
+    Every local polly config file is read and merged only once (polly_conf_cache).
+
+    Returns
+    -------
+    polly_conf_dict: dict
+        the merged polly config.
+    location: str
+        the location of the device, from the excel config file.
+
+    Raises
+    ------
+    ValueError
+        if the excel config file has no config for device at date (see readout.read_excel_config_file);
+        main then logs it and reports no plots for device and date.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    import pypolly_readout as readout
+
+    if args.polly_config_file:
+        polly_local_config_file = args.polly_config_file
+        location = ''
+    else:
+        polly_local_config_file, device, location = readout.read_excel_config_file(config_dict['pollynet_config_link_file'], timestamp=date, device=device)
+
+    polly_local_config = Path(config_dict['polly_config_folder'],polly_local_config_file)
+    print(polly_local_config_file,device,location)
+
+    if polly_local_config not in polly_conf_cache:
+        localconf_dict = readout.read_local_conf(polly_local_config)
+        polly_conf_dict = globalconf_dict.copy()
+
+        ## use local polly config settings, instead of global ones:
+        for key in globalconf_dict:
+            if key in localconf_dict:
+                polly_conf_dict[key] = localconf_dict[key]
+        polly_conf_cache[polly_local_config] = polly_conf_dict
+
+    return polly_conf_cache[polly_local_config], location
+
+
 def main():
 
     ## measure computing time
     t0 = time.process_time()
+    t0_wall = time.perf_counter()
+
+    if not args.timestamp and not args.start_date:
+        my_parser.error('either --date or --start-date is required.')
+
+    ## 'profiles' is not part of 'all'
+    retrievals = args.retrieval
+    if 'all' in retrievals:
+        retrievals = [ r for r in retrieval_modules if r != 'profiles' ] + retrievals
+    import_modules(base_modules)
+    for retrieval in retrievals:
+        import_modules(retrieval_modules.get(retrieval, []))
+    import pypolly_readout as readout
+    import pypolly_scheduler as scheduler
+    import pypolly_products as products
+    if args.profile_imports:
+        print_import_times()
 
     write2donefile = args.donefilelist
     if write2donefile.lower() == "true":
@@ -126,407 +248,96 @@ def main():
     elif write2donefile.lower() == "false":
         write2donefile = False
 
+    ## the picasso config and the global polly config are read once for all devices and dates
     picasso_config_file = args.picasso_config_file
     config_dict = readout.read_config(picasso_config_file)
-    excel_config_file = config_dict['pollynet_config_link_file']
-    polly_config_folder = config_dict['polly_config_folder']
-    if args.polly_config_file:
-        polly_local_config_file = args.polly_config_file
-    else:
-        polly_local_config_file, device, location = readout.read_excel_config_file(excel_config_file, timestamp=args.timestamp, device=args.device)
-
-    polly_local_config = Path(polly_config_folder,polly_local_config_file)
-    print(polly_local_config_file,device,location)
-
-
+    if args.fast_render:
+        config_dict['flagFastRender'] = True
+    if args.incremental:
+        config_dict['flagIncremental'] = True
     pollyglobal = config_dict['polly_global_config']
-    
-    
     globalconf_dict = readout.read_global_conf(pollyglobal)
-    localconf_dict = readout.read_local_conf(polly_local_config)
-    polly_conf_dict = globalconf_dict.copy()
-
-    ## use local polly config settings, instead of global ones:
-    for key in globalconf_dict:
-        if key in localconf_dict:
-            polly_conf_dict[key] = localconf_dict[key]
-
+    polly_conf_cache = {}
 
-    date = args.timestamp
-    device = args.device
-
-    inputfolder = config_dict['results_folder']
-    outputfolder = args.outdir
-    YYYY = date[0:4]
-    MM = date[4:6]
-    DD = date[6:8]
-    if outputfolder == 'read_from_picasso_config':
-        outputfolder = Path(config_dict['pic_folder'],device,YYYY,MM,DD)
-    else:
-        outputfolder = Path(args.outdir,device,YYYY,MM,DD)
-
-    #creating a new directory if not existing
-    Path(outputfolder).mkdir(parents=True, exist_ok=True)
-
-    donefilelist_dict = {}
-
-
-    print('retrievals to plot: '+ str(args.retrieval))
-
-    if ('all' in args.retrieval) or ('RCS' in args.retrieval):
-    ## plotting RCS plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='RCS')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                param_ls = ['RCS_FR_355nm', 'RCS_FR_cross_355nm', 'RCS_NR_355nm', 'RCS_RR_355nm', 'RCS_FR_387nm', 'RCS_NR_387nm', 'RCS_FR_407nm', 'RCS_NR_407nm', 'RCS_FR_532nm', 'RCS_FR_cross_532nm','RCS_FR_parallel_532nm', 'RCS_NR_532nm', 'RCS_NR_cross_532nm', 'RCS_RR_532nm', 'RCS_FR_607nm', 'RCS_NR_607nm', 'RCS_FR_1064nm', 'RCS_FR_cross_1064nm', 'RCS_RR_1064nm']
-                for p in param_ls:
-                    p1 = re.split(r'RCS_',p)[1]
-                    param = re.split(r'_[1-9].*nm',p1)[0]
-                    wavelength = re.split(f'{param}_',p1)[-1]
-                    wavelength = re.split(r'nm',wavelength)[0]
-
-                    if np.all(nc_dict[p].mask): ## do not plot empty/non-existing channels
-                        continue
-                    else:
-                        print(f'plotting {p}')
-                        display_3d.pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=wavelength,param=param,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('cloudinfo' in args.retrieval):
-        ## plotting ATT_BETA_FR plots + cloudinfo
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='att_bsc')
-            #cloud_file = f'{dataFilenameFolder}_cloudinfo.nc'
-            cloud_files = readout.get_nc_filename(date, device, inputfolder, param='cloudinfo')
-            for n in range(len(nc_files)):
-                nc_dict = readout.read_nc_file(nc_files[n],date,device,location)
-                nc_dict_cloudinfo = readout.read_nc_file(cloud_files[n],date,device,location)
-                print('plotting ATT_BETA_1064nm + cloudinfo:')
-                display_3d.pollyDisplayATT_BSC_cloudinfo(nc_dict, nc_dict_cloudinfo, config_dict, polly_conf_dict, outputfolder, wavelength=1064,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-
-    if ('all' in args.retrieval) or ('attbsc' in args.retrieval):
-        ## plotting ATT_BETA_FR plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='att_bsc')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting ATT_BETA_355nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=355, param='FR',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_532nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=532, param='FR',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_1064nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=1064, param='FR',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-        ## plotting ATT_BETA_NR plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='NR_att_bsc')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting ATT_BETA_NR_355nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=355, param='NR',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_NR_532nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=532, param='NR',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-    
-        ## plotting ATT_BETA_OC plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='OC_att_bsc')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting ATT_BETA_OC_355nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=355, param='OC',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_OC_532nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=532, param='OC',donefilelist_dict=donefilelist_dict)
-                print('plotting ATT_BETA_OC_1064nm:')
-                display_3d.pollyDisplayAttnBsc(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=1064, param='OC',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('voldepol' in args.retrieval):
-    ## plotting VolDepol plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='vol_depol')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting VDR_355nm:')
-                display_3d.pollyDisplayVDR(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=355,donefilelist_dict=donefilelist_dict)
-                print('plotting VDR_532nm:')
-                display_3d.pollyDisplayVDR(nc_dict, config_dict, polly_conf_dict, outputfolder, wavelength=532,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-    
-    if ('all' in args.retrieval) or ('wvmr_rh' in args.retrieval):
-    ## plotting WVMR_RH plots
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='WVMR_RH')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting WVMR:')
-                display_3d.pollyDisplayWVMR(nc_dict, config_dict, polly_conf_dict, outputfolder,donefilelist_dict=donefilelist_dict)
-                print('plotting RH:')
-                display_3d.pollyDisplayRH(nc_dict, config_dict, polly_conf_dict, outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('target_class' in args.retrieval):
-    ## plotting Target classification V1 
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='target_classification')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting Target classification V1:')
-                display_3d.pollyDisplayTargetClass(nc_dict, config_dict, polly_conf_dict, outputfolder,c_version='V1',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-           logging.exception("An error occurred") 
-    ## plotting Target classification V2 
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='target_classification_V2')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting Target classification V2:')
-                display_3d.pollyDisplayTargetClass(nc_dict, config_dict, polly_conf_dict, outputfolder,c_version='V2',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-           logging.exception("An error occurred") 
-    if ('all' in args.retrieval) or ('quasi_results' in args.retrieval):
-    ## plotting Quasi results V1
-        try:
-            q_params_ls = ["angexp", "bsc_532", "bsc_1064", "par_depol_532"] 
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='quasi_results')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                for qp in q_params_ls:
-                    display_3d.pollyDisplayQR(nc_dict, config_dict, polly_conf_dict, outputfolder,q_param=qp, q_version='V1',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred") 
-    ## plotting Quasi results V2
-        try: 
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='quasi_results_V2')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                for qp in q_params_ls:
-                    display_3d.pollyDisplayQR(nc_dict, config_dict, polly_conf_dict, outputfolder, q_param=qp, q_version='V2',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred") 
-    
-    if ('profiles' in args.retrieval):
-        ## plotting profiles
-        ## using profile_translator
-
-        profile_translator = p_translator.profile_translator_function()
-        NR_profile_translator = p_translator.NR_profile_translator_function()
-        OC_profile_translator = p_translator.OC_profile_translator_function()
-        POLIPHON_profile_translator = p_translator.POLIPHON_profile_translator_function()
-
-        try:
-            nc_profiles = readout.get_nc_filename(date, device, inputfolder, param='profiles')
-            nc_profiles_NR = readout.get_nc_filename(date, device, inputfolder, param='NR_profiles')
-            nc_profiles_OC = readout.get_nc_filename(date, device, inputfolder, param='OC_profiles')
-            nc_profiles_POLIPHON = readout.get_nc_filename(date, device, inputfolder, param='POLIPHON_1')
-            print(f'plotting profiles to {outputfolder}')
-            for profile in nc_profiles:
-                nc_dict_profile = readout.read_nc_file(profile,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile['end_time'])).strftime('%H:%M')
-                print(f"profile: {starttime} - {endtime}")
-                nc_dict_profile = readout.calc_ANGEXP(nc_dict_profile)
-                for profilename in profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile,profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-            for NR_profile in nc_profiles_NR:
-                nc_dict_profile_NR = readout.read_nc_file(NR_profile,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile_NR['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile_NR['end_time'])).strftime('%H:%M')
-                print(f"NR-profile: {starttime} - {endtime}")
-                nc_dict_profile_NR = readout.calc_ANGEXP(nc_dict_profile_NR)
-                for profilename in NR_profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile_NR,NR_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-            for OC_profile in nc_profiles_OC:
-                nc_dict_profile_OC = readout.read_nc_file(OC_profile,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile_OC['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile_OC['end_time'])).strftime('%H:%M')
-                print(f"OC-profile: {starttime} - {endtime}")
-                nc_dict_profile_OC = readout.calc_ANGEXP(nc_dict_profile_OC)
-                for profilename in OC_profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile_OC,OC_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-            for POLIPHON in nc_profiles_POLIPHON:
-                nc_dict_profile_POLI = readout.read_nc_file(POLIPHON,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile_POLI['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile_POLI['end_time'])).strftime('%H:%M')
-                print(f"POLIPHON-profile: {starttime} - {endtime}")
-                for profilename in POLIPHON_profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile_POLI,POLIPHON_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('poliphon' in args.retrieval):
-        ## plotting profiles
-        ## using profile_translator
-
-        POLIPHON_profile_translator = p_translator.POLIPHON_profile_translator_function()
-
-        try:
-            nc_profiles_POLIPHON = readout.get_nc_filename(date, device, inputfolder, param='POLIPHON_1')
-            print(f'plotting profiles to {outputfolder}')
-            for POLIPHON in nc_profiles_POLIPHON:
-                nc_dict_profile_POLI = readout.read_nc_file(POLIPHON,date,device,location)
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile_POLI['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile_POLI['end_time'])).strftime('%H:%M')
-                print(f"POLIPHON-profile: {starttime} - {endtime}")
-                for profilename in POLIPHON_profile_translator.keys():
-                    print(f"{profilename}")
-                    display_profiles.pollyDisplay_profile(nc_dict_profile_POLI,POLIPHON_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-    ## add plotted files to donefile
-    if write2donefile == True:
-        print('Write image files to donefile...')
-        readout.write2donefile(picassoconfigfile_dict=config_dict,donefilelist_dict=donefilelist_dict)
+    if args.outdir == 'read_from_picasso_config':
+        outputbase = Path(config_dict['pic_folder'])
     else:
-        pass
-    
-    if ('all' in args.retrieval) or ('overlap' in args.retrieval):
-        ## plotting overlap 
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='overlap')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting overlap:')
-                display_3d.pollyDisplay_Overlap(nc_dict, config_dict, polly_conf_dict, outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('LC' in args.retrieval):
-        ## plotting Lidar constants from db-file
-        try:
-            base_dir = Path(config_dict['results_folder'])
-            db_path = base_dir.joinpath(device,polly_conf_dict['calibrationDB'])
-            LC = {}
-            LC['LC355'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='355',method='Method',telescope='far')
-            LC['LC532'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='532',method='Method',telescope='far')
-            LC['LC1064'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='1064',method='Method',telescope='far')
-        except Exception as e:
-            logging.exception("An error occurred")
-
-        calib_profile_translator = p_translator.calib_profile_translator_function()
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='overlap')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting LidarCalibrationConstants:')
-                for profilename in calib_profile_translator.keys():
-                    display_profiles.pollyDisplay_calibration_constants(nc_dict,LC[profilename],calib_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-    if ('all' in args.retrieval) or ('longterm_cali' in args.retrieval):
-        ## plotting Lidar constants from db-file
-        try:
-            base_dir = Path(config_dict['results_folder'])
-            db_path = base_dir.joinpath(device,polly_conf_dict['calibrationDB'])
-            logbookFile_path = base_dir.joinpath(device,polly_conf_dict['logbookFile'])
-            print(logbookFile_path)
-            logbookFile_df = readout.read_from_logbookFile(logbookFile_path=str(logbookFile_path))
-            LC = {}
-            ETA={}
-            LC['LC355'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='355',method='Klett',telescope='far')
-            LC['LC532'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='532',method='Klett',telescope='far')
-            LC['LC1064'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength='1064',method='Klett',telescope='far')
-            ETA['ETA355'] = readout.get_depol_from_sql_db(db_path=str(db_path),table_name='depol_calibration_constant',wavelength='355')
-            ETA['ETA532'] = readout.get_depol_from_sql_db(db_path=str(db_path),table_name='depol_calibration_constant',wavelength='532')
-            ETA['ETA1064'] = readout.get_depol_from_sql_db(db_path=str(db_path),table_name='depol_calibration_constant',wavelength='1064')
-        except Exception as e:
-            logging.exception("An error occurred")
-        calib_profile_translator = p_translator.calib_profile_translator_function()
-        profilename='longterm_LC'
-        try:
-            nc_files = readout.get_nc_filename(date, device, inputfolder, param='overlap')
-            for data_file in nc_files:
-                nc_dict = readout.read_nc_file(data_file,date,device,location)
-                print('plotting LongTermCalibration:')
-                display_profiles.pollyDisplay_longtermcalibration(nc_dict,logbookFile_df,LC,ETA,calib_profile_translator,profilename,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
-    if ('all' in args.retrieval) or ('HKD' in args.retrieval):
-         try:
-             laserlogbook = readout.get_pollyxt_logbook_files(date,device,args.base_dir,outputfolder)
-             print(laserlogbook)
-             laserlogbook_df = readout.read_pollyxt_logbook_file(laserlogbook)
-             nc_files = readout.get_nc_filename(date, device, inputfolder, param='overlap')
-             for data_file in nc_files:
-                 nc_dict = readout.read_nc_file(data_file,date,device,location)
-                 display_profiles.pollyDisplay_HKD(laserlogbook_df,nc_dict,config_dict,polly_conf_dict,outputfolder,donefilelist_dict=donefilelist_dict)
-         except Exception as e:
-             logging.exception("An error occurred")
-    if ('all' in args.retrieval) or ('profile_summary' in args.retrieval):
-        ## plotting profiles
-        ## using profile_translator
-
-        #profile_translator = p_translator.profile_translator_function()
-
-        try:
-            nc_profiles = readout.get_nc_filename(date, device, inputfolder, param='profiles')
-            nc_profiles_NR = readout.get_nc_filename(date, device, inputfolder, param='NR_profiles')
-            nc_profiles_QC = readout.get_nc_filename(date, device, inputfolder, param='profiles_QC')
-            print(f'plotting profile summary to {outputfolder}')
-            #for prof in nc_profiles:
-            #    nc_dict_profile = readout.read_nc_file(prof)
-            #    starttime=datetime.utcfromtimestamp(int(nc_dict_profile['start_time'])).strftime('%H:%M')
-            #    endtime=datetime.utcfromtimestamp(int(nc_dict_profile['end_time'])).strftime('%H:%M')
-            #    print(f"profile: {starttime} - {endtime}")
-            #    nc_dict_profile = readout.calc_ANGEXP(nc_dict_profile)
-            #    display_profiles.pollyDisplay_profile_summary(nc_dict_profile,profile,config_dict,polly_conf_dict,outputfolder,donefilelist_dict)
-            for n_prof in range(len(nc_profiles)):
-                nc_dict_profile = readout.read_nc_file(nc_profiles[n_prof],date,device,location)
-                if len(nc_profiles_NR) > 0:
-                    nc_dict_profile_NR = readout.read_nc_file(nc_profiles_NR[n_prof],date,device,location)
-                else:
-                    nc_dict_profile_NR = {}
-                if len(nc_profiles_QC) > 0:
-                    nc_dict_profile_QC = readout.read_nc_file(nc_profiles_QC[n_prof],date,device,location)
-                    nc_dict_profile_QC = readout.calc_ANGEXP(nc_dict_profile_QC)
-                else:
-                    nc_dict_profile_QC = {}
-
-                starttime=datetime.utcfromtimestamp(int(nc_dict_profile['start_time'])).strftime('%H:%M')
-                endtime=datetime.utcfromtimestamp(int(nc_dict_profile['end_time'])).strftime('%H:%M')
-                print(f"profile: {starttime} - {endtime}")
-                nc_dict_profile = readout.calc_ANGEXP(nc_dict_profile)
-                print(f"QC-profiles")
-                display_profiles.pollyDisplay_profile_summary_QC(nc_dict_profile=nc_dict_profile_QC,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,ymax='high_range',donefilelist_dict=donefilelist_dict)
-                display_profiles.pollyDisplay_profile_summary_QC(nc_dict_profile=nc_dict_profile_QC,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,ymax='low_range',donefilelist_dict=donefilelist_dict)
-                print(f"Raman-profiles")
-                display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='raman',ymax='high_range',donefilelist_dict=donefilelist_dict)
-                display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='raman',ymax='low_range',donefilelist_dict=donefilelist_dict)
-                print(f"Klett-profiles")
-                display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='klett',ymax='high_range',donefilelist_dict=donefilelist_dict)
-                display_profiles.pollyDisplay_profile_summary(nc_dict_profile=nc_dict_profile,nc_dict_profile_NR=nc_dict_profile_NR,config_dict=config_dict,polly_conf_dict=polly_conf_dict,outdir=outputfolder,method='klett',ymax='low_range',donefilelist_dict=donefilelist_dict)
-        except Exception as e:
-            logging.exception("An error occurred")
-
+        outputbase = Path(args.outdir)
+
+    dates = get_dates()
+
+    ## the tasks of every (device, date) are collected first and then run together,
+    ## so that the process pool (--jobs) is shared by all devices and dates
+    task_groups = []
+    outputfolders = []
+    reports = []
+    failed = []
+    for device in args.device:
+        for date in dates:
+            try:
+                polly_conf_dict, location = get_polly_conf(config_dict, globalconf_dict, device, date, polly_conf_cache)
+
+                YYYY = date[0:4]
+                MM = date[4:6]
+                DD = date[6:8]
+                outputfolder = Path(outputbase,device,YYYY,MM,DD)
+
+                #creating a new directory if not existing
+                Path(outputfolder).mkdir(parents=True, exist_ok=True)
+
+                context = dict(date=date, device=device, config_dict=config_dict, polly_conf_dict=polly_conf_dict, outputfolder=outputfolder, base_dir=args.base_dir)
+                group_reports = products.resolve_tasks(args.retrieval, context)
+            except Exception as e:
+                logging.exception(f"An error occurred for {device} {date}")
+                failed.append((device, date))
+                continue
+            reports.extend(group_reports)
+            tasks = [ task for report in group_reports for task in report['tasks'] ]
+            task_groups.append((tasks, date, device, location))
+            outputfolders.append(outputfolder)
+
+    ## run all tasks, sequentially or on a process pool (--jobs)
+    donefilelist_dicts = scheduler.run_task_groups(task_groups, jobs=args.jobs, skip_unchanged=not args.force, retries=args.retries)
 
     ## add plotted files to donefile
     if write2donefile == True:
         print('Write image files to donefile...')
-        readout.write2donefile(picassoconfigfile_dict=config_dict,donefilelist_dict=donefilelist_dict)
+        for (tasks, date, device, location), donefilelist_dict in zip(task_groups, donefilelist_dicts):
+            with instrumentation.stage('donefile', device=device, date=date):
+                readout.write2donefile(picassoconfigfile_dict=config_dict,donefilelist_dict=donefilelist_dict)
     else:
         pass
 
 
+    ## status of every product
+    n_failed = products.print_status_table(reports)
+
     ## measure computing time
     elapsed_time = time.process_time() - t0
     print(elapsed_time)
+
+    ## write timing of all stages
+    if args.timing_log:
+        if args.timing_log != 'outdir':
+            timing_folder = Path(args.timing_log)
+        elif len(outputfolders) == 1:
+            timing_folder = outputfolders[0]
+        else:
+            timing_folder = outputbase
+        Path(timing_folder).mkdir(parents=True, exist_ok=True)
+        date_range = dates[0] if len(dates) == 1 else f'{dates[0]}-{dates[-1]}'
+        timing_file = Path(timing_folder, f'pypolly_timing_{date_range}.jsonl')
+        instrumentation.records.append({'stage': 'total', 'pid': os.getpid(), 'parent': None, 'device': ','.join(args.device), 'date': date_range, 'wall_s': round(time.perf_counter() - t0_wall, 6), 'cpu_s': round(elapsed_time, 6)})
+        instrumentation.write_records(timing_file, instrumentation.records)
+        print(f'timing written to {timing_file}')
     print('finished plotting!')
+    if failed:
+        print('no plots for: ' + ', '.join(f'{device} {date}' for device, date in failed))
+    if n_failed > 0:
+        print(f'{n_failed} plotting tasks or products failed or were not runnable')
+    ## non-zero exit code for cron and the shell wrappers
+    if failed or n_failed > 0:
+        sys.exit(1)
 if __name__ == '__main__':
     main()
 
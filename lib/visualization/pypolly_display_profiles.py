@@ -8,7 +8,6 @@ import os
 import re
 import sys
 import time
-import scipy.io as spio
 import numpy as np
 from datetime import datetime, timedelta, timezone
 import matplotlib
@@ -19,6 +18,7 @@ from pathlib import Path
 import argparse
 #import pypolly_readout_profiles as readout_profiles
 import pypolly_readout as readout
+import pypolly_instrumentation as instrumentation
 import statistics
 import pandas as pd
 from statistics import mode
@@ -159,11 +159,7 @@ def pollyDisplay_profile(nc_dict_profile,profile_translator,profilename,config_d
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        #rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = readout.get_license_image()
 
         newax_license = fig.add_axes([0.33, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -282,7 +278,8 @@ refH1064: {refHBase1064:.1f}-{refHTop1064:.1f} km',
             r'LR$_{532}$: '+f'{fixed_LR_ls[1]:.2f}\n'+\
             r'LR$_{1064}$: '+f'{fixed_LR_ls[2]:.2f}',fontsize=11, backgroundcolor=[0.94, 0.95, 0.96, 0.8], alpha=1)
 
-    fig.savefig(saveFilename,dpi=figDPI)
+    with instrumentation.stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename,dpi=figDPI)
 
     plt.close()
 
@@ -418,10 +415,7 @@ def pollyDisplay_calibration_constants(nc_dict,dataframe,profile_calib_translato
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = readout.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -441,7 +435,8 @@ def pollyDisplay_calibration_constants(nc_dict,dataframe,profile_calib_translato
         fig.text(
             0.2, 0.02,
             f'{nc_dict["m_date"]}\nVersion: {version}',fontsize=12)
-    fig.savefig(saveFilename,dpi=figDPI)
+    with instrumentation.stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename,dpi=figDPI)
 
     plt.close()
 
@@ -619,10 +614,7 @@ def pollyDisplay_longtermcalibration(nc_dict,logbook_dataframe,LC_sql_dataframe,
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = readout.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -643,7 +635,8 @@ def pollyDisplay_longtermcalibration(nc_dict,logbook_dataframe,LC_sql_dataframe,
             0.2, 0.02,
             f'Version: {version}',fontsize=12)
 
-    fig.savefig(saveFilename,dpi=figDPI)
+    with instrumentation.stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename,dpi=figDPI)
 
     plt.close()
 
@@ -791,10 +784,7 @@ def pollyDisplay_HKD(laserlogbook_df,nc_dict,config_dict,polly_conf_dict,outdir,
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = readout.get_license_image()
 
         newax_license = fig.add_axes([0.58, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -814,7 +804,8 @@ def pollyDisplay_HKD(laserlogbook_df,nc_dict,config_dict,polly_conf_dict,outdir,
         fig.text(
             0.2, 0.02,
             f'{nc_dict["m_date"]}\nVersion: {version}',fontsize=12)
-    fig.savefig(saveFilename,dpi=figDPI)
+    with instrumentation.stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename,dpi=figDPI)
 
     plt.close()
 
@@ -1192,11 +1183,7 @@ def pollyDisplay_profile_summary(nc_dict_profile,nc_dict_profile_NR,config_dict,
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        #rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = readout.get_license_image()
 
         newax_license = fig.add_axes([0.33, 0.006, 0.14, 0.07], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -1214,7 +1201,8 @@ def pollyDisplay_profile_summary(nc_dict_profile,nc_dict_profile_NR,config_dict,
             va='bottom', alpha=1, zorder=10)
 
     
-    fig.savefig(saveFilename, dpi=figDPI)
+    with instrumentation.stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename, dpi=figDPI)
     
     plt.close()
 
@@ -1510,11 +1498,7 @@ def pollyDisplay_profile_summary_QC(nc_dict_profile,config_dict,polly_conf_dict,
 
     # add watermark
     if flagWatermarkOn:
-        rootDir = os.path.dirname(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        #rootDir = os.getcwd()
-        im_license = matplotlib.image.imread(
-            os.path.join(rootDir, 'img', 'by-sa.png'))
+        im_license = readout.get_license_image()
 
         newax_license = fig.add_axes([0.33, 0.006, 0.08, 0.04], zorder=10)
         newax_license.imshow(im_license, alpha=0.8, aspect='equal')
@@ -1532,7 +1516,8 @@ def pollyDisplay_profile_summary_QC(nc_dict_profile,config_dict,polly_conf_dict,
             va='bottom', alpha=1, zorder=10)
 
     
-    fig.savefig(saveFilename, dpi=figDPI)
+    with instrumentation.stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename, dpi=figDPI)
     
     plt.close()
 
@@ -0,0 +1,196 @@
+import os
+import sys
+import time
+import fnmatch
+import importlib.util
+import socketserver
+import argparse
+import threading
+import matplotlib
+import matplotlib.pyplot as plt
+import logging
+logging.basicConfig(level=logging.WARNING)
+
+# generating figure without X server
+plt.switch_backend('Agg')
+
+## the display scripts define a function with the name of the script,
+## except for these ones
+display_function_names = {
+    'pollyDisplayPolCali': 'pollyxt_display_depolcali',
+}
+
+## only scripts of the folder of this module with these names are run, see resolve_display_script
+display_script_patterns = ['pollyDisplay*.py', '*_display*.py']
+
+_display_modules = {}
+
+
+def resolve_display_script(script):
+    """
+    Description
+    -----------
+    Full path of a display script. Only the display scripts in the folder of this
+    module (pollyDisplay*.py, *_display*.py, except the pypolly_* modules) are
+    accepted, as the server runs the scripts its clients send.
+
+    Parameters
+    ----------
+    script: str
+        name or path of the display script. Without folder, the script is
+        searched in the folder of this module.
+
+    Returns
+    -------
+    script: str
+        the resolved path (symbolic links followed).
+
+    Raises
+    ------
+    ValueError
+        if script is not a display script of the folder of this module.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    folder = os.path.dirname(os.path.realpath(__file__))
+    if not os.path.dirname(script):
+        script = os.path.join(folder, script)
+    script = os.path.realpath(script)
+    name = os.path.basename(script)
+    if os.path.normcase(os.path.dirname(script)) != os.path.normcase(folder) or name.startswith('pypolly_') or \
+            not any(fnmatch.fnmatchcase(name, pattern) for pattern in display_script_patterns):
+        raise ValueError(f'{script} is not a display script of {folder}.')
+    return script
+
+
+def get_display_function(script):
+    """
+    Description
+    -----------
+    Import a display script (e.g. pollyDisplayAttnBsc532FR.py) once per process
+    and return its display function, which takes (tmpFile, saveFolder).
+
+    Parameters
+    ----------
+    script: str
+        name or path of the display script, see resolve_display_script.
+
+    Usage
+    -----
+    get_display_function('pollyDisplayAttnBsc532FR.py')(tmpFile, saveFolder)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    script = resolve_display_script(script)
+    name = os.path.splitext(os.path.basename(script))[0]
+
+    if script not in _display_modules:
+        if not os.path.exists(script):
+            raise FileNotFoundError(f'{script} does not exist.')
+        spec = importlib.util.spec_from_file_location(name, script)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _display_modules[script] = module
+
+    return getattr(_display_modules[script], display_function_names.get(name, name))
+
+
+def run_display_job(script, tmpFile, saveFolder):
+    """
+    Description
+    -----------
+    Run one display script on one tmpFile in the current process.
+
+    Returns
+    -------
+    status: int
+        0 on success, 1 if the display script raised an error.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    try:
+        ## the display scripts change matplotlib.rcParams, which must not leak into the next job
+        with matplotlib.rc_context():
+            get_display_function(script)(tmpFile, saveFolder)
+        status = 0
+    except Exception as e:
+        logging.exception(f'An error occurred in {script}')
+        status = 1
+    finally:
+        ## figures of failed scripts are not closed by the scripts themselves
+        plt.close('all')
+    return status
+
+
+class DisplayJobHandler(socketserver.StreamRequestHandler):
+    """
+    Handle display jobs of one connection. Every job is one line:
+        script<TAB>tmpFile<TAB>saveFolder
+    and is answered with one line, containing the status (0: success).
+    Only the display scripts of the visualization folder are run
+    (see resolve_display_script).
+    The line 'shutdown' stops the server.
+    """
+    def handle(self):
+        for line in self.rfile:
+            line = line.decode('utf-8').rstrip('\r\n')
+            if not line:
+                continue
+            self.server.last_job = time.time()
+            if line == 'shutdown':
+                self.wfile.write(b'0\n')
+                threading.Thread(target=self.server.shutdown).start()
+                return
+            job = line.split('\t')
+            if len(job) != 3:
+                self.wfile.write(b'1 expected: script<TAB>tmpFile<TAB>saveFolder\n')
+                continue
+            try:
+                resolve_display_script(job[0])
+            except ValueError as e:
+                logging.warning(f'rejected job: {e}')
+                self.wfile.write(f'1 {e}\n'.encode('utf-8'))
+                self.wfile.flush()
+                continue
+            print(f'{job[0]} {job[1]} {job[2]}')
+            status = run_display_job(*job)
+            self.wfile.write(f'{status}\n'.encode('utf-8'))
+            self.wfile.flush()
+            self.server.last_job = time.time()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Plotting server for the display scripts called by Picasso (MATLAB). Keeps one python process with matplotlib loaded for all figures of a processing run.')
+    parser.add_argument('--port', dest='port', type=int, default=52301,
+                        help='local TCP port to listen on. Default is 52301.')
+    parser.add_argument('--idle_timeout', dest='idle_timeout', type=float, default=1800,
+                        help='stop the server after this many seconds without jobs; 0 to run forever. Default is 1800.')
+    args = parser.parse_args()
+
+    ## jobs are handled one after another, as pyplot is not thread-safe
+    server = socketserver.TCPServer(('127.0.0.1', args.port), DisplayJobHandler)
+    server.last_job = time.time()
+
+    if args.idle_timeout > 0:
+        def watch_idle():
+            while True:
+                time.sleep(min(args.idle_timeout, 10))
+                if time.time() - server.last_job > args.idle_timeout:
+                    print('idle timeout, stopping plotting server')
+                    server.shutdown()
+                    return
+        threading.Thread(target=watch_idle, daemon=True).start()
+
+    print(f'plotting server listening on 127.0.0.1:{args.port}')
+    with server:
+        server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+import os
+import json
+import glob
+import logging
+
+## the states of the plots of a folder are kept in this subfolder, one json file per plot
+state_folder_name = '.incremental'
+
+
+class IncrementalMismatch(Exception):
+    """
+    Raised by a plot, which was read incrementally (only the new profiles of the
+    nc-file), but cannot be updated: e.g. no state, a changed layout, zLim or text.
+    The plotting task is then run again with the complete nc-file.
+    """
+
+
+def state_file(saveFilename):
+    folder, filename = os.path.split(saveFilename)
+    return os.path.join(folder, state_folder_name, f'{filename}.json')
+
+
+def _load(filename):
+    try:
+        with open(filename, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_state(saveFilename):
+    ## state of the last rendering of saveFilename, None if there is none
+    return _load(state_file(saveFilename))
+
+
+def write_state(saveFilename, layout, increment):
+    """
+    Description
+    -----------
+    Remember the profiles rendered into saveFilename, its layout and the
+    size and modification time of the written file.
+
+    Parameters
+    ----------
+    layout: dict
+        everything the pixels outside the image columns depend on (json types only).
+    increment: dict
+        see pypolly_readout.get_time_increment.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    stat = os.stat(saveFilename)
+    state = {
+        'nc_file': increment['nc_file'],
+        'n_time': increment['n_time'],
+        'first_timestamp': increment['first_timestamp'],
+        'last_timestamp': increment['last_timestamp'],
+        'layout': layout,
+        'file_size': stat.st_size,
+        'file_mtime_ns': stat.st_mtime_ns,
+        }
+    filename = state_file(saveFilename)
+    tmp_file = f'{filename}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump(state, f)
+        os.replace(tmp_file, filename)
+    except OSError:
+        logging.warning(f'incremental state of {saveFilename} could not be written to {filename}.')
+
+
+def can_update(state, saveFilename, layout, increment):
+    """
+    Description
+    -----------
+    Check if the plot saveFilename of state can be updated with the profiles of increment:
+    same nc-file with the same first profiles, nothing of the plot except the new image
+    columns has changed, and the file on disk is the one written with state.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    if state is None:
+        return False
+    if state['nc_file'] != increment['nc_file'] or state['layout'] != layout:
+        return False
+    if state['first_timestamp'] != increment['first_timestamp']:
+        return False
+    ## all profiles behind the rendered ones have been read
+    n_time = state['n_time']
+    if not increment['time_start'] <= n_time <= increment['n_time']:
+        return False
+    if float(increment['time'][n_time - 1]) != state['last_timestamp']:
+        return False
+    try:
+        stat = os.stat(saveFilename)
+    except OSError:
+        return False
+    return stat.st_size == state['file_size'] and stat.st_mtime_ns == state['file_mtime_ns']
+
+
+def get_time_start(folder, nc_file):
+    """
+    Description
+    -----------
+    First profile of nc_file, which has to be read to update the plots of folder:
+    the last profile rendered into all of its plots so far. It is drawn again, as a
+    gap behind it moves it to a later column of the time grid (see readout.TimeGrid).
+    0, i.e. the complete nc-file, if no plot of nc_file has a state.
+
+    Usage
+    -----
+    time_start = get_time_start(saveFolder, nc_file)
+    nc_dict = readout.read_nc_file_cached(nc_file, date, device, location, time_start=time_start)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    n_times = []
+    for filename in glob.glob(os.path.join(folder, state_folder_name, '*.json')):
+        state = _load(filename)
+        if state is not None and state.get('nc_file') == os.path.basename(nc_file):
+            n_times.append(state['n_time'])
+    return max(min(n_times) - 1, 0) if n_times else 0
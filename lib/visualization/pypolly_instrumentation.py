@@ -0,0 +1,131 @@
+import os
+import time
+import json
+from contextlib import contextmanager
+try:
+    import resource
+except ImportError:
+    ## not available on Windows, peak RSS is not recorded there
+    resource = None
+
+## finished stages of the current process, see stage()
+records = []
+
+_labels = {}
+_open_stages = []
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    ## ru_maxrss is in kilobytes on Linux, in bytes on macOS
+    if os.uname().sysname == 'Darwin':
+        return maxrss / 1024**2
+    return maxrss / 1024
+
+
+@contextmanager
+def labels(**kwargs):
+    """
+    Description
+    -----------
+    Attach labels (e.g. product, nc_file) to all stages recorded inside the with-block.
+
+    Usage
+    -----
+    with labels(product='attbsc', nc_file=nc_file):
+        ...
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    previous = _labels.copy()
+    _labels.update(kwargs)
+    try:
+        yield
+    finally:
+        _labels.clear()
+        _labels.update(previous)
+
+
+@contextmanager
+def stage(name, **kwargs):
+    """
+    Description
+    -----------
+    Record wall time, CPU time and peak RSS of a stage of the plotting pipeline
+    (e.g. 'nc_read', 'gap_fill', 'figure', 'savefig', 'donefile').
+    Stages can be nested; 'self_wall_s' and 'self_cpu_s' exclude the nested stages,
+    e.g. the self time of 'figure' is the figure construction without reading,
+    gap filling and saving (the nc-variables are read lazily inside 'figure').
+    'parent' is the name of the enclosing stage, None for a top-level stage.
+    Summing 'wall_s' over all records counts nested stages twice: sum 'self_wall_s',
+    or 'wall_s' of the records with parent None except 'total' (the whole run of pypolly_display_all).
+
+    Parameters
+    ----------
+    name: str
+        name of the stage.
+    kwargs:
+        labels of this stage only, in addition to the ones set with labels().
+
+    Usage
+    -----
+    with stage('savefig', file=saveFilename):
+        fig.savefig(saveFilename,dpi=figDPI)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    record = {'stage': name, 'pid': os.getpid(), 'parent': _open_stages[-1]['name'] if _open_stages else None}
+    record.update(_labels)
+    record.update(kwargs)
+    nested = {'name': name, 'wall': 0.0, 'cpu': 0.0}
+    _open_stages.append(nested)
+    rss_start = _peak_rss_mb()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield record
+    finally:
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        rss_end = _peak_rss_mb()
+        _open_stages.pop()
+        if _open_stages:
+            _open_stages[-1]['wall'] += wall
+            _open_stages[-1]['cpu'] += cpu
+        record['wall_s'] = round(wall, 6)
+        record['cpu_s'] = round(cpu, 6)
+        record['self_wall_s'] = round(wall - nested['wall'], 6)
+        record['self_cpu_s'] = round(cpu - nested['cpu'], 6)
+        if rss_end is not None:
+            record['peak_rss_mb'] = round(rss_end, 1)
+            record['peak_rss_growth_mb'] = round(rss_end - rss_start, 1)
+        records.append(record)
+
+
+def pop_records():
+    ## return and forget the records of this process, e.g. to send them from a worker process
+    finished = list(records)
+    records.clear()
+    return finished
+
+
+def write_records(filename, stage_records):
+    """
+    Description
+    -----------
+    Append stage records to a JSON lines file, one record per line.
+    Stages nest (see stage()), sum 'self_wall_s' for a breakdown without double counting.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    with open(filename, 'a') as file:
+        for record in stage_records:
+            file.write(json.dumps(record, default=str) + '\n')
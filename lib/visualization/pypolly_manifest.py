@@ -0,0 +1,196 @@
+import os
+import json
+import glob
+import pickle
+import hashlib
+import logging
+from pathlib import Path
+import numpy as np
+
+## the manifest of an output folder, see read_manifest
+manifest_name = '.pypolly_manifest.json'
+
+_code_version = None
+
+## the modules the renderers import, other modules of this folder
+## (e.g. the MATLAB-driven display scripts) do not change the plots of pypolly_display_all
+renderer_modules = [
+    'pypolly_display_3d_plots.py',
+    'pypolly_display_profiles.py',
+    'pypolly_products.py',
+    'pypolly_profile_translator.py',
+    'pypolly_readout.py',
+    'pypolly_scheduler.py',
+    'pypolly_incremental.py',
+    'python_colormap.py',
+]
+
+## the config keys the renderers read; polly config keys starting with plot_config_prefixes
+## are the axis and colour limits (e.g. yLim_att_beta, xLim_Profi_Bsc, zLim_SNR)
+plot_config_keys = {
+    'config_dict': ['figDPI', 'flagWatermarkOn', 'fontname', 'flagPlotLastProfilesOnly', 'flagIncremental', 'flagFastRender'],
+    'polly_conf_dict': ['partnerLabel', 'colormap_basic', 'imgFormat', 'flagLCCalibration', 'calibrationDB'],
+}
+plot_config_prefixes = ('xLim_', 'yLim_', 'zLim_')
+
+
+def code_version():
+    """
+    Description
+    -----------
+    Hash of the plotting code: the renderer modules and the colormap lookup tables of this folder.
+    Computed once per process.
+    """
+    global _code_version
+    if _code_version is None:
+        folder = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha1()
+        filenames = [ os.path.join(folder, module) for module in renderer_modules ]
+        for filename in filenames + sorted(glob.glob(os.path.join(folder, 'colormap_luts', '*.npy'))):
+            digest.update(os.path.basename(filename).encode())
+            with open(filename, 'rb') as f:
+                digest.update(f.read())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+
+def plot_config(name, config):
+    """
+    Description
+    -----------
+    The part of a config dict (config_dict or polly_conf_dict) which affects the plots,
+    see plot_config_keys. Other keyword arguments are returned unchanged.
+    """
+    if name not in plot_config_keys or not isinstance(config, dict):
+        return config
+    return { key: value for key, value in config.items()
+             if key in plot_config_keys[name] or (name == 'polly_conf_dict' and key.startswith(plot_config_prefixes)) }
+
+
+def _update(digest, value):
+    ## feed value into digest; dicts independent of their order, functions by name,
+    ## other objects (e.g. pandas dataframes) by their pickle
+    if isinstance(value, dict):
+        digest.update(b'{')
+        for key in sorted(value, key=repr):
+            _update(digest, key)
+            _update(digest, value[key])
+        digest.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        digest.update(b'[')
+        for item in value:
+            _update(digest, item)
+        digest.update(b']')
+    elif isinstance(value, (str, int, float, bool, type(None), Path, np.generic)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, np.ndarray):
+        digest.update(f'{value.dtype}{value.shape}'.encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif callable(value) and hasattr(value, '__qualname__'):
+        digest.update(f'{value.__module__}.{value.__qualname__}'.encode())
+    else:
+        digest.update(pickle.dumps(value))
+
+
+def task_folder(task):
+    ## output folder of a plotting task
+    return task['kwargs'].get('saveFolder', task['kwargs'].get('outdir'))
+
+
+def task_key(task):
+    """
+    Description
+    -----------
+    Name of a plotting task in the manifest: product, renderer, nc-files and the
+    plain keyword arguments (e.g. wavelength, param, profilename).
+    """
+    renderer = task['renderer']
+    key = [task['product'], f'{renderer.__module__}.{renderer.__qualname__}']
+    for arg_name, nc_file in sorted(task['nc_files'].items()):
+        key.append(f'{arg_name}={os.path.basename(nc_file) if nc_file else nc_file}')
+    for name, value in sorted(task['kwargs'].items()):
+        if name not in ('saveFolder', 'outdir') and isinstance(value, (str, int, float, bool, type(None))):
+            key.append(f'{name}={value}')
+    return '|'.join(key)
+
+
+def task_hash(task, date, device, location):
+    """
+    Description
+    -----------
+    Hash of everything the plots of a task depend on: the nc-files (path, size and
+    modification time), the keyword arguments of the renderer (of config_dict and
+    polly_conf_dict only the keys which affect the plots, see plot_config),
+    device, date, location and the version of the plotting code.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    digest = hashlib.sha1()
+    _update(digest, [code_version(), task_key(task), date, device, location])
+    for arg_name, nc_file in sorted(task['nc_files'].items()):
+        if nc_file is not None and os.path.exists(nc_file):
+            stat = os.stat(nc_file)
+            _update(digest, [arg_name, os.path.abspath(nc_file), stat.st_size, stat.st_mtime_ns])
+        else:
+            _update(digest, [arg_name, nc_file])
+    _update(digest, task['prepare'])
+    _update(digest, { name: plot_config(name, value) for name, value in task['kwargs'].items() })
+    return digest.hexdigest()
+
+
+def read_manifest(folder):
+    """
+    Description
+    -----------
+    Read the manifest of an output folder: for every task, the hash of its inputs,
+    size and modification time of the files it has written and its donefilelist entries.
+    An empty manifest is returned if there is none.
+    """
+    try:
+        with open(os.path.join(folder, manifest_name), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_manifest(folder, manifest):
+    filename = os.path.join(folder, manifest_name)
+    tmp_file = f'{filename}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_file, 'w') as f:
+            ## the donefilelist entries are written as text to the donefile anyway
+            json.dump(manifest, f, default=str)
+        os.replace(tmp_file, filename)
+    except OSError:
+        logging.warning(f'manifest of {folder} could not be written.')
+
+
+def make_entry(digest, donefilelist_dict):
+    ## manifest entry of a task, which has written the files of donefilelist_dict
+    files = {}
+    for filename in donefilelist_dict:
+        if os.path.exists(filename):
+            stat = os.stat(filename)
+            files[filename] = [stat.st_size, stat.st_mtime_ns]
+    return {'hash': digest, 'files': files, 'donefilelist': donefilelist_dict}
+
+
+def is_up_to_date(entry, digest):
+    """
+    Description
+    -----------
+    Check if the plots of a manifest entry are up to date: same hash of the inputs
+    and all files unchanged on disk since they have been written.
+    """
+    if entry is None or entry['hash'] != digest:
+        return False
+    for filename, (size, mtime_ns) in entry['files'].items():
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            return False
+        if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+            return False
+    return True
@@ -0,0 +1,206 @@
+import numpy as np
+import scipy.io as spio
+from collections.abc import Mapping
+
+## .mat files from version 7.3 on are HDF5 files with this header
+HDF5_SIGNATURE = b'\x89HDF\r\n\x1a\n'
+
+
+def is_matv73(file_name):
+    """
+    check whether file_name is a MATLAB v7.3 (HDF5) .mat file.
+    the HDF5 superblock is at offset 0, or at 512 for .mat files with the MATLAB header.
+    """
+    with open(file_name, 'rb') as f:
+        for offset in (0, 512):
+            f.seek(offset)
+            if f.read(8) == HDF5_SIGNATURE:
+                return True
+    return False
+
+
+def loadmat(file_name, **kwargs):
+    """
+    Description
+    -----------
+    Drop-in replacement of scipy.io.loadmat for the display scripts, which also
+    reads MATLAB v7.3 (HDF5) files (saved with save(..., '-v7.3')).
+    v7.3 files are read via h5py and every variable is read only when it is accessed.
+
+    Parameters
+    ----------
+    file_name: str
+        the .mat file.
+    kwargs:
+        passed to scipy.io.loadmat for .mat files before v7.3.
+
+    Returns
+    -------
+    mat: dict or MatH5Dict
+        variables with the same layout as scipy.io.loadmat(struct_as_record=True).
+
+    Usage
+    -----
+    mat = loadmat(tmpFile, struct_as_record=True)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    if is_matv73(file_name):
+        return MatH5Dict(file_name)
+    return spio.loadmat(file_name, **kwargs)
+
+
+def height_rows(height, yLim):
+    """
+    Description
+    -----------
+    Rows of a (height, time) matrix needed to plot it up to yLim[1]: all height bins
+    below yLim[1] and the first one above, as pcolormesh(shading='nearest')
+    draws every bin up to half-way to the next one.
+
+    Parameters
+    ----------
+    height: array
+        the height bins, increasing.
+    yLim: list
+        [y_min, y_max] of the plot.
+
+    Returns
+    -------
+    rows: slice
+        see read_rows.
+
+    Usage
+    -----
+    rows = height_rows(height, yLim_att_beta)
+    height = height[rows]
+    ATT_BETA_532 = read_rows(mat, 'ATT_BETA_532', rows)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    n_bins = int(np.searchsorted(height, yLim[1], side='right')) + 1
+    return slice(0, min(n_bins, len(height)))
+
+
+def read_rows(mat, name, rows):
+    """
+    Description
+    -----------
+    Read the rows of a 2D variable of a .mat file, e.g. the height bins of a
+    (height, time) matrix. From a v7.3 file only these rows are read,
+    older files are read completely by scipy.io.loadmat anyway.
+
+    Parameters
+    ----------
+    mat: dict or MatH5Dict
+        the .mat file, see loadmat.
+    name: str
+        name of the variable.
+    rows: slice
+        the rows, e.g. from height_rows.
+
+    Returns
+    -------
+    matrix: array
+        mat[name][rows].
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    if not isinstance(mat, MatH5Dict):
+        return mat[name][rows]
+
+    dataset = mat.dataset(name)
+    if dataset.attrs.get('MATLAB_empty', 0):
+        return mat[name][rows]
+    ## HDF5 stores MATLAB arrays transposed, the rows are the columns of the dataset
+    matrix = np.array(dataset[:, rows]).T
+    matlab_class = dataset.attrs.get('MATLAB_class', b'')
+    if matlab_class in (b'logical', 'logical'):
+        return matrix.astype(bool)
+    return matrix
+
+
+def _h5_to_loadmat(h5file, obj):
+    ## convert a dataset/group of a v7.3 file to the layout of scipy.io.loadmat
+    import h5py
+
+    matlab_class = obj.attrs.get('MATLAB_class', b'')
+    if isinstance(matlab_class, bytes):
+        matlab_class = matlab_class.decode('ascii')
+
+    if isinstance(obj, h5py.Group):
+        ## 1x1 struct
+        fields = [ key for key in obj.keys() if not key.startswith('#') ]
+        struct = np.empty((1, 1), dtype=[ (field, object) for field in fields ])
+        for field in fields:
+            struct[0, 0][field] = _h5_to_loadmat(h5file, obj[field])
+        return struct
+
+    if obj.attrs.get('MATLAB_empty', 0):
+        ## empty arrays are saved with their dimensions as data
+        return np.zeros(tuple(np.array(obj[()]).ravel()) if obj.shape else (0, 0))
+
+    ## HDF5 stores column-major MATLAB arrays transposed
+    data = np.array(obj[()]).T
+
+    if matlab_class == 'char':
+        return np.array([ ''.join(map(chr, row)) for row in np.atleast_2d(data) ])
+    if matlab_class == 'cell':
+        cell = np.empty(data.shape, dtype=object)
+        for index, ref in np.ndenumerate(data):
+            cell[index] = _h5_to_loadmat(h5file, h5file[ref])
+        return cell
+    if matlab_class == 'logical':
+        return data.astype(bool)
+    return data
+
+
+class MatH5Dict(Mapping):
+    """
+    Variables of a MATLAB v7.3 .mat file. Every variable is read from the
+    HDF5 file at the first access and kept afterwards.
+    dataset(name) gives the h5py dataset itself, for reading only a slice
+    (note the transposed layout: MATLAB (height, time) is stored as (time, height)).
+    """
+    def __init__(self, file_name):
+        try:
+            import h5py
+        except ImportError:
+            raise ImportError('h5py is necessary for reading MATLAB v7.3 files.')
+        self.file_name = file_name
+        self._h5file = h5py.File(file_name, 'r')
+        self._data = {}
+
+    def dataset(self, name):
+        return self._h5file[name]
+
+    def close(self):
+        self._h5file.close()
+
+    def __getitem__(self, name):
+        if name not in self._data:
+            if name not in self:
+                raise KeyError(name)
+            self._data[name] = _h5_to_loadmat(self._h5file, self._h5file[name])
+        return self._data[name]
+
+    def __contains__(self, name):
+        return isinstance(name, str) and not name.startswith('#') and name in self._h5file
+
+    def __iter__(self):
+        return ( key for key in self._h5file.keys() if not key.startswith('#') )
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __del__(self):
+        try:
+            self._h5file.close()
+        except Exception:
+            pass
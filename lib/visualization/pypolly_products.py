@@ -0,0 +1,349 @@
+import os
+import re
+import importlib
+import logging
+from pathlib import Path
+import numpy as np
+from netCDF4 import Dataset
+import pypolly_readout as readout
+import pypolly_scheduler as scheduler
+
+
+def make_product(name, renderer, inputs, variables=(), variants=({},), optional_inputs=(), prepare=None, output='saveFolder', incremental=False, in_all=True):
+    """
+    Description
+    -----------
+    Declare a product of pypolly_display_all: the nc-files it needs, the
+    nc-variables it reads and the renderer drawing it. resolve_tasks makes one
+    task for every main input file and variant.
+
+    Parameters
+    ----------
+    name: str
+        the retrieval the product belongs to (see --retrieval), e.g. 'attbsc'.
+    renderer: str
+        'module.function' of the renderer; the module is imported only if the product is plotted.
+    inputs: dict
+        maps the nc-file arguments of the renderer to file types of readout.get_nc_filename,
+        e.g. {'nc_dict': 'att_bsc', 'nc_dict_cloudinfo': 'cloudinfo'}. The first input is the main one,
+        the files of the others are matched to it by the measurement (the file name in front of the file type).
+    variables: list or function
+        nc-variables of the main input needed by a variant, formatted with the variant
+        (e.g. 'attenuated_backscatter_{wavelength}nm'), or a function of the variant returning them.
+        Only the variables the renderer cannot do without, optional ones (e.g. SNR) are checked by the renderer.
+        Variants whose variables are missing in a file are not plotted for it and count as failed.
+    variants: list or function
+        keyword arguments of the renderer, one task per variant. A function is called once per
+        device and date with the context of resolve_tasks (e.g. to read the calibration database).
+    optional_inputs: list
+        inputs which are passed as None, if no matching file was found.
+    prepare: dict
+        see scheduler.make_task.
+    output: str
+        the output folder argument of the renderer, 'saveFolder' or 'outdir'.
+    incremental: bool
+        see scheduler.make_task.
+    in_all: bool
+        the product is plotted with --retrieval all.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    product = {}
+    product['name'] = name
+    product['renderer'] = renderer
+    product['inputs'] = inputs
+    product['variables'] = variables
+    product['variants'] = variants
+    product['optional_inputs'] = optional_inputs
+    product['prepare'] = prepare if prepare is not None else {}
+    product['output'] = output
+    product['incremental'] = incremental
+    product['in_all'] = in_all
+    product['label'] = f"{renderer.split('.')[-1]}({next(iter(inputs.values()))})"
+    return product
+
+
+def plot_RCS_channel(nc_dict, config_dict, polly_conf_dict, saveFolder, channel, donefilelist_dict):
+    ## plot one RCS channel, skip empty or non-existing channels
+    import pypolly_display_3d_plots as display_3d
+
+    p1 = re.split(r'RCS_',channel)[1]
+    param = re.split(r'_[1-9].*nm',p1)[0]
+    wavelength = re.split(f'{param}_',p1)[-1]
+    wavelength = re.split(r'nm',wavelength)[0]
+
+    if channel not in nc_dict:
+        return
+    ## check only the bins pollyDisplayRCS reads, so the channel is not read in full height
+    param_l = 'NR' if 'NR' in param else 'FR'
+    RCS_matrix = readout.read_height_truncated(nc_dict, channel, y_max=polly_conf_dict[f'yLim_{param_l}_RCS'][1])
+    ## do not plot empty channels; an incremental read holds only the new profiles
+    ## of a channel which has been plotted before
+    if np.all(RCS_matrix.mask) and getattr(nc_dict, 'time_start', 0) == 0:
+        return
+    print(f'plotting {channel}')
+    display_3d.pollyDisplayRCS(nc_dict, config_dict, polly_conf_dict, saveFolder, wavelength=wavelength,param=param,donefilelist_dict=donefilelist_dict)
+
+
+def _profile_variants(translator_function):
+    ## one variant per profile of a profile translator
+    def variants(context):
+        import pypolly_profile_translator as p_translator
+        translator = getattr(p_translator, translator_function)()
+        return [ {'profile_translator': translator, 'profilename': profilename} for profilename in translator.keys() ]
+    return variants
+
+
+def _LC_variants(context):
+    ## lidar constants from the calibration database, one variant per wavelength
+    import pypolly_profile_translator as p_translator
+    db_path = Path(context['config_dict']['results_folder']).joinpath(context['device'], context['polly_conf_dict']['calibrationDB'])
+    LC = {}
+    for wavelength in ['355', '532', '1064']:
+        LC[f'LC{wavelength}'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength=wavelength,method='Method',telescope='far')
+
+    calib_profile_translator = p_translator.calib_profile_translator_function()
+    return [ {'dataframe': LC[profilename], 'profile_calib_translator': calib_profile_translator, 'profilename': profilename} for profilename in calib_profile_translator.keys() ]
+
+
+def _longterm_cali_variants(context):
+    ## lidar and depolarization calibration constants from the calibration database and the logbook
+    import pypolly_profile_translator as p_translator
+    base_dir = Path(context['config_dict']['results_folder'])
+    db_path = base_dir.joinpath(context['device'], context['polly_conf_dict']['calibrationDB'])
+    logbookFile_path = base_dir.joinpath(context['device'], context['polly_conf_dict']['logbookFile'])
+    print(logbookFile_path)
+    logbookFile_df = readout.read_from_logbookFile(logbookFile_path=str(logbookFile_path))
+    LC = {}
+    ETA = {}
+    for wavelength in ['355', '532', '1064']:
+        LC[f'LC{wavelength}'] = readout.get_LC_from_sql_db(db_path=str(db_path),table_name='lidar_calibration_constant',wavelength=wavelength,method='Klett',telescope='far')
+    for wavelength in ['355', '532', '1064']:
+        ETA[f'ETA{wavelength}'] = readout.get_depol_from_sql_db(db_path=str(db_path),table_name='depol_calibration_constant',wavelength=wavelength)
+
+    calib_profile_translator = p_translator.calib_profile_translator_function()
+    return [ {'logbook_dataframe': logbookFile_df, 'LC_sql_dataframe': LC, 'ETA_sql_dataframe': ETA, 'profile_calib_translator': calib_profile_translator, 'profilename': 'longterm_LC'} ]
+
+
+def _HKD_variants(context):
+    ## housekeeping data from the laserlogbook of the measurement
+    laserlogbook = readout.get_pollyxt_logbook_files(context['date'], context['device'], context['base_dir'], context['outputfolder'])
+    print(laserlogbook)
+    return [ {'laserlogbook_df': readout.read_pollyxt_logbook_file(laserlogbook)} ]
+
+
+RCS_channels = ['RCS_FR_355nm', 'RCS_FR_cross_355nm', 'RCS_NR_355nm', 'RCS_RR_355nm', 'RCS_FR_387nm', 'RCS_NR_387nm', 'RCS_FR_407nm', 'RCS_NR_407nm', 'RCS_FR_532nm', 'RCS_FR_cross_532nm','RCS_FR_parallel_532nm', 'RCS_NR_532nm', 'RCS_NR_cross_532nm', 'RCS_RR_532nm', 'RCS_FR_607nm', 'RCS_NR_607nm', 'RCS_FR_1064nm', 'RCS_FR_cross_1064nm', 'RCS_RR_1064nm']
+
+quasi_variables = {
+    'angexp': ['quasi_ang_532_1064'],
+    'bsc_532': ['quasi_bsc_532', 'quality_mask_532'],
+    'bsc_1064': ['quasi_bsc_1064', 'quality_mask_1064'],
+    'par_depol_532': ['quasi_pardepol_532', 'quality_mask_voldepol_532'],
+}
+
+## all products, in the order they are plotted
+products = [
+    make_product('RCS', 'pypolly_products.plot_RCS_channel', {'nc_dict': 'RCS'},
+                 variants=[ {'channel': channel} for channel in RCS_channels ], incremental=True),
+    make_product('cloudinfo', 'pypolly_display_3d_plots.pollyDisplayATT_BSC_cloudinfo', {'nc_dict': 'att_bsc', 'nc_dict_cloudinfo': 'cloudinfo'},
+                 variables=['attenuated_backscatter_{wavelength}nm', 'quality_mask_{wavelength}nm'], variants=[{'wavelength': 1064}]),
+    make_product('attbsc', 'pypolly_display_3d_plots.pollyDisplayAttnBsc', {'nc_dict': 'att_bsc'},
+                 variables=['attenuated_backscatter_{wavelength}nm'],
+                 variants=[ {'wavelength': wavelength, 'param': 'FR'} for wavelength in [355, 532, 1064] ], incremental=True),
+    make_product('attbsc', 'pypolly_display_3d_plots.pollyDisplayAttnBsc', {'nc_dict': 'NR_att_bsc'},
+                 variables=['attenuated_backscatter_{wavelength}nm'],
+                 variants=[ {'wavelength': wavelength, 'param': 'NR'} for wavelength in [355, 532] ], incremental=True),
+    make_product('attbsc', 'pypolly_display_3d_plots.pollyDisplayAttnBsc', {'nc_dict': 'OC_att_bsc'},
+                 variables=['attenuated_backscatter_{wavelength}nm'],
+                 variants=[ {'wavelength': wavelength, 'param': 'OC'} for wavelength in [355, 532, 1064] ], incremental=True),
+    make_product('voldepol', 'pypolly_display_3d_plots.pollyDisplayVDR', {'nc_dict': 'vol_depol'},
+                 variables=['volume_depolarization_ratio_{wavelength}nm'], variants=[ {'wavelength': wavelength} for wavelength in [355, 532] ], incremental=True),
+    make_product('wvmr_rh', 'pypolly_display_3d_plots.pollyDisplayWVMR', {'nc_dict': 'WVMR_RH'},
+                 variables=['WVMR'], incremental=True),
+    make_product('wvmr_rh', 'pypolly_display_3d_plots.pollyDisplayRH', {'nc_dict': 'WVMR_RH'},
+                 variables=['RH'], incremental=True),
+    make_product('target_class', 'pypolly_display_3d_plots.pollyDisplayTargetClass', {'nc_dict': 'target_classification'},
+                 variables=['target_classification'], variants=[{'c_version': 'V1'}]),
+    make_product('target_class', 'pypolly_display_3d_plots.pollyDisplayTargetClass', {'nc_dict': 'target_classification_V2'},
+                 variables=['target_classification'], variants=[{'c_version': 'V2'}]),
+    make_product('quasi_results', 'pypolly_display_3d_plots.pollyDisplayQR', {'nc_dict': 'quasi_results'},
+                 variables=lambda variant: quasi_variables[variant['q_param']],
+                 variants=[ {'q_param': q_param, 'q_version': 'V1'} for q_param in quasi_variables ], incremental=True),
+    make_product('quasi_results', 'pypolly_display_3d_plots.pollyDisplayQR', {'nc_dict': 'quasi_results_V2'},
+                 variables=lambda variant: quasi_variables[variant['q_param']],
+                 variants=[ {'q_param': q_param, 'q_version': 'V2'} for q_param in quasi_variables ], incremental=True),
+    make_product('profiles', 'pypolly_display_profiles.pollyDisplay_profile', {'nc_dict_profile': 'profiles'},
+                 variants=_profile_variants('profile_translator_function'), prepare={'nc_dict_profile': readout.calc_ANGEXP}, output='outdir', in_all=False),
+    make_product('profiles', 'pypolly_display_profiles.pollyDisplay_profile', {'nc_dict_profile': 'NR_profiles'},
+                 variants=_profile_variants('NR_profile_translator_function'), prepare={'nc_dict_profile': readout.calc_ANGEXP}, output='outdir', in_all=False),
+    make_product('profiles', 'pypolly_display_profiles.pollyDisplay_profile', {'nc_dict_profile': 'OC_profiles'},
+                 variants=_profile_variants('OC_profile_translator_function'), prepare={'nc_dict_profile': readout.calc_ANGEXP}, output='outdir', in_all=False),
+    make_product('profiles', 'pypolly_display_profiles.pollyDisplay_profile', {'nc_dict_profile': 'POLIPHON_1'},
+                 variants=_profile_variants('POLIPHON_profile_translator_function'), output='outdir', in_all=False),
+    make_product('poliphon', 'pypolly_display_profiles.pollyDisplay_profile', {'nc_dict_profile': 'POLIPHON_1'},
+                 variants=_profile_variants('POLIPHON_profile_translator_function'), output='outdir'),
+    make_product('overlap', 'pypolly_display_3d_plots.pollyDisplay_Overlap', {'nc_dict': 'overlap'},
+                 variables=['overlap355', 'overlap355Defaults', 'overlap532', 'overlap532Defaults', 'overlap355Raman', 'overlap532Raman'], output='outdir'),
+    make_product('LC', 'pypolly_display_profiles.pollyDisplay_calibration_constants', {'nc_dict': 'overlap'},
+                 variants=_LC_variants, output='outdir'),
+    make_product('longterm_cali', 'pypolly_display_profiles.pollyDisplay_longtermcalibration', {'nc_dict': 'overlap'},
+                 variants=_longterm_cali_variants, output='outdir'),
+    make_product('HKD', 'pypolly_display_profiles.pollyDisplay_HKD', {'nc_dict': 'overlap'},
+                 variants=_HKD_variants, output='outdir'),
+    make_product('profile_summary', 'pypolly_display_profiles.pollyDisplay_profile_summary_QC', {'nc_dict_profile': 'profiles_QC'},
+                 variants=[ {'ymax': ymax} for ymax in ['high_range', 'low_range'] ], prepare={'nc_dict_profile': readout.calc_ANGEXP}, output='outdir'),
+    make_product('profile_summary', 'pypolly_display_profiles.pollyDisplay_profile_summary', {'nc_dict_profile': 'profiles', 'nc_dict_profile_NR': 'NR_profiles'},
+                 variants=[ {'method': method, 'ymax': ymax} for method in ['raman', 'klett'] for ymax in ['high_range', 'low_range'] ],
+                 optional_inputs=['nc_dict_profile_NR'], prepare={'nc_dict_profile': readout.calc_ANGEXP}, output='outdir'),
+]
+
+
+def _measurement(nc_file, file_type):
+    ## the file name in front of the file type, e.g. 2024_05_03_Fri_BEN_00_00_01 of 2024_05_03_Fri_BEN_00_00_01_att_bsc.nc
+    return os.path.basename(nc_file)[:-len(f'_{file_type}.nc')]
+
+
+def resolve_tasks(retrievals, context):
+    """
+    Description
+    -----------
+    Find the nc-files of the products of the requested retrievals and make a task for
+    every main input file and variant, whose inputs and nc-variables are available.
+    Errors (e.g. a missing calibration database) only concern the product they occur in.
+
+    Parameters
+    ----------
+    retrievals: list
+        the --retrieval arguments, 'all' selects all products with in_all.
+    context: dict
+        'date', 'device', 'config_dict', 'polly_conf_dict', 'outputfolder' and 'base_dir'.
+
+    Returns
+    -------
+    reports: list
+        for every selected product a dict with 'product', 'tasks' (the tasks made for it),
+        'no_input' (the main input file type, if there is no such file, e.g. an instrument without NR channels),
+        'not_runnable' (reasons why tasks could not be made for an existing main input file) and 'error'.
+
+    Usage
+    -----
+    reports = resolve_tasks(['attbsc', 'voldepol'], context)
+    tasks = [ task for report in reports for task in report['tasks'] ]
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    inputfolder = context['config_dict']['results_folder']
+    nc_files = {}
+    nc_variables = {}
+
+    def get_files(file_type):
+        if file_type not in nc_files:
+            files = readout.get_nc_filename(context['date'], context['device'], inputfolder, param=file_type)
+            nc_files[file_type] = sorted(files) if files else []
+        return nc_files[file_type]
+
+    def get_variables(nc_file):
+        if nc_file not in nc_variables:
+            with Dataset(nc_file, 'r') as nc_file_ds:
+                nc_variables[nc_file] = set(nc_file_ds.variables)
+        return nc_variables[nc_file]
+
+    print('retrievals to plot: '+ str(retrievals))
+    reports = []
+    for product in products:
+        if product['name'] not in retrievals and not ('all' in retrievals and product['in_all']):
+            continue
+        report = {'product': product, 'tasks': [], 'no_input': None, 'not_runnable': [], 'error': None}
+        reports.append(report)
+        try:
+            input_args = list(product['inputs'])
+            main_type = product['inputs'][input_args[0]]
+            main_files = get_files(main_type)
+            if len(main_files) == 0:
+                report['no_input'] = main_type
+                continue
+            module_name, function_name = product['renderer'].rsplit('.', 1)
+            renderer = getattr(importlib.import_module(module_name), function_name)
+            variants = product['variants']
+            if callable(variants):
+                variants = variants(context)
+
+            for main_file in main_files:
+                ## the other inputs of the same measurement
+                measurement = _measurement(main_file, main_type)
+                task_files = {input_args[0]: main_file}
+                for arg_name in input_args[1:]:
+                    file_type = product['inputs'][arg_name]
+                    matching = [ f for f in get_files(file_type) if _measurement(f, file_type) == measurement ]
+                    task_files[arg_name] = matching[0] if matching else None
+                missing = [ product['inputs'][arg_name] for arg_name, f in task_files.items() if f is None and arg_name not in product['optional_inputs'] ]
+                if missing:
+                    report['not_runnable'].append(f"{os.path.basename(main_file)}: no {', '.join(missing)} file")
+                    continue
+
+                for variant in variants:
+                    if callable(product['variables']):
+                        variables = product['variables'](variant)
+                    else:
+                        variables = [ variable.format(**variant) for variable in product['variables'] ]
+                    missing = [ variable for variable in variables if variable not in get_variables(main_file) ]
+                    if missing:
+                        report['not_runnable'].append(f"{os.path.basename(main_file)}: no {', '.join(missing)}")
+                        continue
+                    report['tasks'].append(scheduler.make_task(
+                        product['name'], renderer, task_files, product['prepare'], incremental=product['incremental'],
+                        config_dict=context['config_dict'], polly_conf_dict=context['polly_conf_dict'],
+                        **{product['output']: context['outputfolder']}, **variant))
+        except Exception as e:
+            ## first line only, the traceback is logged
+            report['error'] = f'{type(e).__name__}: {str(e).strip().splitlines()[0] if str(e).strip() else ""}'
+            logging.exception(f"An error occurred in product {product['label']}")
+    return reports
+
+
+def print_status_table(reports):
+    """
+    Description
+    -----------
+    Print the status of every product after the tasks have run (see scheduler.run_task_groups):
+    the number of tasks ok, skipped as unchanged, retried and failed, the tasks which were
+    not runnable (an input file or nc-variable missing) and errors in resolving them.
+    Products without their main input file (e.g. no NR channels) are only listed as 'no input'.
+    The reports of several devices and dates are summed per product.
+
+    Returns
+    -------
+    n_failed: int
+        number of failed and not runnable tasks and products with errors.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    rows = {}
+    for report in reports:
+        row = rows.setdefault(report['product']['label'], {'ok': 0, 'unchanged': 0, 'retried': 0, 'failed': 0, 'not_runnable': 0, 'no_input': 0, 'errors': []})
+        for task in report['tasks']:
+            status = task.get('status', 'failed')
+            row[status] += 1
+            if task.get('attempts', 1) > 1:
+                row['retried'] += 1
+        row['not_runnable'] += len(report['not_runnable'])
+        row['errors'].extend(report['not_runnable'])
+        if report['no_input']:
+            row['no_input'] += 1
+        if report['error']:
+            row['errors'].append(report['error'])
+
+    n_failed = 0
+    width = max([ len(label) for label in rows ] + [7])
+    print(f"{'product':<{width}}  {'ok':>5}  {'unchanged':>9}  {'retried':>7}  {'failed':>6}  {'not runnable':>12}  {'no input':>8}  error")
+    for label, row in rows.items():
+        print(f"{label:<{width}}  {row['ok']:>5}  {row['unchanged']:>9}  {row['retried']:>7}  {row['failed']:>6}  {row['not_runnable']:>12}  {row['no_input']:>8}  {'; '.join(row['errors'])}")
+        ## errors hold the reasons of the not runnable tasks, too
+        n_failed += row['failed'] + len(row['errors'])
+    return n_failed
@@ -1,22 +1,15 @@
-import matplotlib.pyplot as plt
-from matplotlib.colors import ListedColormap, LogNorm
-from matplotlib.ticker import MultipleLocator, FormatStrFormatter
-from matplotlib.dates import DateFormatter, \
-                             DayLocator, HourLocator, MinuteLocator, date2num
 import os
 import re
 import sys
-import scipy.io as spio
 import numpy as np
 from datetime import datetime, timedelta, timezone
-import matplotlib
 from netCDF4 import Dataset
 import json
 from pathlib import Path
-from statistics import mode
-import pandas as pd
 import sqlite3
 from zipfile import ZipFile, ZIP_DEFLATED
+from collections.abc import MutableMapping
+import pypolly_instrumentation as instrumentation
 import logging
 logging.basicConfig(level=logging.WARNING)
 
@@ -28,8 +21,8 @@ try:
 except Exception as e:
     raise ImportError('python_colormap module is necessary.')
 
-# generating figure without X server
-plt.switch_backend('Agg')
+## matplotlib and pandas are imported in the functions using them, so that
+## reading configs and nc-files does not pay for their import
 
 
 def input_folder(configfile):
@@ -75,7 +68,145 @@ def get_nc_filename(date, device, inputfolder, param=""):
         print(f'folder {inputfolder} does not exist!')
 
 
-def fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask):
+class TimeGrid:
+    """
+    Description
+    -----------
+    Gap-filled 24h time grid of a nc-file, computed once from its time values
+    and applied to every (time, height) matrix of the file.
+    Gaps are located like before: a time-difference bigger than 2 x profile_length,
+    where profile_length is the most frequent time-difference (in most cases 30 seconds).
+    The start and the end of the day are filled as well.
+    The grid reproduces the layout of the former np.pad/np.append implementation,
+    i.e. the profile in front of each gap is repeated after the filled profiles.
+
+    Parameters
+    ----------
+    time: list
+        time values in unixtime.
+    time_start: int
+        the matrices hold only the profiles from time_start on (see NcLazyDict),
+        the columns of the profiles in front are filled like a gap.
+
+    Usage
+    -----
+    time_grid = TimeGrid(time)
+    ATT_BETA, quality_mask = time_grid.fill_matrix(ATT_BETA, quality_mask)
+    SNR, quality_mask_SNR = time_grid.fill_matrix(SNR, quality_mask)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    def __init__(self, time, time_start=0):
+        time = np.ma.getdata(time)
+        n = len(time)
+
+        ## get time-differences between profiles
+        diff_time = np.diff(time)
+
+        ## get profile_length (in most cases 30 seconds)
+        ## most frequent element; like statistics.mode the first occurrence wins in case of a tie
+        values, first_index, counts = np.unique(diff_time, return_index=True, return_counts=True)
+        candidates = np.flatnonzero(counts == counts.max())
+        occurence_count = values[candidates[np.argmin(first_index[candidates])]]
+        profile_length = int(np.round(occurence_count))
+
+        ## get gaps, if time-gap is bigger than 2 x profile_length
+        gaps = np.flatnonzero(diff_time > 2*profile_length)
+        profiles_num = np.round(diff_time[gaps]/profile_length).astype(int)
+
+        ## the k-th gap is inserted behind profile gaps[k]-k, which is repeated afterwards
+        gap_rows = gaps - np.arange(len(gaps))
+        offset = np.concatenate(([0], np.cumsum(profiles_num + 1)))
+        segment = np.searchsorted(gap_rows, np.arange(n), side='right')
+        target = np.arange(n) + offset[segment]
+        dup_target = gap_rows + offset[:-1]
+
+        ## get date and convert to datetime object
+        date_00 = datetime.fromtimestamp(int(time[0])).strftime('%Y%m%d') # convert Unix-timestamp to datestring
+        date_00 = datetime.strptime(str(date_00), '%Y%m%d').replace(tzinfo=timezone.utc) # convert to datetime object of UTC-time 
+        date_00 = date_00.timestamp() # convert to unix-timestamp-object
+
+        ## check start unix-time
+        start_diff = abs(time[0]-date_00)
+        if start_diff < (profile_length * 2):
+            fill_size_start = 0
+        else:
+            fill_size_start = int(np.round(start_diff/profile_length))
+        ## check end unix-time
+        end_diff = abs(time[-1] - (date_00+24*60*60))
+        if end_diff < (profile_length * 2):
+            fill_size_end = 0
+        else:
+            fill_size_end =  int(np.round(end_diff/profile_length))
+
+        self.profile_length = profile_length
+        self.n_time = n
+        self.time_start = time_start
+        self.target = target + fill_size_start
+        self.dup_source = gap_rows
+        self.dup_target = dup_target + fill_size_start
+        self.n_profiles = int(n + offset[-1] + fill_size_start + fill_size_end)
+
+    def fill(self, matrix, fill_value):
+        ## scatter the profiles of matrix into a newly allocated, gap-filled matrix;
+        ## like before, the mask of matrix is not kept if profiles are filled
+        data = np.ma.getdata(matrix)
+        if data.shape[0] != self.n_time - self.time_start:
+            raise ValueError(f'matrix has {data.shape[0]} profiles, the time grid {self.n_time - self.time_start}.')
+        if self.n_profiles == self.n_time and self.time_start == 0:
+            return matrix
+        with instrumentation.stage('gap_fill'):
+            filled = np.full((self.n_profiles,) + data.shape[1:], fill_value, dtype=data.dtype)
+            filled[self.target[self.time_start:]] = data
+            ## repeated profiles in front of time_start are not in matrix
+            dup = self.dup_source >= self.time_start
+            filled[self.dup_target[dup]] = data[self.dup_source[dup] - self.time_start]
+        return filled
+
+    def fill_matrix(self, matrix, quality_mask):
+        ## fill data matrix and its quality_mask, see fill_time_gaps_of_matrix
+        fill_value = matrix.fill_value
+        if fill_value == 1e+20:
+            fill_value = -999.0
+
+        ## Set masked values (bad signal) to 0, to differntiate between bad signals and measurement-gaps
+        matrix = np.ma.masked_where(matrix.mask, matrix, 0)
+
+        return self.fill(matrix, fill_value), self.fill(quality_mask, -1)
+
+    def fill_single_matrix(self, matrix):
+        ## fill data matrix without quality_mask, see fill_time_gaps_of_single_matrix
+        fill_value = matrix.fill_value
+        if fill_value == 1e+20:
+            fill_value = -999.0
+
+        return self.fill(matrix, fill_value)
+
+
+def get_time_grid(nc_dict):
+    """
+    Description
+    -----------
+    Return the TimeGrid of a nc_dict. It is computed on first use and stored
+    in the nc_dict, so that all plots of a nc-file share it.
+    For a NcLazyDict read from time_start on, the grid places the profiles from time_start on.
+
+    Usage
+    -----
+    ATT_BETA, quality_mask = get_time_grid(nc_dict).fill_matrix(ATT_BETA, quality_mask)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    if 'TimeGrid' not in nc_dict:
+        nc_dict['TimeGrid'] = TimeGrid(nc_dict['time'], time_start=getattr(nc_dict, 'time_start', 0))
+    return nc_dict['TimeGrid']
+
+
+def fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask, time_grid=None):
     """
     Description
     -----------
@@ -89,6 +220,8 @@ def fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask):
         the ATT_BETA matrix.
     quality_mask: array-like
         the quality_matrix corresponding to the ATT_BETA matrix
+    time_grid: TimeGrid
+        TimeGrid of time; computed if not given.
         
 
     Usage
@@ -98,68 +231,16 @@ def fill_time_gaps_of_matrix(time, ATT_BETA, quality_mask):
     History
     -------
     2022-09-01. First edition by Andi
+    2026-10-18. Place all profiles in one step with a TimeGrid, instead of padding per gap.
     """
 
-    ## get time-differences between profiles
-    diff_time = [ time[d+1]-time[d] for d in range(len(time)-1) ]
+    if time_grid is None:
+        time_grid = TimeGrid(time)
 
-    ## get profile_length (in most cases 30 seconds)
-    occurence_count = mode(diff_time) ## get most frequently element
-    profile_length = int(np.round(occurence_count))
-    
-    ## get gaps, if time-gap is bigger than 2 x profile_length
-    gap_finder = np.where(np.array(diff_time) > 2*profile_length)
-    fill_size = 0
-    fill_size_all = 0
-    fill_value = ATT_BETA.fill_value
-    if fill_value == 1e+20:
-        fill_value = -999.0
-
-    ## Set masked values (bad signal) to 0, to differntiate between bad signals and measurement-gaps
-    ATT_BETA = np.ma.masked_where(ATT_BETA.mask, ATT_BETA, 0)
-    
-    for gap in gap_finder[0]:
-        fill_size_all = fill_size_all + fill_size
-        gap = gap + fill_size_all
-        time_gap = diff_time[gap-fill_size_all]
-        profiles_num = int(np.round(time_gap/profile_length))
-        matrix_left_att = ATT_BETA[:gap+1]
-        matrix_right_att = ATT_BETA[gap:]
-        matrix_left_mask = quality_mask[:gap+1]
-        matrix_right_mask = quality_mask[gap:]
-        fill_size =  profiles_num
-        matrix_left_att = np.pad(matrix_left_att,((0,fill_size),(0,0)), 'constant', constant_values=fill_value)
-        matrix_left_mask = np.pad(matrix_left_mask,((0,fill_size),(0,0)), 'constant', constant_values=-1)
-        
-        ATT_BETA = np.append(matrix_left_att, matrix_right_att,axis=0)
-        quality_mask = np.append(matrix_left_mask, matrix_right_mask,axis=0)
-
-    ## get date and convert to datetime object
-    date_00 = datetime.fromtimestamp(int(time[0])).strftime('%Y%m%d') # convert Unix-timestamp to datestring
-    date_00 = datetime.strptime(str(date_00), '%Y%m%d').replace(tzinfo=timezone.utc) # convert to datetime object of UTC-time 
-    date_00 = date_00.timestamp() # convert to unix-timestamp-object
-
-    ## check start unix-time
-    start_diff = abs(time[0]-date_00)
-    if start_diff < (profile_length * 2):
-        fill_size_start = 0
-    else:
-        fill_size_start = int(np.round(start_diff/profile_length))
-        ATT_BETA = np.pad(ATT_BETA,((fill_size_start,0),(0,0)), 'constant', constant_values=fill_value)
-        quality_mask = np.pad(quality_mask,((fill_size_start,0),(0,0)), 'constant', constant_values=-1)
-    ## check end unix-time
-    end_diff = abs(time[-1] - (date_00+24*60*60))
-    if end_diff < (profile_length * 2):
-        fill_size_end = 0
-    else:
-        fill_size_end =  int(np.round(end_diff/profile_length))
-        ATT_BETA = np.pad(ATT_BETA,((0,fill_size_end),(0,0)), 'constant', constant_values=fill_value)
-        quality_mask = np.pad(quality_mask,((0,fill_size_end),(0,0)), 'constant', constant_values=-1)
-
-    return ATT_BETA, quality_mask
+    return time_grid.fill_matrix(ATT_BETA, quality_mask)
 
 
-def fill_time_gaps_of_single_matrix(time, matrix):
+def fill_time_gaps_of_single_matrix(time, matrix, time_grid=None):
     """
     Description
     -----------
@@ -170,6 +251,8 @@ def fill_time_gaps_of_single_matrix(time, matrix):
     time: list
         time values in unixtime.
     matrix: array-like  matrix.
+    time_grid: TimeGrid
+        TimeGrid of time; computed if not given.
 
     Usage
     -----
@@ -178,60 +261,13 @@ def fill_time_gaps_of_single_matrix(time, matrix):
     History
     -------
     2022-09-01. First edition by Andi
+    2026-10-18. Place all profiles in one step with a TimeGrid, instead of padding per gap.
     """
 
-    ## get time-differences between profiles
-    diff_time = [ time[d+1]-time[d] for d in range(len(time)-1) ]
-
-    ## get profile_length (in most cases 30 seconds)
-    occurence_count = mode(diff_time) ## get most frequently element
-    profile_length = int(np.round(occurence_count))
-    
-    ## get gaps, if time-gap is bigger than 2 x profile_length
-    gap_finder = np.where(np.array(diff_time) > 2*profile_length)
-    fill_size = 0
-    fill_size_all = 0
-    fill_value = matrix.fill_value
-    if fill_value == 1e+20:
-        fill_value = -999.0
-
-#    ## Set masked values (bad signal) to 0, to differntiate between bad signals and measurement-gaps
-#    ATT_BETA = np.ma.masked_where(ATT_BETA.mask, ATT_BETA, 0)
-    
-    for gap in gap_finder[0]:
-        fill_size_all = fill_size_all + fill_size
-        gap = gap + fill_size_all
-        time_gap = diff_time[gap-fill_size_all]
-        profiles_num = int(np.round(time_gap/profile_length))
-        matrix_left = matrix[:gap+1]
-        matrix_right = matrix[gap:]
-        fill_size =  profiles_num
-        matrix_left = np.pad(matrix_left,((0,fill_size),(0,0)), 'constant', constant_values=fill_value)
-        
-        matrix = np.append(matrix_left, matrix_right, axis=0)
-
-    ## get date and convert to datetime object
-    date_00 = datetime.fromtimestamp(int(time[0])).strftime('%Y%m%d') # convert Unix-timestamp to datestring
-    date_00 = datetime.strptime(str(date_00), '%Y%m%d').replace(tzinfo=timezone.utc) # convert to datetime object of UTC-time 
-    date_00 = date_00.timestamp() # convert to unix-timestamp-object
-
-    ## check start unix-time
-    start_diff = abs(time[0]-date_00)
-    if start_diff < (profile_length * 2):
-        fill_size_start = 0
-    else:
-        fill_size_start = int(np.round(start_diff/profile_length))
-        matrix = np.pad(matrix, ((fill_size_start,0),(0,0)), 'constant', constant_values=fill_value)
-    ## check end unix-time
-    end_diff = abs(time[-1] - (date_00+24*60*60))
-    if end_diff < (profile_length * 2):
-        fill_size_end = 0
-    else:
-        fill_size_end =  int(np.round(end_diff/profile_length))
-        matrix = np.pad(matrix,((0,fill_size_end),(0,0)), 'constant', constant_values=fill_value)
-    
+    if time_grid is None:
+        time_grid = TimeGrid(time)
 
-    return matrix 
+    return time_grid.fill_single_matrix(matrix)
 
 
 
@@ -239,9 +275,39 @@ def fill_time_gaps_of_single_matrix(time, matrix):
 ####
 ####
 
-def set_x_lims(flagPlotLastProfilesOnly,mdate,last_timestamp)->list:
+_license_image = None
+
+def get_license_image():
+    """
+    Description
+    -----------
+    The CC BY-SA license image (img/by-sa.png) of the watermark.
+    It is read from disk only once per process.
+
+    Usage
+    -----
+    newax_license.imshow(readout.get_license_image(), alpha=0.8, aspect='equal')
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    global _license_image
+    if _license_image is None:
+        import matplotlib.image
+        rootDir = os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        _license_image = matplotlib.image.imread(
+            os.path.join(rootDir, 'img', 'by-sa.png'))
+    return _license_image
+
+def set_x_lims(flagPlotLastProfilesOnly,mdate,last_timestamp,round_to_hour=False)->list:
     ## set x-lim to 24h or only to last available timestamp
     if flagPlotLastProfilesOnly == True:
+        ## with round_to_hour the axis ends at the next full hour, so that it does not change
+        ## with every new profile (incremental mode)
+        if round_to_hour:
+            last_timestamp = np.ceil(last_timestamp/3600)*3600
         ## Convert Unix timestamp string to a datetime object
         mtime_end = datetime.utcfromtimestamp(int(last_timestamp))
         mtime_end = mtime_end.timestamp()
@@ -253,15 +319,18 @@ def set_x_lims(flagPlotLastProfilesOnly,mdate,last_timestamp)->list:
     return x_lims
 
 
-def trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly,matrix,mdate,profile_length,last_timestamp):
+def trimm_matrix_to_last_timestamp(flagPlotLastProfilesOnly,matrix,mdate,profile_length,last_timestamp,round_to_hour=False):
     ## trimm matrix to last available timestamp if neccessary
     if flagPlotLastProfilesOnly == True:
+        if round_to_hour:
+            last_timestamp = np.ceil(last_timestamp/3600)*3600
         ## Convert Unix timestamp string to a datetime object
         mtime_end = datetime.utcfromtimestamp(int(last_timestamp))
         mtime_end = mtime_end.timestamp()
         last_hours = (mdate+24*60*60 - mtime_end)/3600
         n = int(3600/profile_length*last_hours) - 1 ## '-1' to be sure not to cut last profile
-        matrix = matrix[:-n] ## trimm last n=(3600s/profile_length*last_hours)
+        if n > 0: ## nothing to trimm at the end of the day
+            matrix = matrix[:-n] ## trimm last n=(3600s/profile_length*last_hours)
                                  ## time-slices to correctly fit to imshow-plot
                                  ## profile_length = mshots/laser_rep_rate = mostly 30s
     else:
@@ -275,21 +344,107 @@ def read_config(configfile):
     f.close()
     return config_json#configfile_dict
 
-def read_excel_config_file(excel_file, timestamp, device):
-    pd.set_option('display.width', 1500)
-    pd.set_option('display.max_columns', None)
+## interval indexes of the excel config files, see get_excel_config_index
+_excel_config_indexes = {}
+
+def build_excel_config_index(excel_file):
+    """
+    Description
+    -----------
+    Read the pollynet config link file (excel) and build an interval index of the
+    configs of every instrument: the rows sorted by starttime, with the running
+    maximum of the stoptimes, so that a lookup needs only a binary search.
+    Rows without starttime or stoptime are skipped (they never match a date).
+
+    Returns
+    -------
+    index: dict
+        instrument -> dict of 'start', 'stop', 'max_stop' (int64 ns),
+        'config_file' and 'location' (lists of str).
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    import pandas as pd
     excel_file_ds = pd.read_excel(f'{excel_file}', engine='openpyxl',usecols = 'A:Z')
+    starttime = pd.to_datetime(excel_file_ds['Starttime of config'])
+    stoptime = pd.to_datetime(excel_file_ds['Stoptime of config'])
+    valid = (starttime.notna() & stoptime.notna()).to_numpy()
+    start_ns = starttime.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    stop_ns = stoptime.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+
+    index = {}
+    for device, rows in excel_file_ds.groupby('Instrument').indices.items():
+        rows = rows[valid[rows]]
+        rows = rows[np.argsort(start_ns[rows], kind='stable')]
+        index[device] = {
+            'start': start_ns[rows],
+            'stop': stop_ns[rows],
+            'max_stop': np.maximum.accumulate(stop_ns[rows]) if len(rows) > 0 else stop_ns[rows],
+            'config_file': [ str(excel_file_ds['Config file'].iloc[row]).strip() for row in rows ],
+            'location': [ str(excel_file_ds['Location'].iloc[row]).strip() for row in rows ],
+        }
+    return index
+
+def get_excel_config_index(excel_file):
+    """
+    Description
+    -----------
+    Interval index of the excel config file (see build_excel_config_index).
+    It is built once per run and kept in memory, keyed by the path, modification
+    time and size of the excel file, so that it is rebuilt when the excel file changes.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    excel_stat = os.stat(excel_file)
+    key = (os.path.abspath(excel_file), excel_stat.st_mtime_ns, excel_stat.st_size)
+    if key not in _excel_config_indexes:
+        _excel_config_indexes[key] = build_excel_config_index(excel_file)
+    return _excel_config_indexes[key]
+
+def read_excel_config_file(excel_file, timestamp, device):
+    """
+    Description
+    -----------
+    Find the polly config file and the location of device at timestamp (YYYYMMDD)
+    in the pollynet config link file (excel), i.e. the config with
+    starttime <= timestamp <= stoptime. If several configs match, the one with
+    the latest starttime is used.
+    The lookup uses the cached interval index of get_excel_config_index.
+
+    Returns
+    -------
+    polly_local_config_file: str
+    device: str
+    location: str
+
+    Raises
+    ------
+    ValueError
+        if there is no config for device at timestamp. Before, the pandas
+        representation of the empty selection was returned as file name and location.
+
+    History
+    -------
+    2026-10-18. Lookup via the cached interval index instead of reading the excel file every time.
+    """
     print(excel_file)
-    ## search for timerange for given timestamp
-    filtered_device = excel_file_ds.loc[(excel_file_ds['Instrument'] == device)]
-    filtered_device['starttime'] = pd.to_datetime(filtered_device['Starttime of config'])
-    filtered_device['stoptime'] = pd.to_datetime(filtered_device['Stoptime of config'])
-    timestamp_dt = pd.to_datetime(f'{timestamp} 00:00:00')
-    matching_row = filtered_device[(filtered_device['starttime'] <= timestamp_dt) & (filtered_device['stoptime'] >= timestamp_dt)]
-    #print(matching_row['Config file'])
-    location = str(matching_row['Location'].to_string(index=False)).strip()  ## get rid of whitespaces
-    polly_local_config_file = str(matching_row['Config file'].to_string(index=False)).strip()  ## get rid of whitespaces
-    return polly_local_config_file, device, location
+    index = get_excel_config_index(excel_file)
+    timestamp_ns = np.datetime64(datetime.strptime(str(timestamp)[0:8], '%Y%m%d'), 'ns').astype(np.int64)
+
+    configs = index.get(device)
+    if configs is not None:
+        ## last config starting before timestamp, which has not stopped before timestamp
+        n = np.searchsorted(configs['start'], timestamp_ns, side='right') - 1
+        while n >= 0 and configs['max_stop'][n] >= timestamp_ns:
+            if configs['stop'][n] >= timestamp_ns:
+                return configs['config_file'][n], device, configs['location'][n]
+            n -= 1
+
+    raise ValueError(f'no polly config for {device} at {timestamp} in {excel_file}.')
 
 def read_global_conf(polly_global_config):
     print(polly_global_config)
@@ -306,17 +461,111 @@ def read_local_conf(polly_local_config):
     return config_json
 
 
-def read_nc_file(nc_filename,timestamp,device,location):
+class NcLazyDict(MutableMapping):
+    """
+    Description
+    -----------
+    dict-like container for the content of a nc-file.
+    Attributes and other plain values are stored directly, the arrays of
+    the nc-variables are read from the nc-file on first access only.
+    With time_start > 0 (incremental mode), variables along time (except time itself)
+    are read only from profile time_start on, i.e. they have n_time - time_start profiles.
+    The nc-file is opened once per run and kept open, see get_nc_handle.
+
+    Usage
+    -----
+    nc_dict = NcLazyDict(nc_filename, var_ls)
+    ATT_BETA = nc_dict['attenuated_backscatter_532nm'] ## read from file now
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    def __init__(self, nc_filename, var_ls, time_start=0):
+        self._nc_filename = nc_filename
+        self._pending = dict.fromkeys(var_ls) ## not yet read variables, ordered
+        self._data = {}
+        self._height_slices = {}
+        self.time_start = time_start
+
+    def _read(self, key, n_bins=None):
+        with instrumentation.stage('nc_read', file=self._nc_filename, variable=key):
+            var = get_nc_handle(self._nc_filename)[key]
+            first = 0
+            if key != 'time' and var.dimensions[:1] == ('time',):
+                first = self.time_start
+            matrix = var[first:] if n_bins is None else var[first:, :n_bins]
+        return matrix
+
+    def __getitem__(self, key):
+        if key not in self._data and key in self._pending:
+            self._data[key] = self._read(key)
+            del self._pending[key]
+        return self._data[key]
+
+    def read_height_bins(self, key, n_bins):
+        ## read only the lowest n_bins of a (time, height) variable;
+        ## the largest slice read so far is kept and serves smaller requests
+        if key not in self._pending:
+            return self[key][:, :n_bins]
+        matrix = self._height_slices.get(key)
+        if matrix is None or matrix.shape[1] < n_bins:
+            matrix = self._read(key, n_bins)
+            self._height_slices[key] = matrix
+        return matrix[:, :n_bins]
+
+    def __setitem__(self, key, value):
+        self._pending.pop(key, None)
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        if key in self._pending:
+            del self._pending[key]
+        else:
+            del self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data or key in self._pending
+
+    def __iter__(self):
+        yield from list(self._data)
+        yield from list(self._pending)
+
+    def __len__(self):
+        return len(self._data) + len(self._pending)
+
+
+def read_nc_file(nc_filename,timestamp,device,location,lazy=False,variables=None,time_start=0):
+    """
+    Description
+    -----------
+    Read a level1 nc-file into a dict: variables, variable attributes
+    (as '{var_name}___{attribute}') and some general infos.
+
+    Parameters
+    ----------
+    nc_filename: str
+        the nc-file.
+    lazy: bool
+        if True, a NcLazyDict is returned and the variable arrays are read on first access.
+    variables: list
+        if set, only these variables are read (attributes are read for all variables).
+    time_start: int
+        lazy only: read the variables along time from this profile on, see NcLazyDict.
+        The nc-file of a lazy read stays open until clear_nc_cache.
+    """
 
-    nc_dict={}
     if not os.path.exists(nc_filename):
         print('{filename} does not exist.'.format(filename=nc_filename))
         return
     else:
         pass
 
-    ## open nc-file as dataset
-    nc_file_ds = Dataset(nc_filename, "r")
+    ## open nc-file as dataset; the lazy reads keep it open for the run
+    if lazy:
+        nc_file_ds = get_nc_handle(nc_filename)
+    else:
+        nc_file_ds = Dataset(nc_filename, "r")
     
     ## get global attributes from nc-file
     global_attr = {}
@@ -326,18 +575,25 @@ def read_nc_file(nc_filename,timestamp,device,location):
 
     var_ls = []
     for var in nc_file_ds.variables:
-        var_ls.append(var)
+        if variables is None or var in variables:
+            var_ls.append(var)
+
+    if lazy:
+        nc_dict = NcLazyDict(nc_filename, var_ls, time_start)
+    else:
+        nc_dict = {}
 
     ## get variable attributes from nc-file
-    for v_count,var_name in enumerate(var_ls):
+    for var_name in nc_file_ds.variables:
         for var_att in nc_file_ds.variables[var_name].ncattrs():
             var_att_value = nc_file_ds.variables[var_name].getncattr(var_att)
             nc_dict[f'{var_name}___{var_att}'] = var_att_value
 
 
     ## fill dict with variable-values
-    for v_count,var_name in enumerate(var_ls):
-        nc_dict[var_name] = nc_file_ds[var_name][:]
+    if not lazy:
+        for v_count,var_name in enumerate(var_ls):
+            nc_dict[var_name] = nc_file_ds[var_name][:]
 
 
     ## fill dict with non-variable-value-params (e.g. global attributes)
@@ -358,10 +614,158 @@ def read_nc_file(nc_filename,timestamp,device,location):
     nc_dict['m_date'] = f'{m_date[0]}-{m_date[1]}-{m_date[2]}'
 #    nc_dict['m_date'] = datetime.fromtimestamp(nc_file_ds['time'][0]).strftime("%Y-%m-%d")
 
-    nc_file_ds.close()
+    if not lazy:
+        nc_file_ds.close()
     return nc_dict
 
 
+def read_height_truncated(nc_dict, var_name, y_max):
+    """
+    Description
+    -----------
+    Read a (time, height) variable of a nc_dict only up to the last height bin below y_max.
+    For a lazy nc_dict (see read_nc_file(lazy=True)) only this hyperslab is read from the nc-file,
+    the bins above y_max are never decoded.
+
+    Parameters
+    ----------
+    nc_dict: dict
+        dict which stores the nc-file data, including 'height'.
+    var_name: str
+        name of the (time, height) variable.
+    y_max: float
+        the height limit [m], e.g. yLim[1] of the plot.
+
+    Usage
+    -----
+    ATT_BETA = read_height_truncated(nc_dict, 'attenuated_backscatter_532nm', y_max=yLim[1])
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    ## same bins as the max_height list of the plots: [ h for h in height if h < y_max ]
+    n_bins = int(np.sum(np.asarray(nc_dict['height']) < y_max))
+    if isinstance(nc_dict, NcLazyDict):
+        return nc_dict.read_height_bins(var_name, n_bins)
+    return nc_dict[var_name][:, :n_bins]
+
+
+## run-scoped cache of decoded nc-files, keyed by (path, mtime)
+_nc_cache = {}
+## run-scoped open nc-files of the lazy reads, keyed by path: (mtime, Dataset)
+_nc_handles = {}
+_nc_handles_pid = None
+nc_cache_stats = {'hits': 0, 'misses': 0}
+
+def read_nc_file_cached(nc_filename,timestamp,device,location,lazy=True,variables=None,time_start=0):
+    """
+    Description
+    -----------
+    Same as read_nc_file, but every nc-file is read from disk only once per run.
+    The decoded dict is kept in a cache, keyed by path and modification time,
+    so that a file changed on disk is read again.
+    Hits and misses are counted in nc_cache_stats.
+    By default the file is read lazily, i.e. only the arrays used by the plots are decoded.
+
+    Usage
+    -----
+    nc_dict = read_nc_file_cached(nc_filename,timestamp,device,location)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    if not os.path.exists(nc_filename):
+        print('{filename} does not exist.'.format(filename=nc_filename))
+        return
+
+    if variables is not None:
+        variables = tuple(sorted(variables))
+    key = (os.path.abspath(nc_filename), os.path.getmtime(nc_filename), device, location, lazy, variables, time_start)
+    if key in _nc_cache:
+        nc_cache_stats['hits'] += 1
+    else:
+        nc_cache_stats['misses'] += 1
+        with instrumentation.stage('nc_read', file=nc_filename):
+            _nc_cache[key] = read_nc_file(nc_filename,timestamp,device,location,lazy=lazy,variables=variables,time_start=time_start)
+    return _nc_cache[key]
+
+def get_time_increment(nc_dict):
+    """
+    Description
+    -----------
+    Describe the profiles of a nc_dict for the incremental update of its time-height plots,
+    see TimeHeightFigure.plot: the profiles read (from 'time_start' on, see NcLazyDict)
+    and 'first_column', the column of profile time_start in the gap-filled matrix.
+
+    Usage
+    -----
+    template.plot(..., increment=readout.get_time_increment(nc_dict))
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    time = np.ma.getdata(nc_dict['time'])
+    time_grid = get_time_grid(nc_dict)
+    time_start = getattr(nc_dict, 'time_start', 0)
+    if time_start < len(time):
+        first_column = int(time_grid.target[time_start])
+    else:
+        first_column = time_grid.n_profiles
+    return {
+        'nc_file': nc_dict['PollyDataFile'],
+        'time': time,
+        'n_time': len(time),
+        'first_timestamp': float(time[0]),
+        'last_timestamp': float(time[-1]),
+        'time_start': time_start,
+        'first_column': first_column,
+        }
+
+def get_nc_handle(nc_filename):
+    """
+    Description
+    -----------
+    Open netCDF4.Dataset of nc_filename, shared by all NcLazyDicts of the run.
+    The file is opened again if it has been modified, the handles are closed by clear_nc_cache.
+
+    Usage
+    -----
+    ATT_BETA = get_nc_handle(nc_filename)['attenuated_backscatter_532nm'][:]
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    global _nc_handles_pid
+    if _nc_handles_pid != os.getpid():
+        ## a forked worker process must not use the HDF5 handles of its parent
+        _nc_handles.clear()
+        _nc_handles_pid = os.getpid()
+    path = os.path.abspath(nc_filename)
+    mtime = os.path.getmtime(path)
+    handle = _nc_handles.get(path)
+    if handle is None or handle[0] != mtime:
+        if handle is not None:
+            handle[1].close()
+        handle = (mtime, Dataset(path, "r"))
+        _nc_handles[path] = handle
+    return handle[1]
+
+def clear_nc_cache(reset_stats=True):
+    ## drop the decoded nc-files and close the open nc-files of the run
+    _nc_cache.clear()
+    if _nc_handles_pid == os.getpid():
+        for mtime, nc_file_ds in _nc_handles.values():
+            nc_file_ds.close()
+    _nc_handles.clear()
+    if reset_stats:
+        nc_cache_stats['hits'] = 0
+        nc_cache_stats['misses'] = 0
+
+
 ####
 ####
 ####
@@ -511,6 +915,7 @@ def write2donefile(picassoconfigfile_dict,donefilelist_dict):
 
 
 def get_LC_from_sql_db(db_path,table_name,wavelength,method,telescope):
+    import pandas as pd
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
@@ -529,6 +934,7 @@ def get_LC_from_sql_db(db_path,table_name,wavelength,method,telescope):
     return df
 
 def get_depol_from_sql_db(db_path,table_name,wavelength):
+    import pandas as pd
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
@@ -548,6 +954,7 @@ def get_depol_from_sql_db(db_path,table_name,wavelength):
 
 
 def read_from_logbookFile(logbookFile_path):
+    import pandas as pd
 
     if Path(str(logbookFile_path)).exists() == True:
         df = pd.read_csv(logbookFile_path, sep=';', header=0, index_col=None)
@@ -652,6 +1059,7 @@ def get_pollyxt_logbook_files(timestamp,device,raw_folder,output_path):
     return destination_file
 
 def read_pollyxt_logbook_file(laserlogbookfile):
+    import pandas as pd
 
     parameters_ls = ['ENERGY_VALUE_1','TEMPERATURE','ExtPyro','Temp1064','Temp1','Temp2','OutsideRH','OutsideT','roof','rain','shutter']
     parameter_dict = {key: [] for key in parameters_ls}
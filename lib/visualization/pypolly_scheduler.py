@@ -0,0 +1,287 @@
+import multiprocessing
+import pypolly_readout as readout
+import pypolly_instrumentation as instrumentation
+import pypolly_incremental as incremental
+import pypolly_manifest as manifest
+import logging
+logging.basicConfig(level=logging.WARNING)
+
+
+def make_task(product, renderer, nc_files=None, prepare=None, incremental=False, **kwargs):
+    """
+    Description
+    -----------
+    Describe one independent plotting job, i.e. one (product, nc file, wavelength/param) combination.
+
+    Parameters
+    ----------
+    product: str
+        name of the retrieval the task belongs to, e.g. 'attbsc', 'voldepol', 'profiles'.
+    renderer: function
+        module-level plotting function, e.g. display_3d.pollyDisplayAttnBsc.
+    nc_files: dict
+        maps the argument name of the renderer (e.g. 'nc_dict', 'nc_dict_cloudinfo')
+        to the nc-file which has to be read for it. None is passed as an empty dict.
+    prepare: dict
+        maps the argument name of the renderer to a function, which is applied to the
+        nc_dict after reading (e.g. readout.calc_ANGEXP).
+    incremental: bool
+        the renderer draws only TimeHeightFigure plots into saveFolder, which can be
+        updated with the new profiles of the nc-file (config_dict['flagIncremental']).
+    kwargs:
+        all further keyword arguments of the renderer (except donefilelist_dict).
+
+    Usage
+    -----
+    task = make_task('attbsc', display_3d.pollyDisplayAttnBsc, {'nc_dict': nc_file}, config_dict=config_dict, ...)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    task = {}
+    task['product'] = product
+    task['renderer'] = renderer
+    task['nc_files'] = nc_files if nc_files is not None else {}
+    task['prepare'] = prepare if prepare is not None else {}
+    task['incremental'] = incremental
+    task['kwargs'] = kwargs
+    return task
+
+
+def run_task(task, date, device, location):
+    """
+    Description
+    -----------
+    Read the nc-files of a plotting task, run its renderer and return the
+    donefilelist entries produced by it.
+    Errors are logged and do not interrupt other tasks.
+    The stages of the task are recorded with the labels product, nc_file, device and date.
+    In incremental mode only the profiles not yet rendered into the plots are read;
+    if a plot cannot be updated, the task is run again with the complete nc-files.
+
+    Parameters
+    ----------
+    task: dict
+        task created by make_task.
+    date: str
+        the date of measurement: YYYYMMDD.
+    device: str
+        the polly device.
+    location: str
+        the location of the polly device.
+
+    Returns
+    -------
+    donefilelist_dict: dict
+        the donefilelist entries written by the renderer.
+    ok: bool
+        False if an error occurred.
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    donefilelist_dict = {}
+    ok = True
+    main_nc_file = next(iter(task['nc_files'].values()), None)
+    with instrumentation.labels(product=task['product'], nc_file=main_nc_file, device=device, date=date):
+        try:
+            time_start = 0
+            if task['incremental'] and task['kwargs']['config_dict'].get('flagIncremental', False):
+                time_start = incremental.get_time_start(task['kwargs']['saveFolder'], main_nc_file)
+            try:
+                _render_task(task, date, device, location, time_start, donefilelist_dict)
+            except incremental.IncrementalMismatch as e:
+                print(f'{e} cannot be updated, reading the complete nc-file')
+                donefilelist_dict.clear()
+                _render_task(task, date, device, location, 0, donefilelist_dict)
+        except Exception as e:
+            ok = False
+            logging.exception(f"An error occurred in task {task['product']}")
+    return donefilelist_dict, ok
+
+
+def _render_task(task, date, device, location, time_start, donefilelist_dict):
+    ## read the nc-files of the task (the time-dependent variables from profile time_start on) and run its renderer
+    nc_dicts = {}
+    for arg_name, nc_file in task['nc_files'].items():
+        if nc_file is None:
+            nc_dicts[arg_name] = {}
+            continue
+        nc_dict = readout.read_nc_file_cached(nc_file, date, device, location, time_start=time_start)
+        if arg_name in task['prepare']:
+            nc_dict = task['prepare'][arg_name](nc_dict)
+        nc_dicts[arg_name] = nc_dict
+    ## the nc-variables are read lazily in the renderer, i.e. the 'nc_read' stages are nested in 'figure'
+    with instrumentation.stage('figure'):
+        task['renderer'](**nc_dicts, **task['kwargs'], donefilelist_dict=donefilelist_dict)
+
+
+## (date, device) of the nc-files in the cache of this process
+_cached_group = None
+
+
+def _run_task_star(args):
+    ## return the nc-file cache counters and the stage records of this task,
+    ## as every worker process has its own cache and records
+    global _cached_group
+    task, date, device, location = args
+    ## the tasks are ordered by device and date, the nc-files of the previous
+    ## device/date are not needed anymore
+    if _cached_group != (date, device):
+        readout.clear_nc_cache(reset_stats=False)
+        _cached_group = (date, device)
+    hits = readout.nc_cache_stats['hits']
+    misses = readout.nc_cache_stats['misses']
+    ## only the records of this task: a forked worker inherits the records of the
+    ## parent process (e.g. the imports), which are already in the parent
+    first_record = len(instrumentation.records)
+    donefilelist_dict, ok = run_task(*args)
+    stage_records = instrumentation.records[first_record:]
+    del instrumentation.records[first_record:]
+    return donefilelist_dict, ok, readout.nc_cache_stats['hits'] - hits, readout.nc_cache_stats['misses'] - misses, stage_records
+
+
+def run_tasks(tasks, date, device, location, jobs=1, skip_unchanged=False, retries=0):
+    """
+    Description
+    -----------
+    Run all plotting tasks of one device and date, see run_task_groups.
+
+    Returns
+    -------
+    donefilelist_dict: dict
+        merged donefilelist entries of all tasks.
+
+    Usage
+    -----
+    donefilelist_dict = run_tasks(tasks, date, device, location, jobs=8)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    return run_task_groups([(tasks, date, device, location)], jobs=jobs, skip_unchanged=skip_unchanged, retries=retries)[0]
+
+
+def run_task_groups(task_groups, jobs=1, skip_unchanged=False, retries=0):
+    """
+    Description
+    -----------
+    Run the plotting tasks of several devices and dates, either sequentially or
+    on one process pool shared by all of them, and merge the donefilelist
+    entries of the tasks of every group in task order.
+    Every task runs isolated, an error only fails the task itself. The result is
+    stored in the task: 'status' ('ok', 'unchanged' or 'failed') and 'attempts'.
+    nc-files are read via readout.read_nc_file_cached; with a process pool
+    every worker keeps its own cache. The summed hits/misses are printed at the end,
+    the nc-files read in the current process are closed.
+    The stage records of all tasks are collected in instrumentation.records.
+
+    Parameters
+    ----------
+    task_groups: list
+        list of (tasks, date, device, location), tasks is a list of tasks created by make_task.
+    jobs: int
+        number of worker processes. 1 runs all tasks in the current process.
+    skip_unchanged: bool
+        skip the tasks whose inputs (nc-files, configs, plotting code) have not changed
+        since their plots were written, according to the manifest of the output folder
+        (see pypolly_manifest). Their donefilelist entries are taken from the manifest.
+    retries: int
+        number of times a failed task is run again.
+
+    Returns
+    -------
+    donefilelist_dicts: list
+        merged donefilelist entries of every group, in the order of task_groups.
+
+    Usage
+    -----
+    donefilelist_dicts = run_task_groups([(tasks_1, '20240503', 'pollyxt_lacros', 'Leipzig'), ...], jobs=8)
+
+    History
+    -------
+    2026-10-18. First edition.
+    """
+    global _cached_group
+    task_args = [ (task, date, device, location) for tasks, date, device, location in task_groups for task in tasks ]
+
+    ## hash of the inputs of every task and the manifests of the output folders
+    manifests = {}
+    task_hashes = []
+    results = [None] * len(task_args)
+    for n, (task, date, device, location) in enumerate(task_args):
+        folder = manifest.task_folder(task)
+        if folder is None:
+            task_hashes.append(None)
+            continue
+        if folder not in manifests:
+            manifests[folder] = manifest.read_manifest(folder)
+        task_hash = manifest.task_hash(task, date, device, location)
+        task_hashes.append(task_hash)
+        entry = manifests[folder].get(manifest.task_key(task))
+        if skip_unchanged and manifest.is_up_to_date(entry, task_hash):
+            results[n] = (entry['donefilelist'], True, 0, 0, [])
+    todo = [ n for n, result in enumerate(results) if result is None ]
+    if len(todo) < len(task_args):
+        print(f'skipping {len(task_args) - len(todo)} of {len(task_args)} plotting tasks with unchanged inputs')
+
+    for n, (task, date, device, location) in enumerate(task_args):
+        task['status'] = 'unchanged' if results[n] is not None else 'failed'
+        task['attempts'] = 0
+
+    run = todo
+    for attempt in range(retries + 1):
+        if attempt > 0:
+            if len(run) == 0:
+                break
+            print(f'retrying {len(run)} failed plotting tasks')
+        if jobs > 1 and len(run) > 1:
+            print(f'running {len(run)} plotting tasks on {jobs} processes')
+            with multiprocessing.Pool(processes=min(jobs, len(run))) as pool:
+                ## imap keeps the order of the tasks, chunksize=1 for a good load balance
+                for n, result in zip(run, pool.imap(_run_task_star, [ task_args[n] for n in run ], chunksize=1)):
+                    results[n] = result
+        else:
+            for n in run:
+                results[n] = _run_task_star(task_args[n])
+        for n in run:
+            task_args[n][0]['attempts'] += 1
+            task_args[n][0]['status'] = 'ok' if results[n][1] else 'failed'
+        run = [ n for n in run if not results[n][1] ]
+
+    ## remember the inputs and files of the tasks run without errors
+    updated_folders = set()
+    for n in todo:
+        donefilelist_dict, ok = results[n][:2]
+        if ok and task_hashes[n] is not None:
+            task = task_args[n][0]
+            folder = manifest.task_folder(task)
+            manifests[folder][manifest.task_key(task)] = manifest.make_entry(task_hashes[n], donefilelist_dict)
+            updated_folders.add(folder)
+    for folder in updated_folders:
+        manifest.write_manifest(folder, manifests[folder])
+
+    ## merge in task order, so that the donefile is independent of the number of processes
+    donefilelist_dicts = []
+    cache_hits = 0
+    cache_misses = 0
+    first = 0
+    for tasks, date, device, location in task_groups:
+        donefilelist_dict = {}
+        for result, ok, hits, misses, stage_records in results[first:first + len(tasks)]:
+            donefilelist_dict.update(result)
+            cache_hits += hits
+            cache_misses += misses
+            instrumentation.records.extend(stage_records)
+        first += len(tasks)
+        donefilelist_dicts.append(donefilelist_dict)
+    print(f'nc-file cache: {cache_hits} hits, {cache_misses} misses')
+
+    ## close the nc-files read in this process
+    readout.clear_nc_cache(reset_stats=False)
+    _cached_group = None
+
+    return donefilelist_dicts
@@ -1,9 +1,11 @@
-from matplotlib.colors import LinearSegmentedColormap, ListedColormap, \
-                              ColorConverter
+import os
 import numpy as np
 
+## matplotlib is imported in the functions, importing this module does not load it
+
 
 def labivew_colormap():
+    from matplotlib.colors import LinearSegmentedColormap
     Labview_RGB = [(0, 0.262745098039216, 0.862745098039216),
         (0, 0.262745098039216, 0.862745098039216),
         (0, 0.262745098039216, 0.858823529411765),
@@ -585,6 +587,7 @@ def labivew_colormap():
 
 
 def calipso_colormap():
+    from matplotlib.colors import LinearSegmentedColormap
     CALIPSO_RGB = [
         (0, 0.16862745,  0.50196078),
         (0, 0.16862745,  0.66666667),
@@ -622,6 +625,7 @@ def calipso_colormap():
 
 
 def calipso_colormap_gray_inv():
+    from matplotlib.colors import LinearSegmentedColormap
     CALIPSO_RGB = [
         (0, 0.16862745,  0.50196078),
         (0, 0.16862745,  0.66666667),
@@ -666,6 +670,7 @@ def calipso_colormap_gray_inv():
 
 
 def chiljet_colormap():
+    from matplotlib.colors import LinearSegmentedColormap
 
     chiljet_rgb = [
         (0.871093750000000, 0.871093750000000, 0.871093750000000),
@@ -741,6 +746,7 @@ def chiljet_colormap():
 
 
 def target_classification_colormap():
+    from matplotlib.colors import ListedColormap
 
     tc_rgb = [
                 [1, 1, 1],
@@ -761,6 +767,7 @@ def target_classification_colormap():
 
 
 def signal_status_colormap():
+    from matplotlib.colors import ListedColormap
 
     ss_rgb = [[0, 0.5020, 1],
               [1, 0, 0.5020],
@@ -775,6 +782,7 @@ def make_colormap(seq):
     seq: a sequence of floats and RGB-tuples. The floats should be increasing
     and in the interval (0,1).
     """
+    from matplotlib.colors import LinearSegmentedColormap
     seq = [(None,) * 3, 0.0] + list(seq) + [1.0, (None,) * 3]
     cdict = {'red': [], 'green': [], 'blue': []}
     for i, item in enumerate(seq):
@@ -788,6 +796,7 @@ def make_colormap(seq):
 
 
 def eleni_colormap():
+    from matplotlib.colors import ColorConverter
     c = ColorConverter().to_rgb
     cmap = make_colormap([
         c('lightskyblue'), c('dodgerblue'), 0.1,
@@ -804,9 +813,104 @@ def eleni_colormap():
     return cmap
 
 
+## functions building the colormaps of load_colormap, the source of the lookup tables
+_colormap_functions = {
+    'chiljet': chiljet_colormap,
+    'eleni': eleni_colormap,
+    'calipso': calipso_colormap_gray_inv,
+    'labview': labivew_colormap,
+}
+
+## precomputed lookup tables, see write_colormap_luts
+colormap_lut_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'colormap_luts')
+
+_colormap_luts = {}
+_colormaps = {}
+
+
+def colormap_to_lut(cmap):
+    """
+    uint8 RGBA lookup table of a matplotlib colormap, as used by matplotlib
+    with bytes=True: the cmap.N colors followed by the under, over and bad colors.
+
+    Return
+    ------
+    lut: array (cmap.N + 3, 4) of uint8
+    """
+
+    N = cmap.N
+    values = np.ma.array(np.r_[np.arange(N), -1, N, 0],
+                         mask=np.r_[np.zeros(N + 2, dtype=bool), True])
+    return cmap(values, bytes=True)
+
+
+def lut_to_colormap(lut, name):
+    """
+    ListedColormap of a lookup table of colormap_to_lut. The colors are chosen
+    such that the colormap reproduces the lookup table exactly with bytes=True.
+    """
+
+    from matplotlib.colors import ListedColormap
+    colors = np.where(lut == 0, 0, np.where(lut == 255, 1, (lut + 0.5) / 255))
+    cmap = ListedColormap(colors[:-3], name=name)
+    cmap.set_under(colors[-3])
+    cmap.set_over(colors[-2])
+    cmap.set_bad(colors[-1])
+    return cmap
+
+
+def get_colormap_lut(name='chiljet'):
+    """
+    load the uint8 RGBA lookup table of a colormap of load_colormap, from the
+    precomputed .npy file in colormap_lut_folder if available. The tables are
+    loaded once per process.
+
+    Params
+    ------
+    name: str
+        colormap name, see load_colormap.
+    Return
+    ------
+    lut: array (N + 3, 4) of uint8
+        the N colors followed by the under, over and bad colors.
+    """
+
+    if name not in _colormap_luts:
+        if name not in _colormap_functions:
+            raise RuntimeWarning('Unknown colormap: {0}'.format(name))
+        lut_file = os.path.join(colormap_lut_folder, '{0}.npy'.format(name))
+        if os.path.exists(lut_file):
+            _colormap_luts[name] = np.load(lut_file)
+        else:
+            _colormap_luts[name] = colormap_to_lut(_colormap_functions[name]())
+
+    return _colormap_luts[name]
+
+
+def write_colormap_luts(folder=colormap_lut_folder):
+    """
+    (re)write the precomputed lookup tables of all colormaps of load_colormap,
+    needed after changing one of the colormap functions.
+
+    Usage
+    -----
+    python -c "import python_colormap; python_colormap.write_colormap_luts()"
+    """
+
+    os.makedirs(folder, exist_ok=True)
+    for name, colormap_function in _colormap_functions.items():
+        np.save(os.path.join(folder, '{0}.npy'.format(name)),
+                colormap_to_lut(colormap_function()))
+    _colormap_luts.clear()
+    _colormaps.clear()
+
+
 def load_colormap(name='chiljet'):
     """
     load colormap according to input colormap name.
+    The colormap is built once per process from the lookup table of
+    get_colormap_lut; a copy is returned, so that e.g. set_bad does not
+    change the colormap of the next plot.
 
     Params
     ------
@@ -815,23 +919,58 @@ def load_colormap(name='chiljet'):
         - 'chiljet'
         - 'eleni'
         - 'calipso'
+        - 'labview'
     Return
     ------
     cmap: matplotlib colormap
     """
 
-    if name == 'chiljet':
-        cmap = chiljet_colormap()
-    elif name == 'eleni':
-        cmap = eleni_colormap()
-    elif name == 'calipso':
-        cmap = calipso_colormap_gray_inv()
-    elif name == 'labview':
-        cmap = labivew_colormap()
+    if name not in _colormaps:
+        _colormaps[name] = lut_to_colormap(get_colormap_lut(name), name)
+
+    return _colormaps[name].copy()
+
+
+def apply_colormap(values, lut, vmin, vmax):
+    """
+    map values to uint8 RGBA with a lookup table (see get_colormap_lut and
+    colormap_to_lut), like cmap(Normalize(vmin, vmax)(values), bytes=True)
+    but without matplotlib.
+
+    Params
+    ------
+    values: array or masked array
+        masked and nan values get the bad color.
+    lut: array (N + 3, 4) of uint8
+    vmin, vmax: float
+    Return
+    ------
+    rgba: array (values.shape + (4,)) of uint8
+    """
+
+    N = len(lut) - 3
+    data = np.ma.getdata(values)
+    bad = np.ma.getmaskarray(values) | np.isnan(data)
+    # same precision as matplotlib.colors.Normalize
+    if data.dtype.kind == 'f':
+        xa = data.copy()
     else:
-        raise RuntimeWarning('Unknown colormap: {0}'.format(name))
+        xa = data.astype(np.promote_types(data.dtype, np.float32))
+    if vmin == vmax:
+        xa.fill(0)
+    else:
+        xa -= vmin
+        xa /= (vmax - vmin)
+    xa *= N
+    xa[xa == N] = N - 1
 
-    return cmap
+    with np.errstate(invalid='ignore'):
+        index = np.clip(xa, 0, N - 1).astype(np.intp)
+    index[xa < 0] = N
+    index[xa >= N] = N + 1
+    index[bad] = N + 2
+
+    return lut.take(index, axis=0)
 
 
 def Test():